@@ -2,11 +2,34 @@
 Performance Test Results Analyzer
 Reads CSV files and generates comparison reports
 """
+import argparse
 import csv
 import os
 import glob
 from datetime import datetime
 from collections import defaultdict
+from config import SLA_SPECS, SLA_WINDOW, SLA_ERROR_BUDGET, SIZE_BUDGETS, FAULT_CORRELATION_SLACK
+from faults import describe_fault, endpoint_affected, fault_log_path_for, read_fault_log
+from report_cache import BuildCache, watch
+from sla import spec_for, check_window, describe_spec, percentile_label
+
+# Journey entries (locustfile_journeys.py) time several requests end to end;
+# they are listed per endpoint but never summed with the requests themselves
+JOURNEY_TYPE = "JOURNEY"
+
+# Steady-state detection (stats_history.csv)
+STEADY_STATE_TOLERANCE = 0.15   # Max deviation from plateau RPS (15%)
+STEADY_STATE_SAMPLES = 5        # Samples averaged when testing for the plateau
+
+REPORTS_DIR = "reports"
+OUTPUT_FILE = os.path.join(REPORTS_DIR, "COMPARISON.md")
+
+# Modules the report is built with (a change invalidates the build cache)
+SOURCES = [os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+           for name in ("analyze_results.py", "sla.py", "faults.py")]
+
+# Build cache of the current run (None: parse every time)
+_build_cache = None
 
 
 def parse_csv_stats(csv_path):
@@ -28,7 +51,8 @@ def parse_csv_stats(csv_path):
                     'avg_time': float(row['Average Response Time']),
                     'min_time': float(row['Min Response Time']),
                     'max_time': float(row['Max Response Time']),
-                    'rps': float(row['Requests/s'])
+                    'rps': float(row['Requests/s']),
+                    'avg_size': parse_size(row.get('Average Content Size'))
                 })
     except Exception as e:
         print(f"Error parsing {csv_path}: {e}")
@@ -37,6 +61,472 @@ def parse_csv_stats(csv_path):
     return stats
 
 
+def request_stats(stats):
+    """Stats rows of single requests (journey entries excluded), for totals"""
+    return [s for s in stats if s['type'] != JOURNEY_TYPE]
+
+
+def parse_size(value):
+    """Average Content Size as a float, None if the column is missing or empty (unknown)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_stats_history(csv_path):
+    """
+    Parse Locust stats_history CSV into time-ordered rows per endpoint.
+    
+    Per-endpoint rows require --csv-full-history; 'Aggregated' is always present.
+    """
+    history = defaultdict(list)
+    
+    try:
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                try:
+                    rps = float(row['Requests/s'])
+                except ValueError:
+                    rps = 0.0
+                percentiles = {}
+                for column, value in row.items():
+                    if column.endswith('%'):
+                        try:
+                            percentiles[round(float(column[:-1]) / 100, 6)] = float(value)
+                        except ValueError:
+                            pass  # N/A before the first request
+                history[row['Name']].append({
+                    'timestamp': int(row['Timestamp']),
+                    'users': int(row['User Count']),
+                    'rps': rps,
+                    'total_requests': int(row['Total Request Count']),
+                    'total_failures': int(row['Total Failure Count']),
+                    'total_avg_time': float(row['Total Average Response Time']),
+                    'percentiles': percentiles
+                })
+    except Exception as e:
+        print(f"Error parsing {csv_path}: {e}")
+        return {}
+    
+    return history
+
+
+def history_path_for(stats_path):
+    """Matching *_stats_history.csv for a *_stats.csv path"""
+    return stats_path[:-len('_stats.csv')] + '_stats_history.csv'
+
+
+def read_stats(csv_path):
+    """parse_csv_stats, reused from the build cache while the file is unchanged"""
+    if _build_cache is None:
+        return parse_csv_stats(csv_path)
+    return _build_cache.load(csv_path, parse_csv_stats, "stats")
+
+
+def read_history(stats_path):
+    """
+    Parsed stats_history for a run, through the build cache.
+
+    Returns:
+        dict or None: None if the run has no history file
+    """
+    if not stats_path:
+        return None
+    history_path = history_path_for(stats_path)
+    if not os.path.exists(history_path):
+        return None
+    if _build_cache is None:
+        return parse_stats_history(history_path)
+    return _build_cache.load(history_path, parse_stats_history, "history")
+
+
+def steady_state_window(rows):
+    """
+    Find the steady-state (plateau) window of a run.
+    
+    The window starts once all users are spawned and the mean RPS over
+    STEADY_STATE_SAMPLES consecutive samples is within STEADY_STATE_TOLERANCE
+    of the plateau median, and ends at the last sample.
+    
+    Returns:
+        tuple: (start_timestamp, end_timestamp), or None if not enough data
+    """
+    if len(rows) < STEADY_STATE_SAMPLES * 2:
+        return None
+    
+    peak_users = max(r['users'] for r in rows)
+    ramp_end = next(i for i, r in enumerate(rows) if r['users'] >= peak_users)
+    
+    plateau = sorted(r['rps'] for r in rows[ramp_end:])
+    target = plateau[len(plateau) // 2]
+    if target <= 0:
+        return None
+    
+    for i in range(ramp_end, len(rows) - STEADY_STATE_SAMPLES):
+        window_rps = sum(r['rps'] for r in rows[i:i + STEADY_STATE_SAMPLES]) / STEADY_STATE_SAMPLES
+        if abs(window_rps - target) <= STEADY_STATE_TOLERANCE * target:
+            return rows[i]['timestamp'], rows[-1]['timestamp']
+    
+    # Never settled within tolerance: fall back to everything after the ramp
+    return rows[ramp_end]['timestamp'], rows[-1]['timestamp']
+
+
+def steady_state_stats(rows, start, end):
+    """
+    Requests, failures, average time and RPS within [start, end].
+    
+    Derived from the cumulative totals, so the average is exact for the window.
+    """
+    before = [r for r in rows if r['timestamp'] <= start]
+    within = [r for r in rows if r['timestamp'] <= end]
+    if not before or not within:
+        return None
+    
+    first, last = before[-1], within[-1]
+    requests = last['total_requests'] - first['total_requests']
+    duration = last['timestamp'] - first['timestamp']
+    if requests <= 0 or duration <= 0:
+        return None
+    
+    total_time = last['total_avg_time'] * last['total_requests'] - first['total_avg_time'] * first['total_requests']
+    return {
+        'requests': requests,
+        'failures': last['total_failures'] - first['total_failures'],
+        'avg_time': total_time / requests,
+        'rps': requests / duration
+    }
+
+
+def apply_steady_state(all_stats, csv_files):
+    """
+    Replace requests, failures, avg_time and RPS with steady-state values where
+    history exists (min/max time and size stay whole-run).
+    
+    Returns:
+        dict: {users: {'start': s, 'end': s, 'run_length': s}} offsets in seconds
+    """
+    windows = {}
+    
+    for users, path in csv_files.items():
+        history = read_history(path) if users in all_stats else None
+        if history is None:
+            continue
+        
+        aggregated = history.get('Aggregated', [])
+        window = steady_state_window(aggregated)
+        if not window:
+            continue
+        
+        run_start = aggregated[0]['timestamp']
+        windows[users] = {
+            'start': window[0] - run_start,
+            'end': window[1] - run_start,
+            'run_length': aggregated[-1]['timestamp'] - run_start
+        }
+        
+        for stat in all_stats[users]:
+            steady = steady_state_stats(history.get(stat['name'], []), *window)
+            if steady:
+                stat.update(steady)
+                stat['steady_state'] = True
+    
+    return windows
+
+
+def evaluate_sla_windows(rows, spec, start, end):
+    """
+    Evaluate a percentile SLA spec over consecutive windows of [start, end].
+    
+    Requests and failures per window are exact (cumulative totals). Locust's
+    history percentiles cover a trailing ~10s, so a window's percentile is
+    taken as the worst sample in it (conservative). A trailing window cut
+    short by end is returned with complete=False.
+    
+    Returns:
+        list: [{'start', 'requests', 'failures', 'percentiles', 'violations', 'complete'}]
+    """
+    results = []
+    baseline = None
+    current = []
+    window_end = start + spec['window']
+    
+    def close(window_rows, complete):
+        if baseline is None or not window_rows:
+            return
+        last = window_rows[-1]
+        requests = last['total_requests'] - baseline['total_requests']
+        if requests <= 0:
+            return
+        failures = last['total_failures'] - baseline['total_failures']
+        percentiles = {}
+        for fraction in spec['percentiles']:
+            observed = [r['percentiles'][fraction] for r in window_rows if fraction in r['percentiles']]
+            if observed:
+                percentiles[fraction] = max(observed)
+        results.append({
+            'start': window_rows[0]['timestamp'] - start,
+            'requests': requests,
+            'failures': failures,
+            'percentiles': percentiles,
+            'violations': check_window(spec, percentiles, requests, failures),
+            'complete': complete
+        })
+    
+    for row in rows:
+        if row['timestamp'] <= start:
+            baseline = row
+            continue
+        if row['timestamp'] > end:
+            break
+        while row['timestamp'] > window_end:
+            close(current, True)
+            if current:
+                baseline = current[-1]
+            current = []
+            window_end += spec['window']
+        current.append(row)
+    close(current, window_end <= end)
+    
+    return results
+
+
+def evaluate_sla_specs(all_stats, csv_files, windows):
+    """
+    Offline percentile SLA evaluation from stats_history (steady-state window only).
+    
+    Returns:
+        dict: {endpoint: {users: {'spec', 'windows', 'failed', 'worst', 'failed_windows'}}}
+    """
+    results = defaultdict(dict)
+    
+    for users, path in csv_files.items():
+        history = read_history(path) if users in all_stats else None
+        if history is None:
+            continue
+        
+        aggregated = history.get('Aggregated', [])
+        if not aggregated:
+            continue
+        run_start = aggregated[0]['timestamp']
+        window = windows.get(users, {'start': 0, 'end': aggregated[-1]['timestamp'] - run_start})
+        
+        for stat in all_stats[users]:
+            spec = spec_for(stat['type'], stat['name'])
+            if spec is None or stat['name'] not in history:
+                continue
+            evaluated = evaluate_sla_windows(
+                history[stat['name']], spec, run_start + window['start'], run_start + window['end']
+            )
+            # Only full windows are judged; a partial one has too few samples to pass or fail
+            evaluated = [w for w in evaluated if w['complete']]
+            if not evaluated:
+                continue
+            worst = {f: max(w['percentiles'].get(f, 0) for w in evaluated) for f in spec['percentiles']}
+            worst['errors'] = max(w['failures'] / w['requests'] for w in evaluated)
+            window_start = run_start + window['start']
+            results[stat['name']][users] = {
+                'spec': spec,
+                'windows': len(evaluated),
+                'failed': sum(1 for w in evaluated if w['violations']),
+                'worst': worst,
+                # Epoch [start, end) of each failed window, for fault correlation
+                'failed_windows': [
+                    (window_start + w['start'], window_start + w['start'] + spec['window'], w['violations'])
+                    for w in evaluated if w['violations']
+                ]
+            }
+    
+    return results
+
+
+def generate_sla_section(sla_results):
+    """Markdown pass/fail table for the percentile SLA specs"""
+    if not sla_results:
+        return ""
+    
+    section = []
+    section.append("# Percentile SLAs\n\n")
+    section.append("Specs from config.SLA_SPECS, checked in every window of the steady state. "
+                   "Worst values are the maximum across windows.\n\n")
+    section.append("| Endpoint | Load | SLA | Windows Passed | Worst Percentiles | Worst Error Rate | Status |\n")
+    section.append("|----------|------|-----|----------------|-------------------|------------------|--------|\n")
+    
+    for endpoint in sorted(sla_results):
+        for users in ['10', '50', '100']:
+            r = sla_results[endpoint].get(users)
+            if not r:
+                continue
+            worst = ", ".join(
+                f"{percentile_label(f)} {r['worst'][f]:.0f}ms" for f in sorted(r['spec']['percentiles'])
+            )
+            status = "✅ PASS" if r['failed'] == 0 else "🔴 FAIL"
+            section.append(
+                f"| {endpoint} | {users} users | {describe_spec(r['spec'])} | "
+                f"{r['windows'] - r['failed']}/{r['windows']} | {worst} | {r['worst']['errors']:.2%} | {status} |\n"
+            )
+    
+    section.append("\n---\n\n")
+    return ''.join(section)
+
+
+def correlate_faults(sla_results, csv_files):
+    """
+    Attribute failed SLA windows to the faults injected by fault_proxy.py.
+    
+    A failed window is attributed to every fault on a matching route that was
+    active during it (plus FAULT_CORRELATION_SLACK, since history percentiles
+    trail); the rest are unexplained by the injected faults.
+    
+    Returns:
+        dict: {users: {'log', 'faults': [{'fault', 'violations'}], 'unexplained'}}
+              for runs that have a fault log
+    """
+    correlated = {}
+    
+    for users, path in csv_files.items():
+        log = read_fault_log(fault_log_path_for(path)) if path else None
+        if not log:
+            continue
+        
+        faults = [{'fault': fault, 'violations': []} for fault in log['faults']]
+        unexplained = []
+        for endpoint in sorted(sla_results):
+            run = sla_results[endpoint].get(users, {})
+            for start, end, violations in run.get('failed_windows', []):
+                matched = [
+                    entry for entry in faults
+                    if entry['fault']['start'] < end
+                    and start < entry['fault']['end'] + FAULT_CORRELATION_SLACK
+                    and endpoint_affected(entry['fault'], endpoint)
+                ]
+                for entry in matched:
+                    entry['violations'].append((endpoint, violations))
+                if not matched:
+                    unexplained.append((endpoint, start - log['started'], violations))
+        
+        correlated[users] = {'log': log, 'faults': faults, 'unexplained': unexplained}
+    
+    return correlated
+
+
+def generate_fault_section(correlated):
+    """Markdown table of injected faults and the SLA windows that failed during them"""
+    if not correlated:
+        return ""
+    
+    section = []
+    section.append("# Fault Injection\n\n")
+    section.append("Runs behind fault_proxy.py. A failed percentile SLA window is attributed to a fault "
+                   f"when it overlaps the fault (+{FAULT_CORRELATION_SLACK}s) on a matching route.\n\n")
+    section.append("| Load | Schedule | Fault | Active | Injected | SLA Windows Failed During Fault |\n")
+    section.append("|------|----------|-------|--------|----------|---------------------------------|\n")
+    
+    for users in ['10', '50', '100']:
+        run = correlated.get(users)
+        if not run:
+            continue
+        log = run['log']
+        for entry in run['faults']:
+            fault = entry['fault']
+            if entry['violations']:
+                impact = "; ".join(f"{endpoint} ({', '.join(v)})" for endpoint, v in entry['violations'])
+            else:
+                impact = "none ✅"
+            section.append(
+                f"| {users} users | {log['schedule'] or '-'} | {describe_fault(fault)} | "
+                f"{fault['start'] - log['started']:.0f}s - {fault['end'] - log['started']:.0f}s | "
+                f"{fault['injected']:,}/{log['requests']:,} req | {impact} |\n"
+            )
+    
+    unexplained = [(users, *window) for users, run in correlated.items() for window in run['unexplained']]
+    if unexplained:
+        section.append("\n**SLA windows failed outside any fault:**\n\n")
+        for users, endpoint, offset, violations in unexplained:
+            section.append(f"- {users} users, {endpoint} at {offset:.0f}s: {', '.join(violations)}\n")
+    
+    section.append("\n---\n\n")
+    return ''.join(section)
+
+
+def generate_steady_state_section(windows):
+    """Markdown table of the steady-state window used per load level"""
+    if not windows:
+        return ""
+    
+    section = []
+    section.append("# Steady-State Windows\n\n")
+    section.append("Requests, Failures, Avg Time and RPS below are computed over the plateau only "
+                   "(spawn ramp and warm-up excluded); Min, Max and Avg Size cover the whole run.\n\n")
+    section.append("| Load | Window | Steady Duration | Excluded Warm-up |\n")
+    section.append("|------|--------|-----------------|------------------|\n")
+    
+    for users, w in windows.items():
+        section.append(
+            f"| {users} users | {w['start']}s - {w['end']}s | "
+            f"{w['end'] - w['start']}s | {w['start']}s of {w['run_length']}s |\n"
+        )
+    
+    section.append("\n---\n\n")
+    return ''.join(section)
+
+
+def format_bytes(value):
+    """Human-readable byte count (B, KB, MB), 'n/a' if unknown"""
+    if value is None:
+        return "n/a"
+    for unit in ('B', 'KB'):
+        if abs(value) < 1024:
+            return f"{value:,.0f}{unit}" if unit == 'B' else f"{value:,.1f}{unit}"
+        value /= 1024
+    return f"{value:,.1f}MB"
+
+
+def format_rate(value):
+    """Human-readable bytes/s, 'n/a' if unknown"""
+    return "n/a" if value is None else f"{format_bytes(value)}/s"
+
+
+def payload_throughput(stats):
+    """Bytes/s over the given stats, None if any of their sizes is unknown"""
+    if any(s['avg_size'] is None for s in stats):
+        return None
+    return sum(s['avg_size'] * s['rps'] for s in stats)
+
+
+def generate_payload_section(all_stats):
+    """Markdown table of average payload size versus config.SIZE_BUDGETS"""
+    rows = []
+    for users in ['10', '50', '100']:
+        for stat in all_stats.get(users) or []:
+            budget = SIZE_BUDGETS.get(stat['type'], {}).get(stat['name'].split(' ', 1)[-1])
+            if budget is not None:
+                rows.append((stat['name'], users, stat, budget))
+    
+    if not rows:
+        return ""
+    
+    section = []
+    section.append("# Payload Budgets\n\n")
+    section.append("Average decoded response size against the per-endpoint budget in config.SIZE_BUDGETS.\n\n")
+    section.append("| Endpoint | Load | Avg Size | Budget | Throughput | Status |\n")
+    section.append("|----------|------|----------|--------|------------|--------|\n")
+    
+    for name, users, stat, budget in sorted(rows, key=lambda r: (r[0], int(r[1]))):
+        if stat['avg_size'] is None:
+            status = "❔ Size unknown"
+        else:
+            status = "✅" if stat['avg_size'] <= budget else "🔴 Over budget"
+        section.append(
+            f"| {name} | {users} users | {format_bytes(stat['avg_size'])} | {format_bytes(budget)} | "
+            f"{format_rate(payload_throughput([stat]))} | {status} |\n"
+        )
+    
+    section.append("\n---\n\n")
+    return ''.join(section)
+
+
 def find_latest_results():
     """Find the most recent test results"""
     reports_dir = "reports"
@@ -87,8 +577,8 @@ def generate_comparison_report(endpoints):
         data = endpoints[endpoint]
         
         report.append(f"## {endpoint}\n\n")
-        report.append("| Load | Requests | Failures | Avg Time | Min | Max | RPS |\n")
-        report.append("|------|----------|----------|----------|-----|-----|-----|\n")
+        report.append("| Load | Requests | Failures | Avg Time | Min | Max | RPS | Avg Size | Throughput |\n")
+        report.append("|------|----------|----------|----------|-----|-----|-----|----------|------------|\n")
         
         for users in ['10', '50', '100']:
             if data[users]:
@@ -96,10 +586,11 @@ def generate_comparison_report(endpoints):
                 report.append(
                     f"| {users} users | {d['requests']:,} | {d['failures']} | "
                     f"{d['avg_time']:.0f}ms | {d['min_time']:.0f}ms | "
-                    f"{d['max_time']:.0f}ms | {d['rps']:.2f} |\n"
+                    f"{d['max_time']:.0f}ms | {d['rps']:.2f} | "
+                    f"{format_bytes(d['avg_size'])} | {format_rate(payload_throughput([d]))} |\n"
                 )
             else:
-                report.append(f"| {users} users | - | - | - | - | - | - |\n")
+                report.append(f"| {users} users | - | - | - | - | - | - | - | - |\n")
         
         # Calculate degradation
         if data['10'] and data['100']:
@@ -129,36 +620,75 @@ def generate_summary_table(all_stats):
     summary = []
     summary.append("# Performance Summary by Load Level\n\n")
     
-    summary.append("| Load | Total Requests | Total Failures | Avg RPS | Avg Response Time |\n")
-    summary.append("|------|----------------|----------------|---------|-------------------|\n")
+    summary.append("| Load | Total Requests | Total Failures | Avg RPS | Avg Response Time | Throughput |\n")
+    summary.append("|------|----------------|----------------|---------|-------------------|------------|\n")
     
     for users in ['10', '50', '100']:
         if users in all_stats and all_stats[users]:
-            stats = all_stats[users]
+            stats = request_stats(all_stats[users])
             total_requests = sum(s['requests'] for s in stats)
             total_failures = sum(s['failures'] for s in stats)
             avg_rps = sum(s['rps'] for s in stats)
             avg_time = sum(s['avg_time'] * s['requests'] for s in stats) / total_requests if total_requests > 0 else 0
+            throughput = payload_throughput(stats)
             
             summary.append(
                 f"| {users} users | {total_requests:,} | {total_failures} | "
-                f"{avg_rps:.2f} | {avg_time:.0f}ms |\n"
+                f"{avg_rps:.2f} | {avg_time:.0f}ms | {format_rate(throughput)} |\n"
             )
     
     summary.append("\n---\n\n")
     return ''.join(summary)
 
 
-def main():
-    """Main analysis function"""
+def build_report(cache, verbose=True):
+    """
+    Build reports/COMPARISON.md incrementally.
+    
+    Parsed CSVs and report sections are reused from the build cache while
+    their inputs are unchanged; nothing is written if the report is current.
+    With verbose False (watch mode) "no results"/"up to date" are not printed.
+    
+    Returns:
+        bool: True if the report was (re)written
+    """
+    global _build_cache
+    _build_cache = cache
+    
+    csv_files = find_latest_results()
+    runs = {users: path for users, path in csv_files.items() if path}
+    if not runs:
+        if verbose:
+            print("❌ No results found to analyze!")
+        return False
+    
+    # Stats + history digests of every run, plus the settings the numbers depend on
+    inputs = []
+    fault_logs = []
+    for users, path in sorted(runs.items()):
+        history_path = history_path_for(path)
+        history = cache.digest(history_path) if os.path.exists(history_path) else None
+        inputs.append(f"{users}:{cache.digest(path)}:{history}")
+        fault_log = fault_log_path_for(path)
+        if os.path.exists(fault_log):
+            fault_logs.append(f"{users}:{cache.digest(fault_log)}")
+    inputs_key = cache.key(*inputs, STEADY_STATE_TOLERANCE, STEADY_STATE_SAMPLES)
+    sla_key = cache.key(inputs_key, repr(SLA_SPECS), SLA_WINDOW, SLA_ERROR_BUDGET)
+    faults_key = cache.key(sla_key, *fault_logs, FAULT_CORRELATION_SLACK)
+    payloads_key = cache.key(inputs_key, repr(SIZE_BUDGETS))
+    report_key = cache.key(faults_key, payloads_key)
+    
+    if cache.is_current(OUTPUT_FILE, report_key):
+        cache.save(prune=False)
+        if verbose:
+            print(f"✅ {OUTPUT_FILE} is up to date")
+        return False
+    
     print("=" * 60)
     print("PERFORMANCE TEST RESULTS ANALYZER")
     print("=" * 60)
     print()
     
-    # Find latest results
-    csv_files = find_latest_results()
-    
     print("Found test results:")
     for users, path in csv_files.items():
         if path:
@@ -167,31 +697,49 @@ def main():
             print(f"  ❌ {users} users: Not found")
     print()
     
-    # Parse all stats
-    all_stats = {}
-    for users, path in csv_files.items():
-        if path:
-            all_stats[users] = parse_csv_stats(path)
-    
-    if not all_stats:
-        print("❌ No results found to analyze!")
-        return
+    def prepare():
+        stats = {users: read_stats(path) for users, path in runs.items()}
+        # Use plateau numbers (ramp-up excluded) where stats_history is available
+        return stats, apply_steady_state(stats, csv_files)
     
-    # Analyze endpoint performance
-    endpoints = analyze_endpoint_performance(all_stats)
+    all_stats, windows = cache.section("steady_state_stats", inputs_key, prepare)
+    for users, w in windows.items():
+        print(f"  ⏱️ {users} users: steady state {w['start']}s - {w['end']}s")
     
-    # Generate reports
+    # Generate reports (sections whose inputs are unchanged come from the cache)
     print("Generating comparison report...")
-    comparison = generate_comparison_report(endpoints)
-    summary = generate_summary_table(all_stats)
+    summary = cache.section("summary", inputs_key, lambda: generate_summary_table(all_stats))
+    steady_state = cache.section("steady_state", inputs_key, lambda: generate_steady_state_section(windows))
+    evaluated = []
+    
+    def sla_results():
+        if not evaluated:
+            evaluated.append(evaluate_sla_specs(all_stats, csv_files, windows))
+        return evaluated[0]
+    
+    sla_section = cache.section("sla", sla_key, lambda: generate_sla_section(sla_results()))
+    fault_section = cache.section(
+        "faults", faults_key, lambda: generate_fault_section(correlate_faults(sla_results(), csv_files))
+    )
+    payloads = cache.section(
+        "payloads", payloads_key, lambda: generate_payload_section(all_stats)
+    )
+    comparison = cache.section(
+        "comparison", inputs_key, lambda: generate_comparison_report(analyze_endpoint_performance(all_stats))
+    )
     
     # Write to file
-    output_file = "reports/COMPARISON.md"
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         f.write(summary)
+        f.write(steady_state)
+        f.write(sla_section)
+        f.write(fault_section)
+        f.write(payloads)
         f.write(comparison)
+    cache.record(OUTPUT_FILE, report_key)
+    cache.save()
     
-    print(f"✅ Report generated: {output_file}")
+    print(f"✅ Report generated: {OUTPUT_FILE} ({cache.hits} cached, {cache.misses} rebuilt)")
     print()
     print("=" * 60)
     print("Key Findings:")
@@ -200,15 +748,37 @@ def main():
     # Print quick summary
     for users in ['10', '50', '100']:
         if users in all_stats and all_stats[users]:
-            stats = all_stats[users]
+            stats = request_stats(all_stats[users])
             total_requests = sum(s['requests'] for s in stats)
             total_failures = sum(s['failures'] for s in stats)
             failure_rate = (total_failures / total_requests * 100) if total_requests > 0 else 0
             
-            print(f"{users} users: {total_requests:,} requests, {total_failures} failures ({failure_rate:.2f}%)")
+            scope = " (steady state)" if users in windows else ""
+            print(f"{users} users{scope}: {total_requests:,} requests, {total_failures} failures ({failure_rate:.2f}%)")
     
     print("=" * 60)
+    return True
+
+
+def main():
+    """Main analysis function"""
+    parser = argparse.ArgumentParser(description="Compare load levels into reports/COMPARISON.md")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and update the report as new results are written")
+    parser.add_argument("--interval", type=float, default=2.0, help="Watch polling interval in seconds")
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild everything (build cache not read or written)")
+    args = parser.parse_args()
+    
+    def build():
+        # Fresh cache per build so entries only earlier builds used get pruned
+        cache = BuildCache("analyze_results", REPORTS_DIR, enabled=not args.no_cache, sources=SOURCES)
+        return build_report(cache, verbose=not args.watch)
+    
+    if args.watch:
+        watch(build, args.interval)
+    else:
+        build()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,254 @@
+"""
+Load Generator Hot-Path Micro-Benchmarks
+Times on_request, validate_response and the task bodies with synthetic
+responses (JSONPlaceholder-sized payloads), no network involved
+
+Usage:
+    python benchmarks/bench_hot_path.py
+    python benchmarks/bench_hot_path.py --save reports/hot_path_baseline.json
+    python benchmarks/bench_hot_path.py --compare reports/hot_path_baseline.json
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from functools import partial
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+import locustfile  # noqa: E402
+from stub_server import StubAPI  # noqa: E402
+
+API = StubAPI()
+
+
+class FakeResponse:
+    """Minimal stand-in for Locust's catch_response response"""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+        self.failed = None
+
+    def json(self):
+        return json.loads(self.content)
+
+    def success(self):
+        self.failed = None
+
+    def failure(self, message):
+        self.failed = message
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeClient:
+    """Serves requests from the stub route table instead of the network"""
+
+    def request(self, method, url, **kwargs):
+        body = json.dumps(kwargs["json"]).encode() if "json" in kwargs else b""
+        status, content = API.handle(method, url, body)
+        return FakeResponse(status, content)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+
+def make_user():
+    """JSONPlaceholderUser instance wired to the fake client (no Locust environment)"""
+    user = object.__new__(locustfile.JSONPlaceholderUser)
+    user.client = FakeClient()
+    return user
+
+
+def payload_response(target):
+    status, content = API.handle("GET", target)
+    return FakeResponse(status, content)
+
+
+def fresh(response):
+    """New response with the same body each call (parsed JSON is cached per response)"""
+    return FakeResponse(response.status_code, response.content)
+
+
+def build_benchmarks():
+    """name -> zero-argument callable performing one operation"""
+    user = make_user()
+    posts = payload_response("/posts")
+    comments = payload_response("/comments")
+    users = payload_response("/users")
+    single_user = payload_response("/users/1")
+    timed = payload_response("/posts")
+    timed.connection_setup_time = 0.0
+    timed.new_connections = 0
+    timed.phase_timings = {"dns": 0.0, "connect": 0.0, "tls": 0.0, "ttfb": 95.0, "download": 25.0}
+
+    benchmarks = {
+        "on_request (within SLA)": lambda: locustfile.on_request("GET", "GET /posts", 120.0, 27000, None),
+        # "/posts" (500 ms) is the first threshold matching "/posts/1", so stay above it
+        "on_request (SLA violation)": lambda: locustfile.on_request("GET", "GET /posts/1", 650.0, 250, None),
+        "on_request (unknown endpoint)": lambda: locustfile.on_request("DELETE", "DELETE /x", 50.0, 0, None),
+        "on_request (phase timings)": lambda: locustfile.on_request(
+            "GET", "GET /posts", 120.0, 27000, None, response=timed),
+        "validate_response /posts (100 items)": lambda: user.validate_response(
+            fresh(posts), "/posts", "GET", required_keys=["id", "title"]),
+        "validate_response /comments (500 items)": lambda: user.validate_response(
+            fresh(comments), "/comments", "GET", required_keys=["id", "postId", "name", "email", "body"]),
+        "validate_response /users (10 items)": lambda: user.validate_response(
+            fresh(users), "/users", "GET", required_keys=["id", "email"]),
+        "validate_response /users/1 (object)": lambda: user.validate_response(
+            fresh(single_user), "/users/1", "GET", required_keys=["id", "name", "email", "address", "company"]),
+    }
+
+    # tasks is expanded by weight; dict.fromkeys dedupes while keeping order
+    for task in dict.fromkeys(locustfile.JSONPlaceholderUser.tasks):
+        benchmarks[f"task {task.__name__}"] = partial(task, user)
+
+    return benchmarks
+
+
+def reset_metrics():
+    locustfile.custom_metrics["sla_violations"] = 0
+    locustfile.custom_metrics["slow_requests"].clear()
+    locustfile.custom_metrics["connections"].clear()
+    locustfile.custom_metrics["phases"].clear()
+    locustfile.custom_metrics["payloads"].clear()
+    locustfile.custom_metrics["sla_windows"].clear()
+
+
+def time_operation(func, min_time, repeats):
+    """Best-of-N ops/sec, with iteration count calibrated to min_time"""
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        iterations *= 2
+
+    best = elapsed
+    for _ in range(repeats - 1):
+        reset_metrics()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+
+    return iterations / best
+
+
+def measure_allocations(func, iterations=200):
+    """Peak bytes allocated and blocks retained per operation"""
+    reset_metrics()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+
+    for _ in range(iterations):
+        func()
+
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "peak_bytes_per_op": (peak - start_bytes) / iterations,
+        "retained_blocks_per_op": retained_blocks / iterations,
+    }
+
+
+def run_benchmarks(min_time, repeats, pattern=None):
+    results = {}
+    for name, func in build_benchmarks().items():
+        if pattern and pattern not in name:
+            continue
+        reset_metrics()
+        ops = time_operation(func, min_time, repeats)
+        results[name] = {"ops_per_sec": ops, **measure_allocations(func)}
+        print(f"  {name:<45} {ops:>12,.0f} ops/s")
+    reset_metrics()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print per-benchmark change versus a baseline; return the regressions"""
+    regressions = []
+    print()
+    print(f"{'Benchmark':<45} {'Baseline':>12} {'Current':>12} {'Change':>9}")
+    print("-" * 81)
+    for name, current in results.items():
+        old = baseline["results"].get(name)
+        if not old:
+            print(f"{name:<45} {'-':>12} {current['ops_per_sec']:>12,.0f} {'new':>9}")
+            continue
+        change = (current["ops_per_sec"] - old["ops_per_sec"]) / old["ops_per_sec"] * 100
+        flag = ""
+        if change < -threshold:
+            flag = " 🔴"
+            regressions.append(name)
+        print(f"{name:<45} {old['ops_per_sec']:>12,.0f} {current['ops_per_sec']:>12,.0f} {change:>+8.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot-path micro-benchmarks for the locustfile")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timing run")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--with-logging", action="store_true", help="Keep SLA/slow-request logging enabled")
+    parser.add_argument("--save", help="Write results to this JSON file (e.g. a baseline)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold in percent")
+    args = parser.parse_args()
+
+    if not args.with_logging:
+        logging.disable(logging.CRITICAL)
+
+    print("=" * 60)
+    print("HOT-PATH MICRO-BENCHMARKS")
+    print("=" * 60)
+
+    results = run_benchmarks(args.min_time, args.repeats, args.filter)
+    report = {
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Results saved: {args.save}")
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n🔴 {len(regressions)} benchmark(s) slower than baseline by more than {args.threshold:.0f}%")
+
+    print("=" * 60)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
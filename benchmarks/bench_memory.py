@@ -0,0 +1,350 @@
+"""
+Load Generator Memory Footprint Benchmark
+Measures RSS and tracemalloc snapshots per simulated user and over a soak run
+
+Usage:
+    python benchmarks/bench_memory.py                          # 100 / 1k / 5k users
+    python benchmarks/bench_memory.py --levels 100 500         # Custom levels
+    python benchmarks/bench_memory.py --soak 600 --users 100   # 10 minute soak
+    python benchmarks/bench_memory.py --compare reports/memory_benchmark_<old>.json
+    python benchmarks/bench_memory.py --levels 100 --output /tmp/memory   # Report outside reports/
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+RESULT_MARKER = "BENCH_RESULT "
+
+# Allocation site (innermost frame filename) -> component
+COMPONENTS = [
+    ("logging", ("/logging/",)),
+    ("metrics stores", ("/locust/stats.py", "locustfile.py")),
+    ("sessions", ("/requests/", "/urllib3/", "/http/client.py", "connection_policy.py",
+                  "/socket.py", "/ssl.py", "/httpx/", "/httpcore/", "/email/")),
+    ("user objects", ("/locust/user/", "/locust/runners.py", "/gevent/", "greenlet", "/random.py")),
+]
+
+
+def read_rss():
+    """Current resident set size in bytes"""
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        # ru_maxrss is peak RSS (KB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def deep_size(obj, seen=None):
+    """Approximate deep size of nested dicts/lists in bytes"""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_size(item, seen) for item in obj)
+    return size
+
+
+def component_breakdown(before, after):
+    """Group allocation growth between two snapshots by component"""
+    totals = {name: 0 for name, _ in COMPONENTS}
+    totals["other"] = 0
+
+    for stat in after.compare_to(before, "filename"):
+        filename = stat.traceback[0].filename.replace("\\", "/")
+        for name, patterns in COMPONENTS:
+            if any(pattern in filename for pattern in patterns):
+                totals[name] += stat.size_diff
+                break
+        else:
+            totals["other"] += stat.size_diff
+
+    return totals
+
+
+def start_stub(port):
+    """Launch the local stub server in a separate process (not measured)"""
+    stub = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT_DIR, "stub_server.py"), "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    time.sleep(1)
+    if stub.poll() is not None:
+        raise RuntimeError(f"Stub server exited (exit code {stub.returncode}):\n{stub.stderr.read()}")
+    return stub
+
+
+def start_runner(host):
+    """Create a local Locust runner for JSONPlaceholderUser"""
+    import locust
+    from locust.env import Environment
+    import locustfile
+
+    env = Environment(user_classes=[locustfile.JSONPlaceholderUser], host=host, events=locust.events)
+    return env, env.create_local_runner(), locustfile
+
+
+def measure_level(user_count, host, settle, traced=False):
+    """
+    Spawn user_count users, let them run, and measure memory (runs in a child process).
+
+    RSS is measured with tracing off: tracemalloc keeps a record per live
+    allocation, which would otherwise be counted as memory per user. With
+    traced=True the run takes the tracemalloc breakdown by component instead.
+    """
+    import gevent
+    import locustfile  # Import (and monkey-patch) before the baseline snapshot
+
+    if traced:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+    rss_before = read_rss()
+
+    env, runner, _ = start_runner(host)
+    runner.start(user_count, spawn_rate=max(user_count / 5, 1))
+    while runner.user_count < user_count:
+        gevent.sleep(0.5)
+    gevent.sleep(settle)
+
+    result = {
+        "users": user_count,
+        "custom_metrics_bytes": deep_size(locustfile.custom_metrics),
+        "requests": env.stats.total.num_requests,
+    }
+    if traced:
+        after = tracemalloc.take_snapshot()
+        traced_bytes, peak = tracemalloc.get_traced_memory()
+        components = component_breakdown(before, after)
+        result.update({
+            "traced_bytes": traced_bytes,
+            "traced_peak_bytes": peak,
+            "components": components,
+            "per_user": {name: size / user_count for name, size in components.items()},
+        })
+    else:
+        rss_after = read_rss()
+        result.update({
+            "rss_bytes": rss_after,
+            "rss_growth_bytes": rss_after - rss_before,
+            "rss_per_user": (rss_after - rss_before) / user_count,
+        })
+
+    runner.quit()
+    return result
+
+
+def growth_per_minute(samples, keys):
+    """Average growth per minute of each sampled key between the first and last sample"""
+    minutes = (samples[-1]["elapsed"] - samples[0]["elapsed"]) / 60 if len(samples) > 1 else 0
+    return {key: (samples[-1][key] - samples[0][key]) / minutes if minutes else 0 for key in keys}
+
+
+def run_soak(user_count, host, duration, interval, traced=False):
+    """
+    Run a fixed user count for duration seconds, sampling memory every interval.
+
+    Tracing is off unless traced=True (RSS then includes tracemalloc's own growth).
+    """
+    import gevent
+
+    if traced:
+        tracemalloc.start()
+    env, runner, locustfile = start_runner(host)
+    runner.start(user_count, spawn_rate=max(user_count / 5, 1))
+
+    samples = []
+    start = time.time()
+    while time.time() - start < duration:
+        gevent.sleep(interval)
+        sample = {
+            "elapsed": round(time.time() - start, 1),
+            "rss_bytes": read_rss(),
+            "custom_metrics_bytes": deep_size(locustfile.custom_metrics),
+            "slow_requests": len(locustfile.custom_metrics["slow_requests"]),
+            "requests": env.stats.total.num_requests,
+        }
+        if traced:
+            sample["traced_bytes"] = tracemalloc.get_traced_memory()[0]
+        samples.append(sample)
+
+    runner.quit()
+
+    keys = ["rss_bytes", "custom_metrics_bytes"] + (["traced_bytes"] if traced else [])
+    return {
+        "users": user_count,
+        "duration": duration,
+        "traced": traced,
+        "samples": samples,
+        "growth_per_minute": growth_per_minute(samples, keys),
+    }
+
+
+def run_child(args, traced=False):
+    """Run one measurement in a fresh interpreter so levels (and traced/untraced runs) don't share state"""
+    cmd = [sys.executable, os.path.abspath(__file__), "--host", args.host, "--settle", str(args.settle)]
+    if args.soak:
+        cmd += ["--child-soak", str(args.users), "--soak", str(args.soak), "--interval", str(args.interval)]
+    else:
+        cmd += ["--child-level", str(args.child_level)]
+    if traced:
+        cmd.append("--child-traced")
+
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        print(proc.stderr, file=sys.stderr)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    raise RuntimeError(f"Benchmark child failed (exit code {proc.returncode})")
+
+
+def mb(value):
+    return f"{value / (1024 * 1024):.1f} MB"
+
+
+def kb(value):
+    return f"{value / 1024:.1f} KB"
+
+
+def generate_report(report, baseline=None):
+    """Markdown summary, with deltas against a previous report if given"""
+    lines = ["# Load Generator Memory Benchmark\n\n"]
+    lines.append(f"**Generated:** {report['generated']}\n\n")
+
+    if report["levels"]:
+        names = [name for name, _ in COMPONENTS] + ["other"]
+        lines.append("## Memory per Simulated User\n\n")
+        lines.append("RSS from a run with tracing off; per-component sizes from a separate traced run.\n\n")
+        lines.append("| Users | RSS | RSS/user | " + " | ".join(f"{n}/user" for n in names) + " | custom_metrics |\n")
+        lines.append("|" + "------|" * (len(names) + 4) + "\n")
+        for level in report["levels"]:
+            lines.append(
+                f"| {level['users']:,} | {mb(level['rss_bytes'])} | {kb(level['rss_per_user'])} | "
+                + " | ".join(kb(level["per_user"][n]) for n in names)
+                + f" | {kb(level['custom_metrics_bytes'])} |\n"
+            )
+        lines.append("\n")
+
+    if report.get("soak"):
+        soak = report["soak"]
+        growth = soak["growth_per_minute"]
+        lines.append(f"## Soak ({soak['users']} users, {soak['duration']}s)\n\n")
+        lines.append("| Metric | Growth per minute |\n|--------|-------------------|\n")
+        lines.append(f"| RSS | {kb(growth['rss_bytes'])} |\n")
+        if "traced_bytes" in growth:
+            lines.append(f"| Traced allocations | {kb(growth['traced_bytes'])} |\n")
+        lines.append(f"| custom_metrics | {kb(growth['custom_metrics_bytes'])} |\n\n")
+        if soak.get("traced"):
+            lines.append("RSS growth includes tracemalloc's own bookkeeping (--soak-traced).\n\n")
+
+    if baseline:
+        previous = {level["users"]: level for level in baseline.get("levels", [])}
+        lines.append(f"## Comparison with {baseline['generated']}\n\n")
+        lines.append("| Users | RSS/user (before) | RSS/user (now) | Change |\n")
+        lines.append("|-------|-------------------|----------------|--------|\n")
+        for level in report["levels"]:
+            old = previous.get(level["users"])
+            if not old or not old["rss_per_user"]:
+                continue
+            change = (level["rss_per_user"] - old["rss_per_user"]) / old["rss_per_user"] * 100
+            lines.append(
+                f"| {level['users']:,} | {kb(old['rss_per_user'])} | "
+                f"{kb(level['rss_per_user'])} | {change:+.1f}% |\n"
+            )
+        lines.append("\n")
+
+    return "".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator memory footprint benchmark")
+    parser.add_argument("--levels", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--settle", type=float, default=10, help="Seconds to run after spawning before measuring")
+    parser.add_argument("--soak", type=float, default=0, help="Soak duration in seconds (0 = skip)")
+    parser.add_argument("--users", type=int, default=100, help="Users for the soak run")
+    parser.add_argument("--interval", type=float, default=30, help="Soak sampling interval in seconds")
+    parser.add_argument("--host", default=None, help="Target (default: local stub server)")
+    parser.add_argument("--port", type=int, default=9080)
+    parser.add_argument("--soak-traced", action="store_true",
+                        help="Also sample tracemalloc during the soak (adds its overhead to RSS)")
+    parser.add_argument("--compare", help="Previous memory_benchmark_*.json to compare against")
+    parser.add_argument("--output", help="Report path without extension (default: reports/memory_benchmark_<timestamp>)")
+    parser.add_argument("--child-level", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--child-soak", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--child-traced", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child_level:
+        result = measure_level(args.child_level, args.host, args.settle, traced=args.child_traced)
+        print(RESULT_MARKER + json.dumps(result))
+        return
+    if args.child_soak:
+        result = run_soak(args.child_soak, args.host, args.soak, args.interval, traced=args.child_traced)
+        print(RESULT_MARKER + json.dumps(result))
+        return
+
+    print("=" * 60)
+    print("LOAD GENERATOR MEMORY BENCHMARK")
+    print("=" * 60)
+
+    stub = None
+    if args.host is None:
+        stub = start_stub(args.port)
+        args.host = f"http://127.0.0.1:{args.port}"
+    print(f"Target: {args.host}\n")
+
+    report = {"generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "levels": [], "soak": None}
+    try:
+        if not args.soak:
+            for level in args.levels:
+                print(f"Measuring {level:,} users...")
+                args.child_level = level
+                breakdown = run_child(args, traced=True)
+                report["levels"].append({**breakdown, **run_child(args)})
+        else:
+            print(f"Soak: {args.users} users for {args.soak:.0f}s...")
+            report["soak"] = run_child(args, traced=args.soak_traced)
+    finally:
+        if stub:
+            stub.terminate()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    output_base = args.output
+    if output_base is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_base = os.path.join(ROOT_DIR, "reports", f"memory_benchmark_{timestamp}")
+    with open(output_base + ".json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    markdown = generate_report(report, baseline)
+    with open(output_base + ".md", "w", encoding="utf-8") as f:
+        f.write(markdown)
+
+    print()
+    print(markdown)
+    print(f"✅ Report generated: {output_base}.md")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Startup Time Benchmark
+Measures how long each entry point takes to import in a fresh interpreter
+(what every Locust worker pays before it can start users), and optionally a
+full `locust --list` boot
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --profile locustfile --top 15
+    python benchmarks/bench_startup.py --locust --save reports/startup_baseline.json
+    python benchmarks/bench_startup.py --compare reports/startup_baseline.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+MODULES = [
+    "config",
+    "sla",
+    "analyze_results",
+    "generate_charts",
+    "locustfile",
+    "locustfile_http2",
+    "locustfile_async",
+]
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        list: [(module, depth, self_us, cumulative_us)] in import order
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time:  self_us | cumulative_us | <2 spaces per level>name"
+        head, cumulative_us, name = line.split("|", 2)
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), depth, int(head.split(":")[1]), int(cumulative_us)))
+    return imports
+
+
+def time_import(module, repeats):
+    """
+    Import a module in fresh interpreters.
+
+    Returns:
+        dict: median wall/import ms and the importtime profile of the last run, or an error
+    """
+    wall, imported, profile = [], [], []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT_DIR, capture_output=True, text=True
+        )
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1]}
+
+        profile = parse_importtime(result.stderr)
+        top_level = [cumulative for name, depth, _, cumulative in profile if name == module and depth == 0]
+        wall.append(elapsed)
+        imported.append(top_level[-1] / 1000 if top_level else 0.0)
+
+    return {
+        "wall_ms": statistics.median(wall),
+        "import_ms": statistics.median(imported),
+        "profile": profile,
+    }
+
+
+def time_locust_boot(locust_file, repeats):
+    """Median wall time of `locust -f <file> --list` (full boot, no users started)"""
+    locust = shutil.which("locust")
+    if not locust:
+        return {"error": "locust not found on PATH"}
+
+    wall = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = subprocess.run([locust, "-f", locust_file, "--list"], cwd=ROOT_DIR, capture_output=True, text=True)
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1]}
+        wall.append((time.perf_counter() - start) * 1000)
+    return {"wall_ms": statistics.median(wall)}
+
+
+def print_profile(module, profile, top):
+    """Slowest packages imported by a module, by cumulative time"""
+    # importtime lists children before their parent: walk back from the module's own line
+    end = max((i for i, (name, depth, _, _) in enumerate(profile) if name == module and depth == 0), default=None)
+    if end is None:
+        return
+    start = end
+    while start > 0 and profile[start - 1][1] > 0:
+        start -= 1
+
+    print(f"\nSlowest imports under {module} (cumulative):")
+    packages = {}
+    for name, depth, _, cumulative in profile[start:end]:
+        root = name.split(".")[0]
+        if depth == 1 and cumulative > packages.get(root, 0):
+            packages[root] = cumulative
+    for name, cumulative in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {name:<30} {cumulative / 1000:>9.1f} ms")
+
+
+def compare(results, baseline, threshold):
+    """
+    Print per-entry change versus a baseline; return the regressions.
+
+    Modules compare on their own import time (interpreter start-up is noise here);
+    the locust boot compares on wall time.
+    """
+    regressions = []
+    print()
+    print(f"{'Entry point':<30} {'Baseline':>10} {'Current':>10} {'Change':>9}")
+    print("-" * 62)
+    for name, current in results.items():
+        old = baseline["results"].get(name)
+        if "error" in current or not old or "error" in old:
+            continue
+        metric = "import_ms" if "import_ms" in current else "wall_ms"
+        if not old[metric]:
+            continue
+        change = (current[metric] - old[metric]) / old[metric] * 100
+        flag = ""
+        if change > threshold:
+            flag = " 🔴"
+            regressions.append(name)
+        print(f"{name:<30} {old[metric]:>8.1f}ms {current[metric]:>8.1f}ms {change:>+8.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time of the load generator entry points")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh interpreters per entry point (median)")
+    parser.add_argument("--modules", nargs="+", default=MODULES, help="Modules to import")
+    parser.add_argument("--profile", help="Show the slowest imports for this module")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--locust", action="store_true", help="Also time a full `locust -f locustfile.py --list` boot")
+    parser.add_argument("--save", help="Write results to this JSON file (e.g. a baseline)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=15.0, help="Regression threshold in percent")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("STARTUP TIME BENCHMARK")
+    print("=" * 60)
+    print(f"  {'Entry point':<30} {'Wall':>10} {'Import':>10}")
+
+    baseline = time_import("sys", args.repeats)
+    print(f"  {'(bare interpreter)':<30} {baseline['wall_ms']:>8.1f}ms")
+
+    results = {}
+    profiles = {}
+    for module in args.modules:
+        result = time_import(module, args.repeats)
+        profiles[module] = result.pop("profile", [])
+        results[module] = result
+        if "error" in result:
+            print(f"  {module:<30} ❌ {result['error']}")
+        else:
+            print(f"  {module:<30} {result['wall_ms']:>8.1f}ms {result['import_ms']:>8.1f}ms")
+
+    if args.locust:
+        result = results["locust --list"] = time_locust_boot("locustfile.py", args.repeats)
+        if "error" in result:
+            print(f"  {'locust --list':<30} ❌ {result['error']}")
+        else:
+            print(f"  {'locust --list':<30} {result['wall_ms']:>8.1f}ms")
+
+    if args.profile:
+        profile = profiles.get(args.profile) or time_import(args.profile, 1).get("profile", [])
+        print_profile(args.profile, profile, args.top)
+
+    report = {
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": sys.version.split()[0],
+        "interpreter_ms": baseline["wall_ms"],
+        "results": results,
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Results saved: {args.save}")
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n🔴 {len(regressions)} entry point(s) slower than baseline by more than {args.threshold:.0f}%")
+
+    print("=" * 60)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,16 @@ Performance Testing Configuration
 Centralized settings for Locust tests
 """
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+# .env is parsed once by the launching process (tests/run_tests.py); the Locust
+# processes it starts inherit the resulting environment and skip the parse.
+# Only the project's own .env (next to this file) is read, by explicit path:
+# unlike a bare load_dotenv(), there is no search of the working directory or
+# its parents, so a stray .env higher up never leaks into a run
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+if os.getenv("PERF_CONFIG_PRELOADED") != "1" and os.path.exists(ENV_FILE):
+    from dotenv import load_dotenv
+    load_dotenv(ENV_FILE)
 
 # API Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "https://jsonplaceholder.typicode.com")
@@ -28,28 +35,147 @@ SLA_THRESHOLDS = {
         "/posts/1": 800,            # Max 800ms for updating post
     }
 }
+
+# Percentile SLAs (how the SLAs are written: "p95 < 300ms, p99 < 800ms over any 1-minute window")
+#   percentiles  - {percentile: max ms}, checked in every window
+#   window       - window length in seconds (default SLA_WINDOW; only complete windows
+#                  are judged, so keep it well under the scenario duration)
+#   error_budget - max failure ratio per window (default SLA_ERROR_BUDGET)
+SLA_WINDOW = 15
+SLA_ERROR_BUDGET = 0.01
+SLA_SPECS = {
+    "GET": {
+        "/posts": {"percentiles": {0.95: 500, 0.99: 1000}},
+        "/posts/1": {"percentiles": {0.95: 300, 0.99: 800}},
+        "/comments": {"percentiles": {0.95: 400, 0.99: 900}},
+        "/users": {"percentiles": {0.95: 500, 0.99: 1000}},
+        "/users/1": {"percentiles": {0.95: 300, 0.99: 800}},
+        "/albums": {"percentiles": {0.95: 500, 0.99: 1000}},
+        "/posts?userId=1": {"percentiles": {0.95: 600, 0.99: 1200}},
+    },
+    "POST": {
+        "/posts": {"percentiles": {0.95: 1000, 0.99: 2000}, "error_budget": 0.02},
+    },
+    "PUT": {
+        "/posts/1": {"percentiles": {0.95: 800, 0.99: 1600}, "error_budget": 0.02},
+    },
+    # End-to-end user journeys (locustfile_journeys.py), keyed by journey name
+    "JOURNEY": {
+        "read_post": {"percentiles": {0.95: 1500, 0.99: 3000}, "error_budget": 0.02},
+        "edit_post": {"percentiles": {0.95: 2000, 0.99: 4000}, "error_budget": 0.02},
+    }
+}
+
+# Payload Size Budgets (max decoded response body in bytes)
+SIZE_BUDGETS = {
+    "GET": {
+        "/posts": 32000,            # 100 posts (~27KB)
+        "/posts/1": 1000,
+        "/comments": 4000,          # Comments for one post
+        "/users": 8000,
+        "/users/1": 1000,
+        "/albums": 12000,           # 100 albums (~9KB)
+        "/posts?userId=1": 4000,
+    },
+    "POST": {
+        "/posts": 500,
+    },
+    "PUT": {
+        "/posts/1": 500,
+    }
+}
+
+# Response Compression: Accept-Encoding sent by users, e.g. "gzip", "br", "gzip, br",
+# "identity". Empty keeps the HTTP client default. Decompress cost is measured when set.
+RESPONSE_COMPRESSION = os.getenv("RESPONSE_COMPRESSION", "")
+
+# Connection Policy (per user class, overridable as class attributes)
+#   persistent      - keep-alive, connections reused for the whole run
+#   close_after_n   - drop pooled connections every CONNECTION_CLOSE_AFTER requests
+#   new_per_request - open a fresh connection (and TLS handshake) for every request
+CONNECTION_STRATEGY = os.getenv("CONNECTION_STRATEGY", "persistent")
+CONNECTION_CLOSE_AFTER = int(os.getenv("CONNECTION_CLOSE_AFTER", "100"))
+CONNECTION_POOL_SIZE = int(os.getenv("CONNECTION_POOL_SIZE", "10"))
+
+# HTTP/2 User (locustfile_http2.py) - users in a worker share these connections
+HTTP2_MAX_CONNECTIONS = int(os.getenv("HTTP2_MAX_CONNECTIONS", "1"))
+HTTP2_MAX_CONCURRENT_STREAMS = int(os.getenv("HTTP2_MAX_CONCURRENT_STREAMS", "100"))
+
+# Asyncio User (locustfile_async.py) - logical users per Locust user
+ASYNC_LOGICAL_USERS = int(os.getenv("ASYNC_LOGICAL_USERS", "1000"))
+ASYNC_MAX_CONNECTIONS = int(os.getenv("ASYNC_MAX_CONNECTIONS", "200"))
+ASYNC_SHUTDOWN_TIMEOUT = 5.0  # Seconds in-flight requests get to finish when the user stops
+
 # Performance Percentiles to Track
 PERCENTILES = [0.50, 0.75, 0.90, 0.95, 0.99]
 
+# Think Time / Pacing (default; scenarios override with a "pacing" key)
+#   {"model": "between", "min": 1, "max": 3}        - think time after each task
+#   {"model": "constant", "seconds": 2}              - fixed think time
+#   {"model": "constant_pacing", "interval": 2}      - one task start every 2s per user
+#   {"model": "poisson", "rate": 0.5}                - exponential (Poisson) gaps between task
+#                                                      starts, 0.5 tasks/s per user on average
+#   {"model": "recorded", "file": "think_times.csv"} - think time sampled from recorded sessions
+#                                                      (or inline "samples": [...])
+#   "tasks": {"create_post": {...}}                  - per-task think time after that task
+PACING = {"model": "between", "min": 1, "max": 3}
+
 # Test Scenarios Configuration
+# warmup: initial period (ramp-up + settling) excluded from the in-process
+# metrics (SLA violations, slow requests, connection stats)
+# pacing: think-time model for the scenario (see PACING); faster pacing reaches
+# the same RPS with fewer users
 SCENARIOS = {
     "baseline": {
         "users": 10,
         "spawn_rate": 2,
-        "duration": "60s"
+        "duration": "60s",
+        "warmup": "10s",
+        "pacing": PACING
     },
     "medium": {
         "users": 50,
         "spawn_rate": 5,
-        "duration": "60s"
+        "duration": "60s",
+        "warmup": "15s",
+        "pacing": PACING
     },
     "stress": {
         "users": 100,
         "spawn_rate": 10,
-        "duration": "60s"
+        "duration": "60s",
+        "warmup": "15s",
+        "pacing": PACING
     }
 }
 
+# Fault Injection (fault_proxy.py; run_tests.py --faults <schedule>)
+# Each fault applies to one route (path prefix, "*" = all) from start for duration
+# seconds after the proxy starts; optional "methods": ["GET", ...]
+#   {"type": "latency", "ms": 500, "jitter_ms": 100}  - delay before forwarding
+#   {"type": "error", "status": 503, "rate": 0.2}     - answer 20% of requests with an error
+#   {"type": "drop", "rate": 0.1}                     - close 10% of connections without a response
+#   {"type": "bandwidth", "kbps": 64}                 - throttle response bodies
+FAULT_PROXY_PORT = int(os.getenv("FAULT_PROXY_PORT", "8090"))
+FAULT_CORRELATION_SLACK = 10  # Seconds after a fault that still count (history percentiles trail ~10s)
+FAULT_SCHEDULES = {
+    "latency_spike": [
+        {"type": "latency", "route": "/posts", "start": 25, "duration": 15, "ms": 800, "jitter_ms": 200},
+    ],
+    "error_burst": [
+        {"type": "error", "route": "*", "start": 25, "duration": 10, "status": 503, "rate": 0.2},
+    ],
+    "slow_network": [
+        {"type": "bandwidth", "route": "/comments", "start": 20, "duration": 30, "kbps": 32},
+    ],
+    "chaos": [
+        {"type": "latency", "route": "/users", "start": 15, "duration": 20, "ms": 400, "jitter_ms": 400},
+        {"type": "error", "route": "/posts", "methods": ["POST", "PUT"], "start": 25, "duration": 15,
+         "status": 500, "rate": 0.5},
+        {"type": "drop", "route": "/comments", "start": 35, "duration": 10, "rate": 0.1},
+    ],
+}
+
 # Logging Configuration
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "[%(asctime)s] %(levelname)s: %(message)s"
@@ -58,4 +184,5 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Feature Flags
 ENABLE_ASSERTIONS = True       # Fail tests if SLA violated
 ENABLE_DETAILED_LOGGING = True # Log each request details
-ENABLE_PERCENTILE_TRACKING = True
\ No newline at end of file
+ENABLE_PERCENTILE_TRACKING = True
+ENABLE_PHASE_TIMING = os.getenv("ENABLE_PHASE_TIMING", "false").lower() == "true"  # DNS/connect/TLS/TTFB/download per request
\ No newline at end of file
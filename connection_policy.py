@@ -0,0 +1,247 @@
+"""
+Connection Reuse Policies
+Keep-alive, connection churn and pool sizing for Locust HTTP sessions,
+plus optional per-request phase timing (DNS, connect, TLS, TTFB, download)
+and response compression negotiation with measured decompress cost
+"""
+import logging
+import socket
+import threading
+import time
+import zlib
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import allowed_gai_family
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("persistent", "close_after_n", "new_per_request")
+
+PHASES = ("dns", "connect", "tls", "ttfb", "download")
+
+# Timings accumulated by the greenlet that is sending a request
+# (Locust monkey-patches threading, so this is greenlet-local under gevent)
+_phase_timing = threading.local()
+
+
+def _inflate(data):
+    try:
+        return zlib.decompress(data)
+    except zlib.error:
+        # Some servers send raw deflate without the zlib header
+        return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
+DECODERS = {
+    "gzip": lambda data: zlib.decompress(data, 16 + zlib.MAX_WBITS),
+    "deflate": _inflate,
+}
+
+
+def _register_brotli():
+    """Import brotli only when br is requested (keeps it off the startup path)"""
+    if "br" not in DECODERS:
+        try:
+            import brotli
+        except ImportError:
+            return
+        DECODERS["br"] = brotli.decompress
+
+
+def supported_accept_encoding(accept_encoding):
+    """Drop codings we can't decode (e.g. br without the brotli package)"""
+    codings = [c.strip() for c in accept_encoding.split(",") if c.strip()]
+    if "br" in codings:
+        _register_brotli()
+    unsupported = [c for c in codings if c not in DECODERS and c != "identity"]
+    if unsupported:
+        logger.warning(f"Not advertising {unsupported}: no decoder installed (pip install brotli for br)")
+    return ", ".join(c for c in codings if c not in unsupported) or "identity"
+
+
+def _reset_phase_timing(enabled):
+    _phase_timing.enabled = enabled
+    _phase_timing.connects = 0
+    _phase_timing.dns = 0.0
+    _phase_timing.connect = 0.0
+    _phase_timing.tls = 0.0
+
+
+def _setup_time():
+    return getattr(_phase_timing, "dns", 0.0) + getattr(_phase_timing, "connect", 0.0) + getattr(_phase_timing, "tls", 0.0)
+
+
+def _add_phase(phase, elapsed_ms):
+    setattr(_phase_timing, phase, getattr(_phase_timing, phase, 0.0) + elapsed_ms)
+
+
+class TimedConnectionMixin:
+    """Splits connection setup into DNS, TCP connect and TLS handshake"""
+    is_tls = False
+
+    def _new_conn(self):
+        if not getattr(_phase_timing, "enabled", False):
+            start = time.perf_counter()
+            conn = super()._new_conn()
+            _add_phase("connect", (time.perf_counter() - start) * 1000)
+            return conn
+
+        # Resolve separately so DNS isn't hidden inside connect time
+        start = time.perf_counter()
+        original_host = self._dns_host
+        try:
+            address = socket.getaddrinfo(original_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            address = original_host  # Let urllib3 raise its usual error
+        resolved = time.perf_counter()
+
+        self._dns_host = address
+        try:
+            conn = super()._new_conn()
+        finally:
+            self._dns_host = original_host
+
+        _add_phase("dns", (resolved - start) * 1000)
+        _add_phase("connect", (time.perf_counter() - resolved) * 1000)
+        return conn
+
+    def connect(self):
+        start = time.perf_counter()
+        setup_before = _setup_time()
+        super().connect()
+        _phase_timing.connects = getattr(_phase_timing, "connects", 0) + 1
+
+        if self.is_tls:
+            # Whatever connect() spent beyond DNS + TCP is the TLS handshake
+            elapsed = (time.perf_counter() - start) * 1000
+            _add_phase("tls", max(0.0, elapsed - (_setup_time() - setup_before)))
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    """HTTP connection that measures connection setup"""
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection that measures connection setup, including the TLS handshake"""
+    is_tls = True
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class ConnectionPolicyAdapter(HTTPAdapter):
+    """
+    Transport adapter applying a connection reuse strategy.
+
+    Every response gets extra attributes read by the request listener:
+    - connection_setup_time: ms spent opening connections for this request
+    - new_connections: number of connections opened for this request
+    - phase_timings: {phase: ms} for PHASES (only with phase_timing enabled)
+    - wire_length / decompress_time: compressed body size and ms spent
+      decoding it (only with phase_timing or accept_encoding set, and only
+      when the body was sent as-is or in a coding we decode ourselves)
+    """
+
+    def __init__(self, strategy="persistent", close_after=100, pool_size=10, phase_timing=False,
+                 accept_encoding=None):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown connection strategy '{strategy}' (expected one of {STRATEGIES})")
+
+        self.strategy = strategy
+        self.close_after = 1 if strategy == "new_per_request" else max(1, close_after)
+        self.phase_timing = phase_timing
+        self.accept_encoding = supported_accept_encoding(accept_encoding) if accept_encoding else None
+        self.requests_on_pool = 0
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        if self.strategy == "new_per_request":
+            request.headers["Connection"] = "close"
+        if self.accept_encoding:
+            request.headers["Accept-Encoding"] = self.accept_encoding
+
+        _reset_phase_timing(self.phase_timing)
+        start = time.perf_counter()
+
+        try:
+            response = super().send(request, **kwargs)
+            headers_received = time.perf_counter()
+
+            download = 0.0
+            if (self.phase_timing or self.accept_encoding) and not kwargs.get("stream"):
+                # Read the body here (requests would right after) to time the transfer
+                download = self._read_body(response)
+        finally:
+            if self.strategy != "persistent":
+                self.requests_on_pool += 1
+                if self.requests_on_pool >= self.close_after:
+                    # Drop every pooled connection; the next request reconnects
+                    self.poolmanager.clear()
+                    self.requests_on_pool = 0
+
+        setup = _setup_time()
+        response.connection_setup_time = setup
+        response.new_connections = _phase_timing.connects
+
+        if self.phase_timing:
+            response.phase_timings = {
+                "dns": _phase_timing.dns,
+                "connect": _phase_timing.connect,
+                "tls": _phase_timing.tls,
+                # Request sent -> response headers: server time + network round trip
+                "ttfb": max(0.0, (headers_received - start) * 1000 - setup),
+                "download": download,
+            }
+
+        return response
+
+    @staticmethod
+    def _read_body(response):
+        """
+        Read the body, decoding it ourselves so decompression is timed apart from transfer.
+
+        Returns:
+            float: Download time in ms (excluding decompression)
+        """
+        encoding = response.headers.get("Content-Encoding", "").strip().lower()
+        start = time.perf_counter()
+
+        if encoding in DECODERS:
+            raw = response.raw.read(decode_content=False)
+            downloaded = time.perf_counter()
+            # HEAD, 204 and 304 responses can carry Content-Encoding without a body
+            response._content = DECODERS[encoding](raw) if raw else b""
+            response._content_consumed = True
+            response.wire_length = len(raw)
+            response.decompress_time = (time.perf_counter() - downloaded) * 1000
+        else:
+            content = response.content
+            downloaded = time.perf_counter()
+            if encoding in ("", "identity"):
+                response.wire_length = len(content)
+                response.decompress_time = 0.0
+            # Other codings were decoded by urllib3: the wire size is unknown
+
+        return (downloaded - start) * 1000
+
+
+def apply_connection_policy(session, strategy, close_after, pool_size, phase_timing=False, accept_encoding=None):
+    """Mount a ConnectionPolicyAdapter on a requests/Locust session"""
+    adapter = ConnectionPolicyAdapter(strategy, close_after, pool_size, phase_timing, accept_encoding)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return adapter
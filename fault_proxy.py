@@ -0,0 +1,309 @@
+"""
+Fault Injection Proxy
+asyncio HTTP/1.1 reverse proxy between the load generator and the target
+(API_BASE_URL or stub_server.py). Injects the scheduled latency, error,
+connection-drop and bandwidth faults of config.FAULT_SCHEDULES per route and
+writes a fault log (*_faults.json) that analyze_results.py correlates with
+SLA violations
+
+Usage:
+    python fault_proxy.py --schedule error_burst                   # in front of API_BASE_URL
+    python fault_proxy.py --upstream http://127.0.0.1:8080 --schedule chaos \\
+        --log reports/results_10users_<timestamp>_faults.json
+    locust -f locustfile.py --host http://127.0.0.1:8090 ...
+    python tests/run_tests.py --faults chaos                      # proxy started per scenario
+"""
+import argparse
+import asyncio
+import json
+import random
+import signal
+import ssl
+import time
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from config import API_BASE_URL, FAULT_PROXY_PORT
+from faults import load_schedule, write_fault_log
+
+# Per-connection headers that are not forwarded
+HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-connection", "transfer-encoding", "te", "trailer", "upgrade",
+    "proxy-authenticate", "proxy-authorization"
+}
+
+THROTTLE_TICK = 0.05  # Seconds between throttled body chunks
+LOG_INTERVAL = 5.0    # Seconds between fault log updates
+
+
+class UpstreamError(Exception):
+    """The target could not be reached or sent an invalid response"""
+
+
+async def read_headers(reader):
+    """Header lines up to the blank line, as [(name, value)] (order and case kept)"""
+    headers = []
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers.append((name.strip(), value.strip()))
+
+
+def header(headers, name, default=""):
+    """Value of a header by lowercase name"""
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return default
+
+
+async def read_body(reader, headers, until_close=False):
+    """Message body by Content-Length, chunked encoding or (responses) connection close"""
+    if "chunked" in header(headers, "transfer-encoding").lower():
+        body = bytearray()
+        while True:
+            size = int((await reader.readline()).split(b";", 1)[0], 16)
+            if size == 0:
+                await read_headers(reader)  # Trailers
+                return bytes(body)
+            body.extend(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    length = header(headers, "content-length")
+    if length:
+        return await reader.readexactly(int(length))
+    return await reader.read() if until_close else b""
+
+
+def serialize_head(start_line, headers):
+    return ("\r\n".join([start_line] + [f"{name}: {value}" for name, value in headers]) + "\r\n\r\n").encode("latin-1")
+
+
+def json_response(status, payload):
+    return status, [("Content-Type", "application/json; charset=utf-8")], json.dumps(payload).encode()
+
+
+class Upstream:
+    """Keep-alive connection to the target, one per client connection"""
+
+    def __init__(self, url):
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port or (443 if secure else 80)
+        self.host_header = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.ssl = ssl.create_default_context() if secure else None
+        self.reader = None
+        self.writer = None
+
+    async def request(self, method, target, headers, body):
+        """
+        Send one request to the target.
+
+        A stale keep-alive connection is reopened once; other failures raise UpstreamError.
+
+        Returns:
+            tuple: (status, headers, body)
+        """
+        while True:
+            reused = self.writer is not None
+            try:
+                if not reused:
+                    self.reader, self.writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+                return await self._exchange(method, target, headers, body)
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                self.close()
+                if not reused:
+                    raise UpstreamError(str(e) or type(e).__name__) from e
+
+    async def _exchange(self, method, target, headers, body):
+        forwarded = [(name, value) for name, value in headers
+                     if name.lower() not in HOP_BY_HOP and name.lower() not in ("host", "content-length")]
+        forwarded.insert(0, ("Host", self.host_header))
+        if body or method in ("POST", "PUT", "PATCH"):
+            forwarded.append(("Content-Length", str(len(body))))
+        self.writer.write(serialize_head(f"{method} {self.base_path}{target} HTTP/1.1", forwarded) + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("target closed the connection")
+        status = int(status_line.split(b" ", 2)[1])
+        response_headers = await read_headers(self.reader)
+        keep_alive = header(response_headers, "connection").lower() != "close"
+        if method == "HEAD" or status in (204, 304) or status < 200:
+            response_body = b""
+        else:
+            response_body = await read_body(self.reader, response_headers, until_close=not keep_alive)
+        if not keep_alive:
+            self.close()
+        return status, response_headers, response_body
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+class FaultProxy:
+    """Relays requests to the target, applying the faults active at that moment"""
+
+    def __init__(self, upstream_url, faults, schedule=None, started=None):
+        self.upstream_url = upstream_url
+        self.faults = faults
+        self.schedule = schedule
+        self.started = started or time.time()
+        self.requests = 0
+
+    async def handle_connection(self, reader, writer):
+        upstream = Upstream(self.upstream_url)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = await read_headers(reader)
+                body = await read_body(reader, headers)
+                keep_alive = header(headers, "connection").lower() != "close"
+                self.requests += 1
+
+                if not await self.relay(method, target, headers, body, keep_alive, upstream, writer):
+                    break  # Dropped
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            upstream.close()
+            writer.close()
+
+    async def relay(self, method, target, headers, body, keep_alive, upstream, writer):
+        """
+        Apply the active faults and answer one request.
+
+        Returns:
+            bool: False if a drop fault closed the connection instead
+        """
+        path = target.split("?", 1)[0]
+        now = time.time()
+        injected = []
+        error_status = None
+        kbps = None
+
+        for fault in self.faults:
+            if not fault.applies(method, path, now) or not fault.fires():
+                continue
+            fault.injected += 1
+            injected.append(fault.type)
+            if fault.type == "drop":
+                return False
+            if fault.type == "latency":
+                jitter = fault.params.get("jitter_ms", 0)
+                await asyncio.sleep(max(0.0, fault.params["ms"] + random.uniform(-jitter, jitter)) / 1000)
+            elif fault.type == "error":
+                error_status = error_status or fault.params.get("status", 503)
+            elif fault.type == "bandwidth":
+                kbps = min(kbps or fault.params["kbps"], fault.params["kbps"])
+
+        if error_status:
+            status, response_headers, response_body = json_response(error_status, {"error": "injected fault"})
+        else:
+            try:
+                status, response_headers, response_body = await upstream.request(method, target, headers, body)
+            except UpstreamError as e:
+                status, response_headers, response_body = json_response(502, {"error": f"upstream: {e}"})
+
+        head = [(name, value) for name, value in response_headers
+                if name.lower() not in HOP_BY_HOP and name.lower() != "content-length"]
+        head.append(("Content-Length", str(len(response_body))))
+        head.append(("Connection", "keep-alive" if keep_alive else "close"))
+        if injected:
+            head.append(("X-Fault-Injected", ", ".join(injected)))
+
+        try:
+            reason = HTTPStatus(status).phrase
+        except ValueError:
+            reason = ""
+        writer.write(serialize_head(f"HTTP/1.1 {status} {reason}", head))
+        await self.send(writer, response_body, kbps)
+        return True
+
+    @staticmethod
+    async def send(writer, body, kbps=None):
+        """Write a body, throttled to kbps (kilobits/s) when set"""
+        if not kbps:
+            writer.write(body)
+            await writer.drain()
+            return
+
+        chunk = max(1, int(kbps * 1000 / 8 * THROTTLE_TICK))
+        for offset in range(0, len(body), chunk):
+            writer.write(body[offset:offset + chunk])
+            await writer.drain()
+            await asyncio.sleep(THROTTLE_TICK)
+
+    def log(self):
+        """Fault log: what was scheduled (epoch seconds) and how often it fired"""
+        return {
+            "schedule": self.schedule,
+            "upstream": self.upstream_url,
+            "started": self.started,
+            "requests": self.requests,
+            "faults": [fault.to_dict() for fault in self.faults],
+        }
+
+
+async def serve(proxy, host, port, log_path=None):
+    """Serve until SIGINT/SIGTERM, keeping the fault log current"""
+    server = await asyncio.start_server(proxy.handle_connection, host, port)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, AttributeError, ValueError):
+            pass  # Windows: Ctrl+C raises KeyboardInterrupt; the periodic log covers terminate()
+
+    async with server:
+        try:
+            while not stop.is_set():
+                if log_path:
+                    write_fault_log(log_path, proxy.log())
+                try:
+                    await asyncio.wait_for(stop.wait(), LOG_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if log_path:
+                write_fault_log(log_path, proxy.log())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fault injection reverse proxy")
+    parser.add_argument("--upstream", default=API_BASE_URL, help="Target base URL (default: API_BASE_URL)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=FAULT_PROXY_PORT)
+    parser.add_argument("--schedule", help="Fault schedule from config.FAULT_SCHEDULES (default: no faults)")
+    parser.add_argument("--log", help="Fault log to write, e.g. <csv prefix>_faults.json")
+    args = parser.parse_args()
+
+    started = time.time()
+    proxy = FaultProxy(args.upstream, load_schedule(args.schedule, started), args.schedule, started)
+    print(f"Fault proxy listening on http://{args.host}:{args.port} -> {args.upstream} "
+          f"(schedule: {args.schedule or 'none'})")
+
+    try:
+        asyncio.run(serve(proxy, args.host, args.port, args.log))
+    except KeyboardInterrupt:
+        pass
+
+    injected = sum(fault.injected for fault in proxy.faults)
+    print(f"Fault proxy stopped: {proxy.requests} requests, {injected} faults injected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Fault Schedules
+Scheduled faults from config.FAULT_SCHEDULES, shared by the injection proxy
+(fault_proxy.py) and the offline correlation in analyze_results.py
+"""
+import json
+import os
+import random
+
+from config import FAULT_SCHEDULES
+
+FAULT_TYPES = ("latency", "error", "drop", "bandwidth")
+
+# journeys.REQUEST_TYPE (not imported here: journeys pulls in Locust)
+JOURNEY_TYPE = "JOURNEY"
+
+
+def route_matches(route, path):
+    """Path prefix match on segment boundaries: "/posts" matches /posts and /posts/1, not /postsX"""
+    if route == "*":
+        return True
+    route = route.rstrip("/")
+    return path == route or path.startswith(route + "/")
+
+
+class Fault:
+    """One scheduled fault, active in [start, end) (epoch seconds)"""
+    __slots__ = ("type", "route", "methods", "start", "end", "params", "injected")
+
+    def __init__(self, spec, started):
+        """
+        Args:
+            spec: Entry of a FAULT_SCHEDULES list
+            started: Epoch time the schedule's offsets count from
+        """
+        if spec["type"] not in FAULT_TYPES:
+            raise ValueError(f"Unknown fault type '{spec['type']}' (expected one of {FAULT_TYPES})")
+        self.type = spec["type"]
+        self.route = spec.get("route", "*")
+        self.methods = tuple(method.upper() for method in spec.get("methods", ()))
+        self.start = started + spec["start"]
+        self.end = self.start + spec["duration"]
+        self.params = {k: v for k, v in spec.items() if k not in ("type", "route", "methods", "start", "duration")}
+        self.injected = 0
+
+    def applies(self, method, path, now):
+        return (self.start <= now < self.end
+                and (not self.methods or method in self.methods)
+                and route_matches(self.route, path))
+
+    def fires(self):
+        """Roll the fault's rate (default: every matching request)"""
+        return random.random() < self.params.get("rate", 1.0)
+
+    def to_dict(self):
+        return {
+            "type": self.type,
+            "route": self.route,
+            "methods": list(self.methods),
+            "start": self.start,
+            "end": self.end,
+            "params": self.params,
+            "injected": self.injected,
+        }
+
+
+def load_schedule(name, started):
+    """Faults of a named schedule (None or "" = no faults, plain proxy)"""
+    if not name:
+        return []
+    if name not in FAULT_SCHEDULES:
+        raise ValueError(f"Unknown fault schedule '{name}' (expected one of {list(FAULT_SCHEDULES)})")
+    return [Fault(spec, started) for spec in FAULT_SCHEDULES[name]]
+
+
+def describe_fault(fault):
+    """Short description of a fault dict (Fault.to_dict()), e.g. 'error 503 @ 20%'"""
+    params = fault["params"]
+    if fault["type"] == "latency":
+        detail = f"+{params['ms']}ms"
+        if params.get("jitter_ms"):
+            detail += f" ±{params['jitter_ms']}ms"
+    elif fault["type"] == "error":
+        detail = str(params.get("status", 503))
+    elif fault["type"] == "bandwidth":
+        detail = f"{params['kbps']} kbps"
+    else:
+        detail = ""
+    rate = params.get("rate", 1.0)
+    if rate < 1.0:
+        detail += f" @ {rate:.0%}"
+    methods = f" ({', '.join(fault['methods'])})" if fault["methods"] else ""
+    return f"{fault['type']} {detail}".strip() + f" on {fault['route']}{methods}"
+
+
+def endpoint_affected(fault, name):
+    """
+    True if a stats entry ("GET /posts/1", "JOURNEY read_post") can be hit by a fault dict.
+
+    Journeys span several routes, so any fault may affect them.
+    """
+    request_type, _, target = name.partition(" ")
+    if request_type == JOURNEY_TYPE:
+        return True
+    if fault["methods"] and request_type not in fault["methods"]:
+        return False
+    return route_matches(fault["route"], target.split("?", 1)[0])
+
+
+def fault_log_path_for(stats_path):
+    """Fault log written alongside a run's stats CSV"""
+    return stats_path[:-len('_stats.csv')] + '_faults.json'
+
+
+def write_fault_log(path, log):
+    # Replace atomically: analyze_results may read it while the proxy runs
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(log, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def read_fault_log(path):
+    """Fault log dict, or None if the run was not behind the fault proxy"""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error parsing {path}: {e}")
+        return None
@@ -1,12 +1,42 @@
 """
 Generate performance comparison charts
-Creates HTML visualizations from test results
+Creates a self-contained (offline) HTML dashboard from test results
 """
+import argparse
 import csv
 import glob
+import json
 import os
+import re
 from collections import defaultdict
 
+from report_cache import BuildCache, watch
+
+CHART_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vendor", "minichart.js")
+
+REPORTS_DIR = "reports"
+OUTPUT_FILE = os.path.join(REPORTS_DIR, "dashboard.html")
+
+# Points kept per time series after LTTB downsampling; bounds dashboard size for long runs
+MAX_POINTS_PER_SERIES = 200
+
+RESULTS_PATTERN = re.compile(r"results_(\d+)users_(\d{8}_\d{6})_stats\.csv$")
+
+TIMELINE_METRICS = {
+    'rps': 'Requests/s',
+    'p50': '50%',
+    'p95': '95%',
+    'p99': '99%'
+}
+
+
+def _number(value):
+    """Parse a CSV cell, treating 'N/A' and blanks as missing"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
 
 def parse_csv_stats(csv_path):
     """Parse Locust stats CSV file"""
@@ -19,10 +49,14 @@ def parse_csv_stats(csv_path):
                 if row['Name'] == 'Aggregated':
                     continue
                 stats.append({
+                    'type': row['Type'],
                     'name': row['Name'],
                     'requests': int(row['Request Count']),
                     'avg_time': float(row['Average Response Time']),
-                    'rps': float(row['Requests/s'])
+                    'rps': float(row['Requests/s']),
+                    'p50': _number(row.get('50%')),
+                    'p95': _number(row.get('95%')),
+                    'p99': _number(row.get('99%'))
                 })
     except Exception as e:
         print(f"Error parsing {csv_path}: {e}")
@@ -31,38 +65,166 @@ def parse_csv_stats(csv_path):
     return stats
 
 
+def parse_stats_history(csv_path):
+    """
+    Parse a Locust stats_history CSV into per-endpoint time series.
+    
+    Per-endpoint rows require --csv-full-history; otherwise only the
+    'Aggregated' series is present.
+    
+    Returns:
+        dict: {endpoint: {metric: [(seconds_since_start, value), ...]}}
+    """
+    series = defaultdict(lambda: {metric: [] for metric in TIMELINE_METRICS})
+    start = None
+    
+    try:
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                timestamp = int(row['Timestamp'])
+                start = timestamp if start is None else start
+                endpoint = series[row['Name']]
+                for metric, column in TIMELINE_METRICS.items():
+                    value = _number(row.get(column))
+                    if value is not None:
+                        endpoint[metric].append((timestamp - start, value))
+    except Exception as e:
+        print(f"Error parsing {csv_path}: {e}")
+        return {}
+    
+    return dict(series)
+
+
+def lttb(points, threshold):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with its neighbours, so spikes survive downsampling.
+    """
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+    
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    previous = points[0]
+    
+    for i in range(threshold - 2):
+        bucket_start = int(i * bucket_size) + 1
+        bucket_end = int((i + 1) * bucket_size) + 1
+        
+        # Average of the next bucket is the third triangle vertex
+        next_start = bucket_end
+        next_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        next_bucket = points[next_start:next_end] or [points[-1]]
+        avg_x = sum(p[0] for p in next_bucket) / len(next_bucket)
+        avg_y = sum(p[1] for p in next_bucket) / len(next_bucket)
+        
+        best, best_area = None, -1
+        for point in points[bucket_start:bucket_end]:
+            area = abs(
+                (previous[0] - avg_x) * (point[1] - previous[1])
+                - (previous[0] - point[0]) * (avg_y - previous[1])
+            )
+            if area > best_area:
+                best, best_area = point, area
+        
+        sampled.append(best)
+        previous = best
+    
+    sampled.append(points[-1])
+    return sampled
+
+
 def find_latest_results():
-    """Find the most recent test results"""
+    """Find the most recent test results for every load level"""
     reports_dir = "reports"
     
-    csv_files = {}
-    for user_count in ['10', '50', '100']:
-        pattern = f"{reports_dir}/results_{user_count}users_*_stats.csv"
-        files = glob.glob(pattern)
-        if files:
-            csv_files[user_count] = max(files, key=os.path.getmtime)
+    latest = {}
+    for path in glob.glob(f"{reports_dir}/results_*users_*_stats.csv"):
+        match = RESULTS_PATTERN.search(os.path.basename(path))
+        if not match:
+            continue
+        users = match.group(1)
+        if users not in latest or os.path.getmtime(path) > os.path.getmtime(latest[users]):
+            latest[users] = path
     
-    return csv_files
+    # Order runs by load level, not alphabetically
+    return {users: latest[users] for users in sorted(latest, key=int)}
+
+
+def _round(value):
+    return None if value is None else round(value, 1)
 
 
-def generate_chart_html(all_stats):
-    """Generate interactive HTML chart"""
+def downsample_history(history):
+    """
+    LTTB-downsampled timelines of one run, as embedded in the dashboard.
     
-    # Collect data per endpoint
-    endpoints_data = defaultdict(lambda: {'10': 0, '50': 0, '100': 0})
+    Returns:
+        dict: {endpoint: {metric: [[t, value], ...]}}
+    """
+    return {
+        endpoint: {
+            metric: [[int(t), _round(v)] for t, v in lttb(points, MAX_POINTS_PER_SERIES)]
+            for metric, points in metrics.items()
+        }
+        for endpoint, metrics in history.items()
+    }
+
+
+def build_dashboard_data(all_stats, histories=None, timelines=None):
+    """
+    Collect everything the dashboard renders into one compact structure.
+    
+    Args:
+        all_stats: {users: [stat, ...]} from parse_csv_stats
+        histories: {users: parse_stats_history result} (optional)
+        timelines: {users: downsample_history result} (optional, e.g. cached)
+        
+    Returns:
+        dict: JSON-serializable dashboard data
+    """
+    timelines = dict(timelines or {})
+    for users, history in (histories or {}).items():
+        timelines[users] = downsample_history(history)
+    runs = list(all_stats.keys())
+    endpoints = sorted({stat['name'] for stats in all_stats.values() for stat in stats})
+    
+    data = {
+        'runs': runs,
+        'endpoints': endpoints,
+        'summary': [],
+        'avg_time': {},
+        'p95': {},
+        'timelines': {}
+    }
     
     for users, stats in all_stats.items():
-        for stat in stats:
-            endpoints_data[stat['name']][users] = stat['avg_time']
+        by_name = {stat['name']: stat for stat in stats}
+        # Journey entries are made of requests already counted on their own
+        requests = [s for s in stats if s['type'] != 'JOURNEY']
+        data['summary'].append({
+            'run': users,
+            'requests': sum(s['requests'] for s in requests),
+            'rps': round(sum(s['rps'] for s in requests), 2)
+        })
+        data['avg_time'][users] = [_round(by_name[ep]['avg_time']) if ep in by_name else None for ep in endpoints]
+        data['p95'][users] = [_round(by_name[ep]['p95']) if ep in by_name else None for ep in endpoints]
     
-    # Generate Chart.js HTML
-    html = """<!DOCTYPE html>
+    for users, run_timelines in timelines.items():
+        for endpoint, series in run_timelines.items():
+            data['timelines'].setdefault(endpoint, {})[users] = series
+    
+    return data
+
+
+DASHBOARD_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Performance Test Results - Visual Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <style>
         * {
             margin: 0;
@@ -160,35 +322,33 @@ def generate_chart_html(all_stats):
             height: 20px;
             border-radius: 3px;
         }
+        
+        .controls {
+            display: flex;
+            gap: 15px;
+            margin-bottom: 15px;
+            flex-wrap: wrap;
+        }
+        
+        .controls select {
+            padding: 6px 10px;
+            border-radius: 6px;
+            border: 1px solid #ccc;
+            font-size: 1em;
+        }
+        
+        .empty {
+            color: #666;
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>🚀 Performance Test Dashboard</h1>
         
-        <div class="stats-grid">
-"""
-    
-    # Calculate summary stats
-    for users in ['10', '50', '100']:
-        if users in all_stats:
-            total_requests = sum(s['requests'] for s in all_stats[users])
-            avg_rps = sum(s['rps'] for s in all_stats[users])
-            
-            html += f"""
-            <div class="stat-card">
-                <div class="stat-label">{users} Users Load</div>
-                <div class="stat-value">{total_requests:,}</div>
-                <div class="stat-label">Total Requests</div>
-                <div class="stat-value" style="font-size: 1.5em; margin-top: 10px;">{avg_rps:.1f}</div>
-                <div class="stat-label">RPS</div>
-            </div>
-"""
-    
-    html += """
-        </div>
+        <div class="stats-grid" id="statsGrid"></div>
         
-        <div class="dashboard">
+        <div class="dashboard" style="margin-top: 30px;">
             <div class="chart-container">
                 <h2 class="chart-title">Response Time by Load Level</h2>
                 <canvas id="responseTimeChart"></canvas>
@@ -198,192 +358,264 @@ def generate_chart_html(all_stats):
                 <h2 class="chart-title">Endpoint Comparison</h2>
                 <canvas id="endpointChart"></canvas>
             </div>
+            
+            <div class="chart-container">
+                <h2 class="chart-title">95th Percentile by Load Level</h2>
+                <canvas id="percentileChart"></canvas>
+            </div>
         </div>
         
-        <div class="legend">
-            <div class="legend-item">
-                <div class="legend-color" style="background: #667eea;"></div>
-                <span>10 Users (Baseline)</span>
+        <div class="chart-container">
+            <h2 class="chart-title">Endpoint Timelines</h2>
+            <div class="controls">
+                <select id="timelineEndpoint"></select>
+                <select id="timelinePercentile">
+                    <option value="p50">p50</option>
+                    <option value="p95" selected>p95</option>
+                    <option value="p99">p99</option>
+                </select>
             </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #f093fb;"></div>
-                <span>50 Users (Medium)</span>
-            </div>
-            <div class="legend-item">
-                <div class="legend-color" style="background: #ff6b6b;"></div>
-                <span>100 Users (Stress)</span>
+            <p class="empty" id="timelineEmpty">No stats_history CSVs found (run Locust with --csv-full-history).</p>
+            <div class="dashboard" id="timelineCharts">
+                <div><canvas id="percentileTimeline"></canvas></div>
+                <div><canvas id="throughputTimeline"></canvas></div>
             </div>
         </div>
     </div>
     
     <script>
-"""
-    
-    # Prepare data for Chart.js
-    endpoints = sorted(endpoints_data.keys())
-    data_10 = [endpoints_data[ep]['10'] for ep in endpoints]
-    data_50 = [endpoints_data[ep]['50'] for ep in endpoints]
-    data_100 = [endpoints_data[ep]['100'] for ep in endpoints]
-    
-    html += f"""
-        // Response Time Chart
-        const ctx1 = document.getElementById('responseTimeChart').getContext('2d');
-        new Chart(ctx1, {{
-            type: 'bar',
-            data: {{
-                labels: {endpoints},
-                datasets: [
-                    {{
-                        label: '10 Users',
-                        data: {data_10},
-                        backgroundColor: 'rgba(102, 126, 234, 0.8)',
-                        borderColor: 'rgba(102, 126, 234, 1)',
-                        borderWidth: 2
-                    }},
-                    {{
-                        label: '50 Users',
-                        data: {data_50},
-                        backgroundColor: 'rgba(240, 147, 251, 0.8)',
-                        borderColor: 'rgba(240, 147, 251, 1)',
-                        borderWidth: 2
-                    }},
-                    {{
-                        label: '100 Users',
-                        data: {data_100},
-                        backgroundColor: 'rgba(255, 107, 107, 0.8)',
-                        borderColor: 'rgba(255, 107, 107, 1)',
-                        borderWidth: 2
-                    }}
-                ]
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        position: 'top',
-                        labels: {{
-                            font: {{
-                                size: 14
-                            }}
-                        }}
-                    }},
-                    title: {{
-                        display: true,
-                        text: 'Average Response Time (ms)',
-                        font: {{
-                            size: 16
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: 'Response Time (ms)'
-                        }}
-                    }},
-                    x: {{
-                        ticks: {{
-                            autoSkip: false,
-                            maxRotation: 45,
-                            minRotation: 45
-                        }}
-                    }}
-                }}
-            }}
-        }});
-        
-        // Endpoint Comparison Chart
-        const ctx2 = document.getElementById('endpointChart').getContext('2d');
-        new Chart(ctx2, {{
-            type: 'line',
-            data: {{
-                labels: ['10 Users', '50 Users', '100 Users'],
-                datasets: {[
-                    {
-                        'label': f"'{ep}'",
-                        'data': [endpoints_data[ep]['10'], endpoints_data[ep]['50'], endpoints_data[ep]['100']],
-                        'borderWidth': 3,
-                        'tension': 0.4
-                    } for ep in endpoints[:5]  # Top 5 endpoints only
-                ]}
-            }},
-            options: {{
-                responsive: true,
-                plugins: {{
-                    legend: {{
-                        position: 'top'
-                    }},
-                    title: {{
-                        display: true,
-                        text: 'Performance Degradation Trends',
-                        font: {{
-                            size: 16
-                        }}
-                    }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        title: {{
-                            display: true,
-                            text: 'Response Time (ms)'
-                        }}
-                    }}
-                }}
-            }}
-        }});
+__CHART_LIB__
+    </script>
+    <script type="application/json" id="dashboardData">__DASHBOARD_DATA__</script>
+    <script>
+        (function () {
+            var data = JSON.parse(document.getElementById('dashboardData').textContent);
+            var runColors = MiniChart.palette(data.runs.length);
+            var runLabel = function (run) { return run + ' Users'; };
+            
+            function element(tag, className, text, style) {
+                var node = document.createElement(tag);
+                if (className) node.className = className;
+                if (text !== undefined) node.textContent = text;
+                if (style) node.style.cssText = style;
+                return node;
+            }
+            
+            // Summary cards
+            var grid = document.getElementById('statsGrid');
+            data.summary.forEach(function (s) {
+                var card = element('div', 'stat-card');
+                card.appendChild(element('div', 'stat-label', runLabel(s.run) + ' Load'));
+                card.appendChild(element('div', 'stat-value', s.requests.toLocaleString()));
+                card.appendChild(element('div', 'stat-label', 'Total Requests'));
+                card.appendChild(element('div', 'stat-value', s.rps.toFixed(1), 'font-size: 1.5em; margin-top: 10px;'));
+                card.appendChild(element('div', 'stat-label', 'RPS'));
+                grid.appendChild(card);
+            });
+            
+            function runBars(values) {
+                return data.runs.map(function (run, i) {
+                    return { label: runLabel(run), data: values[run], color: runColors[i] };
+                });
+            }
+            
+            MiniChart.bar(document.getElementById('responseTimeChart'), {
+                title: 'Average Response Time (ms)',
+                yLabel: 'Response Time (ms)',
+                labels: data.endpoints,
+                datasets: runBars(data.avg_time)
+            });
+            
+            MiniChart.bar(document.getElementById('percentileChart'), {
+                title: 'p95 Response Time (ms)',
+                yLabel: 'Response Time (ms)',
+                labels: data.endpoints,
+                datasets: runBars(data.p95)
+            });
+            
+            // Degradation trend: one line per endpoint across load levels
+            var endpointColors = MiniChart.palette(data.endpoints.length);
+            MiniChart.line(document.getElementById('endpointChart'), {
+                title: 'Performance Degradation Trends',
+                yLabel: 'Response Time (ms)',
+                xTicks: data.runs.map(runLabel),
+                datasets: data.endpoints.map(function (endpoint, e) {
+                    var points = [];
+                    data.runs.forEach(function (run, i) {
+                        var value = data.avg_time[run][e];
+                        if (value !== null) points.push([i, value]);
+                    });
+                    return { label: endpoint, points: points, color: endpointColors[e] };
+                })
+            });
+            
+            // Per-endpoint timelines (rendered on demand so many endpoints stay cheap)
+            var timelineNames = Object.keys(data.timelines).sort();
+            var endpointSelect = document.getElementById('timelineEndpoint');
+            var percentileSelect = document.getElementById('timelinePercentile');
+            
+            if (!timelineNames.length) {
+                document.getElementById('timelineCharts').style.display = 'none';
+                document.querySelector('.controls').style.display = 'none';
+                return;
+            }
+            document.getElementById('timelineEmpty').style.display = 'none';
+            
+            timelineNames.forEach(function (name) {
+                endpointSelect.appendChild(element('option', null, name));
+            });
+            endpointSelect.value = timelineNames.indexOf('Aggregated') >= 0 ? 'Aggregated' : timelineNames[0];
+            
+            function timelineSeries(endpoint, metric) {
+                var runs = data.timelines[endpoint];
+                return data.runs.filter(function (run) { return runs[run]; }).map(function (run) {
+                    return {
+                        label: runLabel(run),
+                        points: runs[run][metric],
+                        color: runColors[data.runs.indexOf(run)]
+                    };
+                });
+            }
+            
+            function renderTimelines() {
+                var endpoint = endpointSelect.value;
+                var percentile = percentileSelect.value;
+                MiniChart.line(document.getElementById('percentileTimeline'), {
+                    title: endpoint + ' - ' + percentile + ' response time (ms)',
+                    xLabel: 'Seconds since start',
+                    yLabel: 'Response Time (ms)',
+                    datasets: timelineSeries(endpoint, percentile)
+                });
+                MiniChart.line(document.getElementById('throughputTimeline'), {
+                    title: endpoint + ' - throughput (requests/s)',
+                    xLabel: 'Seconds since start',
+                    yLabel: 'Requests/s',
+                    datasets: timelineSeries(endpoint, 'rps')
+                });
+            }
+            
+            endpointSelect.onchange = renderTimelines;
+            percentileSelect.onchange = renderTimelines;
+            renderTimelines();
+        })();
     </script>
 </body>
 </html>
 """
+
+
+def generate_chart_html(all_stats, histories=None, timelines=None):
+    """Generate a self-contained interactive HTML dashboard"""
+    with open(CHART_LIB_PATH, 'r', encoding='utf-8') as f:
+        chart_lib = f.read()
     
-    return html
+    data = build_dashboard_data(all_stats, histories, timelines)
+    # Compact JSON; escape '</' so the blob can't close its <script> tag
+    data_json = json.dumps(data, separators=(',', ':')).replace('</', '<\\/')
+    
+    return (
+        DASHBOARD_TEMPLATE
+        .replace('__CHART_LIB__', chart_lib)
+        .replace('__DASHBOARD_DATA__', data_json)
+    )
 
 
-def main():
-    """Main chart generation function"""
+def history_path_for(stats_path):
+    """stats_history CSV written alongside a stats CSV"""
+    return stats_path[:-len('_stats.csv')] + '_stats_history.csv'
+
+
+def read_timelines(path):
+    """Parse a stats_history CSV straight into its downsampled timelines"""
+    return downsample_history(parse_stats_history(path))
+
+
+def build_dashboard(cache, verbose=True):
+    """
+    Build reports/dashboard.html incrementally.
+    
+    Parsed stats and downsampled timelines are reused from the build cache
+    per input file; nothing is written if the dashboard is current.
+    With verbose False (watch mode) "no results"/"up to date" are not printed.
+    
+    Returns:
+        bool: True if the dashboard was (re)written
+    """
+    csv_files = find_latest_results()
+    if not csv_files:
+        if verbose:
+            print("❌ No results found!")
+        return False
+    
+    # Inputs: every run's CSVs and the chart library (the template is part of the cache's sources)
+    inputs = []
+    for users, path in csv_files.items():
+        history_path = history_path_for(path)
+        history = cache.digest(history_path) if os.path.exists(history_path) else None
+        inputs.append(f"{users}:{cache.digest(path)}:{history}")
+    dashboard_key = cache.key(*inputs, cache.digest(CHART_LIB_PATH), MAX_POINTS_PER_SERIES)
+    
+    if cache.is_current(OUTPUT_FILE, dashboard_key):
+        cache.save(prune=False)
+        if verbose:
+            print(f"✅ {OUTPUT_FILE} is up to date")
+        return False
+    
     print("=" * 60)
     print("PERFORMANCE CHARTS GENERATOR")
     print("=" * 60)
     print()
     
-    # Find latest results
-    csv_files = find_latest_results()
-    
-    # Parse all stats
+    # Parse all stats (unchanged runs come from the cache)
     all_stats = {}
+    timelines = {}
     for users, path in csv_files.items():
-        if path:
-            all_stats[users] = parse_csv_stats(path)
-            print(f"✅ Parsed {users} users results")
-    
-    if not all_stats:
-        print("❌ No results found!")
-        return
+        all_stats[users] = cache.load(path, parse_csv_stats, "stats")
+        print(f"✅ Parsed {users} users results")
+        history_path = history_path_for(path)
+        if os.path.exists(history_path):
+            timelines[users] = cache.load(history_path, read_timelines, "timeline")
     
     # Generate HTML chart
     print("\nGenerating interactive dashboard...")
-    html = generate_chart_html(all_stats)
+    html = generate_chart_html(all_stats, timelines=timelines)
     
     # Write to file
-    output_file = "reports/dashboard.html"
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         f.write(html)
+    cache.record(OUTPUT_FILE, dashboard_key)
+    cache.save()
     
-    print(f"✅ Dashboard generated: {output_file}")
+    print(f"✅ Dashboard generated: {OUTPUT_FILE} ({len(html.encode('utf-8')) / 1024:.0f} KB, works offline; "
+          f"{cache.hits} cached, {cache.misses} parsed)")
     print()
     print("Open in browser:")
-    print(f"  file:///{os.path.abspath(output_file)}")
-    print()
-    print("Or use Python server:")
-    print("  cd reports")
-    print("  python -m http.server 8000")
-    print("  http://localhost:8000/dashboard.html")
+    print(f"  file:///{os.path.abspath(OUTPUT_FILE)}")
     print()
     print("=" * 60)
+    return True
+
+
+def main():
+    """Main chart generation function"""
+    parser = argparse.ArgumentParser(description="Generate the offline HTML dashboard (reports/dashboard.html)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and update the dashboard as new results are written")
+    parser.add_argument("--interval", type=float, default=2.0, help="Watch polling interval in seconds")
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild everything (build cache not read or written)")
+    args = parser.parse_args()
+    
+    def build():
+        # Fresh cache per build so entries only earlier builds used get pruned
+        cache = BuildCache("generate_charts", REPORTS_DIR, enabled=not args.no_cache,
+                           sources=[os.path.abspath(__file__)])
+        return build_dashboard(cache, verbose=not args.watch)
+    
+    if args.watch:
+        watch(build, args.interval)
+    else:
+        build()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
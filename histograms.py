@@ -0,0 +1,64 @@
+"""
+Latency Histograms
+Compact bucketed histograms for streaming percentile aggregation
+"""
+
+
+class Histogram:
+    """
+    Bucketed latency histogram.
+
+    Values are rounded like Locust's response time buckets (coarser as values
+    grow), so memory stays bounded no matter how many samples are recorded.
+    """
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def bucket(value):
+        """Bucket key for a value in ms"""
+        if value < 10:
+            return round(value, 1)
+        if value < 100:
+            return round(value)
+        if value < 1000:
+            return round(value, -1)
+        if value < 10000:
+            return round(value, -2)
+        return round(value, -3)
+
+    def record(self, value):
+        key = self.bucket(value)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction):
+        """Value at the given percentile (0.95 = p95), or 0 if empty"""
+        if not self.count:
+            return 0.0
+
+        threshold = fraction * self.count
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= threshold:
+                return key
+        return self.max
@@ -0,0 +1,140 @@
+"""
+User Journeys
+Multi-step flows whose later steps use data extracted from earlier responses
+(list posts -> open one -> read its comments -> ...). Each run is reported as
+one JOURNEY entry (end-to-end latency) alongside the per-request stats, so
+SLA_SPECS, the CSV reports and analyze_results cover journeys unchanged.
+
+The steps are already counted as requests, so a journey is logged to its own
+stats entry only: it stays out of the Aggregated row, the request listeners
+and every total built from them.
+"""
+import time
+
+from locust.stats import StatsError
+
+from locustfile import on_journey, parsed_json
+
+REQUEST_TYPE = "JOURNEY"
+
+
+class JourneyError(Exception):
+    """A journey step failed; the message names the step"""
+
+
+class Step:
+    """One request of a journey"""
+    __slots__ = ("method", "path", "name", "expected_status", "required_keys", "body", "check", "extract")
+
+    def __init__(self, method, path, name, expected_status=200, required_keys=None, body=None, check=None,
+                 extract=None):
+        """
+        Args:
+            method: HTTP method
+            path: URL path formatted with the journey state, e.g. "/posts/{post_id}"
+            name: Stats entry name (same names as the JSONPlaceholderUser tasks)
+            expected_status: Expected status code
+            required_keys: List of keys expected in the JSON response
+            body: Optional callable(state) returning the JSON payload
+            check: Optional callable(data, state) returning an extra failure message
+            extract: {state_key: callable(data)} - values later steps need
+        """
+        self.method = method
+        self.path = path
+        self.name = name
+        self.expected_status = expected_status
+        self.required_keys = required_keys
+        self.body = body
+        self.check = check
+        self.extract = extract or {}
+
+
+class Journey:
+    """Named sequence of steps, picked by weight like a task"""
+    __slots__ = ("name", "steps", "weight")
+
+    def __init__(self, name, steps, weight=1):
+        self.name = name
+        self.steps = steps
+        self.weight = weight
+
+
+def run_step(user, step, state):
+    """
+    Send one step, validate it and extract values into state.
+
+    Returns:
+        tuple: (failure message or None, response length)
+    """
+    kwargs = {"json": step.body(state)} if step.body else {}
+
+    with user.client.request(step.method, step.path.format_map(state), catch_response=True,
+                             name=step.name, **kwargs) as response:
+        length = len(response.content or b"")
+        if not user.validate_response(response, step.path, step.method, step.expected_status, step.required_keys):
+            return "request failed", length
+
+        # Same parse validate_response used: no second json.loads
+        data = parsed_json(response)
+        error = step.check(data, state) if step.check else None
+        if error is None:
+            for key, extractor in step.extract.items():
+                try:
+                    state[key] = extractor(data)
+                except (LookupError, TypeError, ValueError) as e:
+                    error = f"could not extract '{key}': {e}"
+                    break
+        if error:
+            response.failure(error)
+        return error, length
+
+
+def report_journey(environment, journey, response_time, length, exception):
+    """Log one run to the journey's stats entry (not the total) and its SLA windows"""
+    stats = environment.stats
+    name = f"{REQUEST_TYPE} {journey.name}"
+    entry = stats.get(name, REQUEST_TYPE)
+    entry.log(response_time, length)
+    if exception is not None:
+        # The failed step was already counted as a request failure; this one
+        # is the journey's, so it goes to the entry and errors table only
+        entry.log_error(exception)
+        key = StatsError.create_key(REQUEST_TYPE, name, exception)
+        error = stats.errors.get(key)
+        if error is None:
+            error = stats.errors[key] = StatsError(REQUEST_TYPE, name, exception)
+        error.occurred()
+    on_journey(name, response_time, exception)
+
+
+def run_journey(user, journey):
+    """
+    Run every step in order (stopping at the first failure) and report the
+    journey with its end-to-end time.
+
+    State holds only the extracted values and lives for a single run.
+    """
+    state = {}
+    total_length = 0
+    exception = None
+    start = time.perf_counter()
+
+    for step in journey.steps:
+        error, length = run_step(user, step, state)
+        total_length += length
+        if error:
+            exception = JourneyError(f"{step.name}: {error}")
+            break
+
+    report_journey(user.environment, journey, (time.perf_counter() - start) * 1000, total_length, exception)
+
+
+def journey_tasks(journeys):
+    """Locust tasks dict {task: weight}, one task per journey"""
+    tasks = {}
+    for journey in journeys:
+        def journey_task(user, journey=journey):
+            run_journey(user, journey)
+        journey_task.__name__ = f"journey_{journey.name}"
+        tasks[journey_task] = journey.weight
+    return tasks
@@ -4,45 +4,114 @@ Advanced features: Custom metrics, SLA assertions, event hooks
 Author: Your Name
 Date: 2024-02-07
 """
-from locust import HttpUser, task, between, events
+from locust import HttpUser, task, events
 from locust.runners import MasterRunner
+from locust.util.timespan import parse_timespan
 import logging
 import time
 import random
+from connection_policy import apply_connection_policy, PHASES
+from histograms import Histogram
+from sla import WindowedSLA, spec_for, describe_spec
+from pacing import make_wait_time, track_tasks, describe as describe_pacing
 from config import (
     API_BASE_URL, 
     SLA_THRESHOLDS, 
+    SIZE_BUDGETS,
     ENABLE_ASSERTIONS,
     ENABLE_DETAILED_LOGGING,
     LOG_LEVEL,
     LOG_FORMAT,
-    LOG_DATE_FORMAT
+    LOG_DATE_FORMAT,
+    CONNECTION_STRATEGY,
+    CONNECTION_CLOSE_AFTER,
+    CONNECTION_POOL_SIZE,
+    ENABLE_PHASE_TIMING,
+    RESPONSE_COMPRESSION,
+    PACING,
+    SCENARIOS
 )
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOG_LEVEL),
-    format=LOG_FORMAT,
-    datefmt=LOG_DATE_FORMAT
-)
 logger = logging.getLogger(__name__)
 
 # Global metrics storage
 custom_metrics = {
     "sla_violations": 0,
-    "slow_requests": []
+    "slow_requests": [],
+    "connections": {},
+    "phases": {},
+    "payloads": {},
+    "sla_windows": {}
 }
 
+# Requests completing before this time (warm-up) are not counted in custom_metrics
+warmup = {"until": 0.0}
+
+
+@events.init_command_line_parser.add_listener
+def on_init_command_line_parser(parser):
+    """Register custom command line options"""
+    parser.add_argument(
+        "--warmup",
+        type=str,
+        env_var="LOCUST_WARMUP",
+        default="0s",
+        help="Warm-up period excluded from SLA/slow-request metrics (e.g. 10s, 1m)"
+    )
+    parser.add_argument(
+        "--scenario",
+        type=str,
+        env_var="LOCUST_SCENARIO",
+        default="",
+        help="Scenario in config.SCENARIOS whose pacing (think-time model) users follow"
+    )
+
+
+def scenario_pacing(environment):
+    """Pacing spec for the --scenario option (config.PACING if unset or unknown)"""
+    name = environment.parsed_options.scenario if environment.parsed_options is not None else ""
+    if name and name not in SCENARIOS:
+        logger.warning(f"Unknown scenario '{name}', using default pacing")
+    return SCENARIOS.get(name, {}).get("pacing", PACING)
+
 
 # Event Hooks - Lifecycle Management
+@events.init.add_listener
+def on_init(environment, **kwargs):
+    """Configure logging, unless Locust already did"""
+    # Locust's CLI sets up its own handlers (--loglevel, --logfile) after importing
+    # this file, so configuring at import only added startup work it then replaced
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=getattr(logging, LOG_LEVEL),
+            format=LOG_FORMAT,
+            datefmt=LOG_DATE_FORMAT
+        )
+
+
 @events.test_start.add_listener
 def on_test_start(environment, **kwargs):
     """Called when test starts - setup phase"""
+    warmup_seconds = 0
+    if environment.parsed_options is not None:
+        warmup_seconds = parse_timespan(environment.parsed_options.warmup)
+    warmup["until"] = time.time() + warmup_seconds
+    
+    pacing = scenario_pacing(environment)
+    for user_class in environment.user_classes:
+        if issubclass(user_class, JSONPlaceholderBaseUser):
+            user_class.pacing = pacing
+            user_class.wait_time = make_wait_time(pacing)
+    
     logger.info("=" * 60)
     logger.info("PERFORMANCE TEST STARTED")
     logger.info("=" * 60)
     logger.info(f"Target: {API_BASE_URL}")
     logger.info(f"SLA Assertions: {'ENABLED' if ENABLE_ASSERTIONS else 'DISABLED'}")
+    logger.info(f"Connection Strategy: {CONNECTION_STRATEGY} (pool size: {CONNECTION_POOL_SIZE})")
+    logger.info(f"Accept-Encoding: {RESPONSE_COMPRESSION or 'client default'}")
+    logger.info(f"Warm-up (excluded from metrics): {warmup_seconds}s")
+    logger.info(f"Pacing: {describe_pacing(pacing)}")
     logger.info("=" * 60)
 
 
@@ -60,13 +129,161 @@ def on_test_stop(environment, **kwargs):
         for req in sorted(custom_metrics['slow_requests'], key=lambda x: x['time'], reverse=True)[:5]:
             logger.warning(f"  - {req['method']} {req['name']}: {req['time']:.2f}ms")
     
+    if custom_metrics['connections']:
+        logger.info("Connection setup vs request time:")
+        for name, conn in sorted(custom_metrics['connections'].items()):
+            avg_setup = conn['setup_time'] / conn['new_connections'] if conn['new_connections'] else 0
+            avg_request = conn['request_time'] / conn['requests']
+            reuse_rate = (1 - conn['new_connections'] / conn['requests']) * 100
+            logger.info(
+                f"  - {name}: {conn['new_connections']} new connections, "
+                f"avg setup {avg_setup:.2f}ms, avg request {avg_request:.2f}ms, "
+                f"reuse {reuse_rate:.1f}%"
+            )
+    
+    if custom_metrics['phases']:
+        logger.info("Latency phase breakdown (mean / p95 ms):")
+        for name, phases in sorted(custom_metrics['phases'].items()):
+            breakdown = ", ".join(
+                f"{phase} {hist.mean():.1f}/{hist.percentile(0.95):.0f}" for phase, hist in phases.items()
+            )
+            logger.info(f"  - {name}: {breakdown} -> {phase_bottleneck(phases)}")
+    
+    if custom_metrics['payloads']:
+        logger.info("Payload sizes and throughput:")
+        # Throughput over the measured part of the test (after warm-up), not per-endpoint activity
+        duration = time.time() - warmup["until"]
+        for name, payload in sorted(custom_metrics['payloads'].items()):
+            sizes = payload['sizes']
+            throughput = f"{payload['bytes'] / duration / 1024:,.1f} KB/s" if duration > 0 else "n/a"
+            if payload['measured']:
+                compression = payload['wire_bytes'] / payload['measured_bytes'] if payload['measured_bytes'] else 1
+                wire = (f"wire/decoded {compression:.2f}, "
+                        f"decompress {payload['decompress_time'] / payload['measured']:.3f}ms/req")
+            else:
+                # The HTTP client decoded the body itself (client default Accept-Encoding)
+                wire = "wire/decoded not measured"
+            logger.info(
+                f"  - {name}: avg {sizes.mean():,.0f}B, p95 {sizes.percentile(0.95):,.0f}B, "
+                f"{throughput}, {wire}, over budget {payload['over_budget']}"
+            )
+    
+    if custom_metrics['sla_windows']:
+        logger.info("Percentile SLAs (windows passed / evaluated):")
+        for name, tracker in sorted(custom_metrics['sla_windows'].items()):
+            if tracker is None:
+                continue
+            tracker.close(time.time())
+            evaluated = tracker.complete_windows()
+            failed = tracker.failed_windows()
+            partial = len(tracker.windows) - len(evaluated)
+            status = ('FAIL' if failed else 'PASS') if evaluated else 'NOT EVALUATED (no complete window)'
+            log = logger.error if failed else logger.info
+            log(
+                f"  - {name} [{describe_spec(tracker.spec)}]: "
+                f"{len(evaluated) - len(failed)}/{len(evaluated)} -> {status}"
+                + (f" ({partial} partial window skipped)" if partial else "")
+            )
+    
     logger.info("=" * 60)
 
 
+def phase_bottleneck(phases):
+    """Classify where an endpoint spends most of its time"""
+    network = sum(phases[p].mean() for p in ("dns", "connect", "tls"))
+    backend = phases['ttfb'].mean()
+    transfer = phases['download'].mean()
+    
+    largest = max(network, backend, transfer)
+    if largest == transfer:
+        return "transfer-bound"
+    if largest == network:
+        return "network/connection-bound"
+    return "backend-bound"
+
+
+def size_budget(request_type, name):
+    """Payload budget in bytes for a request name like 'GET /posts', or None"""
+    return SIZE_BUDGETS.get(request_type, {}).get(name.split(" ", 1)[-1])
+
+
+def metric_key(request_type, name):
+    """
+    Custom metrics key for a request. Stats names already carry the method
+    ('GET /posts'); bare names ('/posts') get it prepended.
+    """
+    return name if name.startswith(f"{request_type} ") else f"{request_type} {name}"
+
+
+def format_phases(timings):
+    """One-line phase breakdown for log messages"""
+    return ", ".join(f"{phase} {timings[phase]:.1f}ms" for phase in PHASES)
+
+
 @events.request.add_listener
 def on_request(request_type, name, response_time, response_length, exception, **kwargs):
     """Called after each request - custom metrics tracking"""
     
+    # Ramp-up traffic is still in Locust's stats, but not in the custom metrics
+    if time.time() < warmup["until"]:
+        return
+    
+    key = metric_key(request_type, name)
+    
+    # Track connection setup time versus total request time
+    response = kwargs.get('response')
+    if response is not None and hasattr(response, 'connection_setup_time'):
+        conn = custom_metrics['connections'].get(key)
+        if conn is None:
+            conn = custom_metrics['connections'][key] = {
+                'requests': 0,
+                'new_connections': 0,
+                'setup_time': 0.0,
+                'request_time': 0.0
+            }
+        conn['requests'] += 1
+        conn['new_connections'] += response.new_connections
+        conn['setup_time'] += response.connection_setup_time
+        conn['request_time'] += response_time
+    
+    # Aggregate per-phase latency into histograms
+    timings = getattr(response, 'phase_timings', None)
+    if timings is not None:
+        phases = custom_metrics['phases'].get(key)
+        if phases is None:
+            phases = custom_metrics['phases'][key] = {phase: Histogram() for phase in PHASES}
+        for phase in PHASES:
+            phases[phase].record(timings[phase])
+    
+    # Payload sizes (decoded) and bytes on the wire, for bytes/s and budget checks.
+    # Wire size is only known when the connection policy read the body itself
+    payload = custom_metrics['payloads'].get(key)
+    if payload is None:
+        payload = custom_metrics['payloads'][key] = {
+            'sizes': Histogram(),
+            'bytes': 0,
+            'measured': 0,
+            'measured_bytes': 0,
+            'wire_bytes': 0,
+            'decompress_time': 0.0,
+            'over_budget': 0,
+            'budget': size_budget(request_type, name)
+        }
+    payload['sizes'].record(response_length)
+    payload['bytes'] += response_length
+    wire_length = getattr(response, 'wire_length', None)
+    if wire_length is not None:
+        payload['measured'] += 1
+        payload['measured_bytes'] += response_length
+        payload['wire_bytes'] += wire_length
+        payload['decompress_time'] += response.decompress_time
+    if payload['budget'] is not None and response_length > payload['budget']:
+        payload['over_budget'] += 1
+    
+    # Percentile SLAs: streaming per-window histograms, evaluated as windows close
+    if ENABLE_ASSERTIONS:
+        record_sla_window(key, request_type, name, response_time, exception is not None)
+    
     # Track slow requests (> 2 seconds)
     if response_time > 2000:
         custom_metrics['slow_requests'].append({
@@ -75,7 +292,7 @@ def on_request(request_type, name, response_time, response_length, exception, **
             'time': response_time
         })
         if ENABLE_DETAILED_LOGGING:
-            logger.warning(f"SLOW REQUEST: {request_type} {name} took {response_time:.2f}ms")
+            logger.warning(f"SLOW REQUEST: {key} took {response_time:.2f}ms")
     
     # SLA Validation
     if ENABLE_ASSERTIONS and not exception:
@@ -92,26 +309,246 @@ def on_request(request_type, name, response_time, response_length, exception, **
         if sla_limit and response_time > sla_limit:
             custom_metrics['sla_violations'] += 1
             logger.error(
-                f"SLA VIOLATION: {request_type} {name} "
+                f"SLA VIOLATION: {key} "
                 f"took {response_time:.2f}ms (limit: {sla_limit}ms)"
+                + (f" [{format_phases(timings)}]" if timings is not None else "")
             )
 
 
-class JSONPlaceholderUser(HttpUser):
+def record_sla_window(key, request_type, name, response_time, failed):
+    """Add one result to its percentile SLA tracker (created on first use, None if no spec)"""
+    now = time.time()
+    if key in custom_metrics['sla_windows']:
+        tracker = custom_metrics['sla_windows'][key]
+    else:
+        spec = spec_for(request_type, name)
+        tracker = custom_metrics['sla_windows'][key] = WindowedSLA(spec, now) if spec else None
+    
+    if tracker is not None:
+        window = tracker.record(now, response_time, failed)
+        if window and window['violations']:
+            logger.error(
+                f"SLA WINDOW FAILED: {key} window +{window['start']:.0f}s "
+                f"({window['requests']} requests): {'; '.join(window['violations'])}"
+            )
+
+
+def on_journey(name, response_time, exception):
+    """
+    Custom metrics for one journey run (locustfile_journeys.py).
+    
+    Journeys are not request events, so only the metrics that apply to them
+    are kept here: their percentile SLA windows (SLA_SPECS["JOURNEY"]).
+    """
+    if time.time() < warmup["until"] or not ENABLE_ASSERTIONS:
+        return
+    record_sla_window(name, "JOURNEY", name, response_time, exception is not None)
+
+
+_UNPARSED = object()
+
+
+def parsed_json(response):
+    """
+    Response body as JSON, parsed at most once and kept on the response.
+    
+    Validation, task checks and journey steps all share the same parse.
     """
-    Advanced Locust user with SLA validation and custom metrics.
+    data = getattr(response, '_parsed_json', _UNPARSED)
+    if data is _UNPARSED:
+        data = response._parsed_json = response.json()
+    return data
+
+
+def response_error(status_code, load_json, expected_status=200, required_keys=None):
+    """
+    Status and JSON structure checks shared by every user implementation.
+    
+    Args:
+        status_code: Actual HTTP status code
+        load_json: Callable returning the parsed JSON body
+        expected_status: Expected status code
+        required_keys: List of keys expected in the JSON response
+        
+    Returns:
+        str: Failure message, or None if the response is valid
+    """
+    # Status code validation
+    if status_code != expected_status:
+        return f"Expected {expected_status}, got {status_code}"
+        
+    if required_keys is not None:
+        try:
+            data = load_json()
+            if not data:
+                return "Empty or null JSON response"
+                
+            if isinstance(data, list):
+                if len(data) == 0:
+                    return "Empty array response"
+                item = data[0]
+            else:
+                item = data
+                
+            missing_keys = [k for k in required_keys if k not in item]
+            if missing_keys:
+                return f"Missing required fields: {missing_keys}"
+        except Exception as e:
+            return f"Invalid JSON: {str(e)}"
+    
+    return None
+
+
+class TaskRequest:
+    """One request sent by a task, with the checks applied to its response"""
+    __slots__ = ("method", "url", "name", "expected_status", "required_keys", "json", "check")
+
+    def __init__(self, method, url, name, expected_status=200, required_keys=None, json=None, check=None):
+        """
+        Args:
+            method: HTTP method
+            url: Path relative to the host
+            name: Stats entry name
+            expected_status: Expected status code
+            required_keys: List of keys expected in the JSON response
+            json: Optional JSON payload
+            check: Optional callable(data) returning an extra failure message
+        """
+        self.method = method
+        self.url = url
+        self.name = name
+        self.expected_status = expected_status
+        self.required_keys = required_keys
+        self.json = json
+        self.check = check
+
+    def kwargs(self):
+        """Extra keyword arguments for the HTTP client's request()"""
+        return {"json": self.json} if self.json is not None else {}
+
+
+def all_posts_request():
+    return TaskRequest("GET", "/posts", "GET /posts", required_keys=["id", "title"])
+
+
+def single_post_request():
+    post_id = random.randint(1, 100)
+    return TaskRequest("GET", f"/posts/{post_id}", "GET /posts/1", required_keys=["id", "title", "body", "userId"])
+
+
+def comments_request():
+    post_id = random.randint(1, 100)
+    return TaskRequest(
+        "GET", f"/comments?postId={post_id}", "GET /comments",
+        required_keys=["id", "postId", "name", "email", "body"]
+    )
+
+
+def create_post_request():
+    payload = {
+        "title": "Performance Test Post",
+        "body": "This is a test post created during load testing",
+        "userId": random.randint(1, 10)
+    }
+    return TaskRequest("POST", "/posts", "POST /posts", expected_status=201, required_keys=["id"], json=payload)
+
+
+def update_post_request():
+    post_id = random.randint(1, 100)
+    payload = {
+        "id": post_id,
+        "title": "Updated Performance Test Post",
+        "body": "This post was updated during load testing",
+        "userId": random.randint(1, 10)
+    }
+    return TaskRequest("PUT", f"/posts/{post_id}", "PUT /posts/1", required_keys=["id"], json=payload)
+
+
+def users_request():
+    return TaskRequest("GET", "/users", "GET /users", required_keys=["id", "email"])
+
+
+def user_detail_request():
+    user_id = random.randint(1, 10)
+    return TaskRequest(
+        "GET", f"/users/{user_id}", "GET /users/1", required_keys=["id", "name", "email", "address", "company"]
+    )
+
+
+def albums_request():
+    return TaskRequest("GET", "/albums", "GET /albums", required_keys=["id", "userId"])
+
+
+def user_posts_request():
+    user_id = random.randint(1, 10)
+
+    def check(posts):
+        # All posts must belong to user_id (not hardcoded 1)
+        if any(post.get("userId") != user_id for post in posts):
+            return f"Posts contain wrong userId (expected {user_id})"
+        return None
+
+    return TaskRequest(
+        "GET", f"/posts?userId={user_id}", "GET /posts?userId=1",
+        required_keys=["id", "userId", "title"], check=check
+    )
+
+
+# Request builder of every JSONPlaceholderUser task, by task name. The asyncio
+# user (locustfile_async.py) runs the same requests with the same weights.
+TASK_REQUESTS = {
+    "get_all_posts": all_posts_request,
+    "get_single_post": single_post_request,
+    "get_comments": comments_request,
+    "create_post": create_post_request,
+    "update_post": update_post_request,
+    "get_users": users_request,
+    "get_user_detail": user_detail_request,
+    "get_albums": albums_request,
+    "get_user_posts": user_posts_request,
+}
+
+
+class JSONPlaceholderBaseUser(HttpUser):
+    """
+    Advanced Locust user with SLA validation and custom metrics, without tasks.
+    
+    Subclasses supply the tasks: JSONPlaceholderUser's single requests, or
+    JourneyUser's journeys (Locust merges base-class tasks into subclasses,
+    so the two can't derive from one another).
     
     Features:
     - Response time assertions
     - Detailed logging
     - Custom metrics tracking
     - Event hooks
+    - Configurable connection reuse policy
+    - Optional latency phase timing (DNS, connect, TLS, TTFB, download)
+    - Optional response compression negotiation (Accept-Encoding)
+    - Think-time/pacing model per scenario (config.PACING / SCENARIOS)
     """
-    wait_time = between(1, 3)
+    abstract = True
+    pacing = PACING
+    wait_time = make_wait_time(PACING)
     host = API_BASE_URL
     
+    # Connection reuse policy (override in subclasses for other load shapes)
+    connection_strategy = CONNECTION_STRATEGY
+    connection_close_after = CONNECTION_CLOSE_AFTER
+    connection_pool_size = CONNECTION_POOL_SIZE
+    phase_timing = ENABLE_PHASE_TIMING
+    accept_encoding = RESPONSE_COMPRESSION or None
+    
     def on_start(self):
         """Called when a user starts"""
+        apply_connection_policy(
+            self.client,
+            self.connection_strategy,
+            self.connection_close_after,
+            self.connection_pool_size,
+            self.phase_timing,
+            self.accept_encoding
+        )
         if ENABLE_DETAILED_LOGGING:
             logger.info(f"User started (total active: {self.environment.runner.user_count})")
     
@@ -130,48 +567,54 @@ class JSONPlaceholderUser(HttpUser):
         Returns:
             bool: True if validation passed
         """
-        # Status code validation
-        if response.status_code != expected_status:
-            response.failure(f"Expected {expected_status}, got {response.status_code}")
+        error = response_error(response.status_code, lambda: parsed_json(response), expected_status, required_keys)
+        if error:
+            response.failure(error)
             return False
-            
-        if required_keys is not None:
-            try:
-                data = response.json()
-                if not data:
-                    response.failure("Empty or null JSON response")
-                    return False
-                    
-                if isinstance(data, list):
-                    if len(data) == 0:
-                        response.failure("Empty array response")
-                        return False
-                    item = data[0]
-                else:
-                    item = data
-                    
-                missing_keys = [k for k in required_keys if k not in item]
-                if missing_keys:
-                    response.failure(f"Missing required fields: {missing_keys}")
-                    return False
-            except Exception as e:
-                response.failure(f"Invalid JSON: {str(e)}")
-                return False
 
         # Mark success here
         response.success()
         return True
     
     
+    def send(self, request):
+        """
+        Send a TaskRequest and validate the response.
+        
+        Returns:
+            bool: True if the response passed every check
+        """
+        with self.client.request(
+            request.method,
+            request.url,
+            catch_response=True,
+            name=request.name,
+            **request.kwargs()
+        ) as response:
+            if not self.validate_response(
+                response, request.name, request.method, request.expected_status, request.required_keys
+            ):
+                return False
+            if request.check is not None:
+                # JSON already parsed (and cached) by validate_response
+                error = request.check(parsed_json(response))
+                if error:
+                    response.failure(error)
+                    return False
+            return True
+
+
+@track_tasks
+class JSONPlaceholderUser(JSONPlaceholderBaseUser):
+    """Independent requests against every endpoint (TASK_REQUESTS), by weight"""
+    
     @task(3)
     def get_all_posts(self):
         """
         GET /posts - Browse all posts
         SLA: < 500ms
         """
-        endpoint = "/posts"
-        with self.client.get(endpoint, catch_response=True, name="GET /posts") as response:
-            self.validate_response(response, endpoint, "GET", required_keys=["id", "title"])
+        self.send(all_posts_request())
     
     
     @task(2)
@@ -180,10 +623,7 @@ class JSONPlaceholderUser(HttpUser):
         GET /posts/{id} - View specific post
         SLA: < 300ms
         """
-        post_id = random.randint(1, 100)
-        endpoint = f"/posts/{post_id}"
-        with self.client.get(endpoint, catch_response=True, name="GET /posts/1") as response:
-            self.validate_response(response, "/posts/1", "GET", required_keys=["id", "title", "body", "userId"])
+        self.send(single_post_request())
     
     
     @task(2)
@@ -192,14 +632,7 @@ class JSONPlaceholderUser(HttpUser):
         GET /comments?postId={id} - Read comments
         SLA: < 400ms
         """
-        post_id = random.randint(1, 100)
-        endpoint = "/comments"
-        with self.client.get(
-            f"{endpoint}?postId={post_id}", 
-            catch_response=True, 
-            name="GET /comments"
-        ) as response:
-            self.validate_response(response, endpoint, "GET", required_keys=["id", "postId", "name", "email", "body"])
+        self.send(comments_request())
     
     
     @task(1)
@@ -208,21 +641,7 @@ class JSONPlaceholderUser(HttpUser):
         POST /posts - Create new post
         SLA: < 1000ms
         """
-        endpoint = "/posts"
-        user_id = random.randint(1, 10)
-        payload = {
-            "title": "Performance Test Post",
-            "body": "This is a test post created during load testing",
-            "userId": user_id
-        }
-        
-        with self.client.post(
-            endpoint, 
-            json=payload, 
-            catch_response=True,
-            name="POST /posts"
-        ) as response:
-            self.validate_response(response, endpoint, "POST", expected_status=201, required_keys=["id"])
+        self.send(create_post_request())
     
     
     @task(1)
@@ -231,22 +650,7 @@ class JSONPlaceholderUser(HttpUser):
         PUT /posts/{id} - Update existing post
         SLA: < 800ms
         """
-        post_id = random.randint(1, 100)
-        endpoint = f"/posts/{post_id}"
-        payload = {
-            "id": post_id,
-            "title": "Updated Performance Test Post",
-            "body": "This post was updated during load testing",
-            "userId": random.randint(1, 10)
-        }
-        
-        with self.client.put(
-            endpoint,
-            json=payload,
-            catch_response=True,
-            name="PUT /posts/1"
-        ) as response:
-            self.validate_response(response, "/posts/1", "PUT", required_keys=["id"])
+        self.send(update_post_request())
 
     @task(2)
     def get_users(self):
@@ -254,9 +658,7 @@ class JSONPlaceholderUser(HttpUser):
         GET /users - Browse all users
         SLA: < 500ms
         """
-        endpoint = "/users"
-        with self.client.get(endpoint, catch_response=True, name="GET /users") as response:
-            self.validate_response(response, endpoint, "GET", required_keys=["id", "email"])
+        self.send(users_request())
     
     
     @task(1)
@@ -265,10 +667,7 @@ class JSONPlaceholderUser(HttpUser):
         GET /users/{id} - View specific user
         SLA: < 300ms
         """
-        user_id = random.randint(1, 10)
-        endpoint = f"/users/{user_id}"
-        with self.client.get(endpoint, catch_response=True, name="GET /users/1") as response:
-            self.validate_response(response, "/users/1", "GET", required_keys=["id", "name", "email", "address", "company"])
+        self.send(user_detail_request())
     
     
     @task(1)
@@ -277,9 +676,7 @@ class JSONPlaceholderUser(HttpUser):
         GET /albums - Browse all albums
         SLA: < 500ms
         """
-        endpoint = "/albums"
-        with self.client.get(endpoint, catch_response=True, name="GET /albums") as response:
-            self.validate_response(response, endpoint, "GET", required_keys=["id", "userId"])
+        self.send(albums_request())
     
     
     @task(1)
@@ -288,20 +685,4 @@ class JSONPlaceholderUser(HttpUser):
         GET /posts?userId={id} - Get posts by specific user
         SLA: < 600ms
         """
-        user_id = random.randint(1, 10)
-        endpoint = f"/posts?userId={user_id}"
-        with self.client.get(
-            endpoint, 
-            catch_response=True, 
-            name="GET /posts?userId=1"
-        ) as response:
-            if self.validate_response(response, "/posts?userId=1", "GET", required_keys=["id", "userId", "title"]):
-                # Validate all posts belong to user_id (not hardcoded 1)
-                try:
-                    data = response.json()
-                    for post in data:
-                        if post.get("userId") != user_id:
-                            response.failure(f"Posts contain wrong userId (expected {user_id})")
-                            break
-                except Exception:
-                    pass  # JSON already validated in validate_response
\ No newline at end of file
+        self.send(user_posts_request())
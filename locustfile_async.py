@@ -0,0 +1,259 @@
+"""
+Performance Testing - JSONPlaceholder API on asyncio
+Each Locust user hosts thousands of logical users as coroutines sharing one
+httpx connection pool, for connection-heavy tests beyond greenlet-per-user limits
+
+Usage (one Locust user per worker process, e.g. 10k logical users):
+    ASYNC_LOGICAL_USERS=10000 locust -f locustfile_async.py --headless -u 1 -r 1 -t 5m
+"""
+import asyncio
+import logging
+import random
+import time
+from functools import partial
+from types import SimpleNamespace
+
+import gevent
+import httpx
+from gevent import GreenletExit
+from gevent.selectors import GeventSelector
+from locust import User, task, constant, events
+from locust.exception import CatchResponseError
+from locust.runners import STATE_STOPPING, STATE_STOPPED, STATE_CLEANUP
+
+import locustfile  # Registers the SLA/slow-request listeners (module import keeps the HTTP/1.1 user out)
+from pacing import make_wait_time, task_rate
+from config import (
+    API_BASE_URL,
+    ASYNC_LOGICAL_USERS,
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_SHUTDOWN_TIMEOUT,
+    PACING
+)
+
+logger = logging.getLogger(__name__)
+
+# asyncio allows one running loop per thread and every Locust user's greenlet
+# shares the thread, so all users run their logical users on one loop, driven
+# by its own greenlet from the first user's start to the last user's stop
+_shared_loop = {"loop": None, "driver": None, "users": 0}
+
+
+def acquire_loop():
+    """The shared event loop, started on first use"""
+    if _shared_loop["loop"] is None:
+        loop = asyncio.SelectorEventLoop(GeventSelector())
+        _shared_loop["loop"] = loop
+        _shared_loop["driver"] = gevent.spawn(loop.run_forever)
+    _shared_loop["users"] += 1
+    return _shared_loop["loop"]
+
+
+def release_loop():
+    """Stop and close the shared event loop once its last user has left"""
+    _shared_loop["users"] -= 1
+    if _shared_loop["users"] == 0:
+        loop = _shared_loop["loop"]
+        loop.call_soon_threadsafe(loop.stop)
+        _shared_loop["driver"].join()
+        loop.close()
+        _shared_loop["loop"] = _shared_loop["driver"] = None
+
+
+class AsyncSession:
+    """Shared httpx.AsyncClient that reports every request through events.request"""
+
+    def __init__(self, base_url, request_event, max_connections, runner=None):
+        self.request_event = request_event
+        self.runner = runner
+        self.closing = False
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=httpx.Timeout(30.0)
+        )
+
+    async def request(self, method, url, name, expected_status=200, required_keys=None, check=None, **kwargs):
+        """
+        Send a request, validate it and report it to Locust.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the base URL
+            name: Stats entry name
+            expected_status: Expected status code
+            required_keys: List of keys expected in the JSON response
+            check: Optional callable(data) returning an extra failure message
+
+        Returns:
+            Response, or None if the request failed
+        """
+        response = None
+        exception = None
+        start = time.perf_counter()
+
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            exception = e
+
+        response_time = (time.perf_counter() - start) * 1000
+        if self.stopping():
+            return None  # Finished after the run ended: not part of the results
+
+        if response is not None:
+            load_json = partial(locustfile.parsed_json, response)  # Parsed once, shared with check
+            error = locustfile.response_error(response.status_code, load_json, expected_status, required_keys)
+            if error is None and check is not None:
+                error = check(load_json())
+            if error:
+                exception = CatchResponseError(error)
+
+        self.request_event.fire(
+            request_type=method,
+            name=name,
+            response_time=response_time,
+            response_length=len(response.content) if response is not None else 0,
+            response=response,
+            context={},
+            exception=exception
+        )
+        return response if exception is None else None
+
+    async def send(self, request):
+        """Send a locustfile.TaskRequest"""
+        return await self.request(
+            request.method, request.url, request.name, request.expected_status, request.required_keys,
+            request.check, **request.kwargs()
+        )
+
+    def stopping(self):
+        """True once the user or the runner is shutting down"""
+        return self.closing or (self.runner is not None
+                                and self.runner.state in (STATE_STOPPING, STATE_STOPPED, STATE_CLEANUP))
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def task_pool(user_class):
+    """
+    Weighted pick list of (task name, request builder) for user_class's tasks.
+
+    user_class.tasks is already expanded by weight, so the logical users run
+    the same requests with the same weights (builders from locustfile.TASK_REQUESTS).
+    """
+    missing = {t.__name__ for t in user_class.tasks} - set(locustfile.TASK_REQUESTS)
+    if missing:
+        raise ValueError(f"No TASK_REQUESTS entry for task(s) {sorted(missing)}")
+    return [(t.__name__, locustfile.TASK_REQUESTS[t.__name__]) for t in user_class.tasks]
+
+
+TASK_POOL = task_pool(locustfile.JSONPlaceholderUser)
+
+
+async def logical_user(session, wait_time, stagger):
+    """One simulated user: pick a weighted task, run it, think (per the pacing model), repeat"""
+    # Per-user pacing state, like the attributes wait_time keeps on a Locust user
+    state = SimpleNamespace(last_task=None)
+
+    # Stagger start so thousands of users don't fire their first request together
+    await asyncio.sleep(random.uniform(0, stagger))
+
+    while not session.closing:
+        state.last_task, build_request = random.choice(TASK_POOL)
+        try:
+            await session.send(build_request())
+        except Exception as e:
+            logger.error(f"Logical user task failed: {e}")
+        await asyncio.sleep(wait_time(state))
+
+
+class AsyncJSONPlaceholderUser(User):
+    """
+    Locust user that runs `logical_users` simulated users on an asyncio loop.
+
+    The loop (shared by every user of the process) runs continuously in its
+    own greenlet on a gevent selector: waiting for sockets and timers yields
+    to gevent, so the rest of Locust keeps running and requests are reported
+    on the gevent thread (the SLA listener and CSV stats work unchanged).
+    Run one of these per worker process; raise ASYNC_LOGICAL_USERS for scale.
+    """
+    host = API_BASE_URL
+    wait_time = constant(0)  # run_logical_users only returns once the user stops
+
+    logical_users = ASYNC_LOGICAL_USERS
+    max_connections = ASYNC_MAX_CONNECTIONS
+    pacing = PACING  # Think-time model of the logical users (set per scenario at test start)
+
+    def on_start(self):
+        """Create the shared connection pool and start the logical users on the shared loop"""
+        self._loop = acquire_loop()
+        self._session = AsyncSession(
+            self.host, self.environment.events.request, self.max_connections, self.environment.runner
+        )
+        wait_time = make_wait_time(self.pacing)
+        rate = task_rate(self.pacing)
+        stagger = 1 / rate if rate else 0
+        self._tasks = asyncio.run_coroutine_threadsafe(
+            self._start_logical_users(wait_time, stagger), self._loop
+        ).result()
+        logger.info(
+            f"Async user started: {self.logical_users} logical users, "
+            f"{self.max_connections} pooled connections"
+        )
+
+    async def _start_logical_users(self, wait_time, stagger):
+        return [
+            asyncio.create_task(logical_user(self._session, wait_time, stagger))
+            for _ in range(self.logical_users)
+        ]
+
+    @task
+    def run_logical_users(self):
+        """Wait on the logical users until the user is stopped (GreenletExit from Locust)"""
+        try:
+            asyncio.run_coroutine_threadsafe(self._gather(), self._loop).result()
+        except GreenletExit:
+            self._shutdown()
+            raise
+
+    async def _gather(self):
+        await asyncio.gather(*self._tasks)
+
+    def on_stop(self):
+        """Cancel logical users and close the pool"""
+        self._shutdown()
+
+    def _shutdown(self):
+        if self._loop is None:
+            return
+        loop, self._loop = self._loop, None
+        self._session.closing = True  # No more requests started or reported
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(), loop).result()
+        finally:
+            release_loop()
+
+    async def _drain(self):
+        """Cancel the logical users, wait (bounded) for them, then close the connection pool"""
+        for logical_task in self._tasks:
+            logical_task.cancel()
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=ASYNC_SHUTDOWN_TIMEOUT)
+        try:
+            await asyncio.wait_for(self._session.close(), ASYNC_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning("Async user: connection pool did not close in time")
+
+
+@events.test_start.add_listener
+def on_async_test_start(environment, **kwargs):
+    """Apply the scenario's pacing to the logical users and log the asyncio configuration"""
+    AsyncJSONPlaceholderUser.pacing = locustfile.scenario_pacing(environment)
+    logger.info(
+        f"Asyncio mode: {AsyncJSONPlaceholderUser.logical_users} logical users per Locust user"
+    )
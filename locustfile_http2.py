@@ -0,0 +1,201 @@
+"""
+Performance Testing - JSONPlaceholder API over HTTP/2
+Same task set, validation and SLA hooks as locustfile.py, but every user in a
+worker shares a small pool of multiplexed HTTP/2 connections
+
+Usage:
+    locust -f locustfile_http2.py --headless -u 100 -r 10 -t 60s
+    python stub_server.py --protocol h2 &
+    locust -f locustfile_http2.py --host http://127.0.0.1:8080 --headless -u 100 -r 10 -t 60s
+"""
+import logging
+import threading
+import time
+
+import httpx
+from locust import events
+from locust.exception import CatchResponseError, ResponseError
+
+import locustfile  # Module import so Locust doesn't also pick up the HTTP/1.1 user
+from config import (
+    ENABLE_DETAILED_LOGGING,
+    HTTP2_MAX_CONNECTIONS,
+    HTTP2_MAX_CONCURRENT_STREAMS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FailedResponse:
+    """Placeholder response for requests that never got one (connect errors, resets)"""
+    status_code = 0
+    content = b""
+    text = ""
+    http_version = None
+
+    def json(self):
+        raise ValueError("No response body")
+
+
+class HTTP2ResponseContextManager:
+    """
+    Wraps an httpx response with Locust's catch_response API.
+
+    Like Locust's ResponseContextManager, response.success() / response.failure()
+    only record the outcome (the last call wins); the request is reported once,
+    through events.request, when the `with` block exits.
+    """
+
+    def __init__(self, response, request_event, request_meta):
+        self._response = response
+        self._request_event = request_event
+        self._request_meta = request_meta
+        self._manual_result = None
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if self._manual_result is not None:
+            self._request_meta["exception"] = None if self._manual_result is True else self._manual_result
+            self._report()
+            return exc is None
+
+        if exc is not None:
+            if not isinstance(exc, ResponseError):
+                return False
+            self._request_meta["exception"] = exc
+
+        self._report()
+        return True
+
+    def success(self):
+        self._manual_result = True
+
+    def failure(self, exc):
+        if not isinstance(exc, Exception):
+            exc = CatchResponseError(exc)
+        self._manual_result = exc
+
+    def _report(self):
+        self._request_event.fire(**self._request_meta)
+
+
+class HTTP2Session:
+    """
+    Thread/greenlet-safe HTTP/2 client shared by every user in a worker.
+
+    Concurrent requests from different users become concurrent streams on the
+    same connection; in-flight streams are capped at
+    max_connections * max_concurrent_streams.
+    """
+
+    def __init__(self, base_url, request_event, max_connections=1, max_concurrent_streams=100):
+        # Plain http:// targets need prior-knowledge h2c, https:// negotiates via ALPN
+        cleartext = base_url.startswith("http://")
+        self.request_event = request_event
+        self.client = httpx.Client(
+            base_url=base_url,
+            http1=not cleartext,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=httpx.Timeout(30.0)
+        )
+        self._streams = threading.BoundedSemaphore(max_connections * max_concurrent_streams)
+
+    def request(self, method, url, name=None, catch_response=False, **kwargs):
+        exception = None
+        start = time.perf_counter()
+
+        with self._streams:
+            try:
+                response = self.client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                response = FailedResponse()
+                exception = e
+
+        request_meta = {
+            "request_type": method,
+            "name": name or url,
+            "response_time": (time.perf_counter() - start) * 1000,
+            "response_length": len(response.content),
+            "response": response,
+            "context": {},
+            "exception": exception,
+        }
+
+        if exception is None and response.status_code >= 400:
+            request_meta["exception"] = CatchResponseError(f"HTTP {response.status_code}")
+
+        if not catch_response:
+            self.request_event.fire(**request_meta)
+            return response
+        return HTTP2ResponseContextManager(response, self.request_event, request_meta)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        self.client.close()
+
+
+class JSONPlaceholderHTTP2User(locustfile.JSONPlaceholderUser):
+    """
+    JSONPlaceholder user whose requests are multiplexed over shared HTTP/2 connections.
+
+    Inherits every task and validate_response from JSONPlaceholderUser, so the
+    SLA listener, slow-request tracking and CSV reports work unchanged.
+    """
+    max_connections = HTTP2_MAX_CONNECTIONS
+    max_concurrent_streams = HTTP2_MAX_CONCURRENT_STREAMS
+
+    _shared_session = None
+
+    def __init__(self, environment):
+        super().__init__(environment)
+        cls = type(self)
+        if cls._shared_session is None:
+            cls._shared_session = HTTP2Session(
+                self.host,
+                environment.events.request,
+                cls.max_connections,
+                cls.max_concurrent_streams
+            )
+        self.client = cls._shared_session
+
+    def on_start(self):
+        """Called when a user starts (no per-user connection policy: connections are shared)"""
+        if ENABLE_DETAILED_LOGGING:
+            logger.info(f"HTTP/2 user started (total active: {self.environment.runner.user_count})")
+
+
+@events.test_start.add_listener
+def on_http2_test_start(environment, **kwargs):
+    """Log the multiplexing configuration"""
+    logger.info(
+        f"HTTP/2 mode: {JSONPlaceholderHTTP2User.max_connections} connection(s), "
+        f"max {JSONPlaceholderHTTP2User.max_concurrent_streams} concurrent streams each"
+    )
+
+
+@events.test_stop.add_listener
+def on_http2_test_stop(environment, **kwargs):
+    """Close the shared HTTP/2 connections"""
+    if JSONPlaceholderHTTP2User._shared_session is not None:
+        JSONPlaceholderHTTP2User._shared_session.close()
+        JSONPlaceholderHTTP2User._shared_session = None
@@ -0,0 +1,65 @@
+"""
+Performance Testing - JSONPlaceholder API user journeys
+Multi-step flows that follow IDs from earlier responses instead of random
+ones, reported per request and per journey (JOURNEY <name> entries)
+
+Usage:
+    locust -f locustfile_journeys.py --headless -u 10 -r 2 -t 60s
+"""
+import random
+
+import locustfile  # Module import so Locust doesn't also pick up the single-request user
+from journeys import Journey, Step, journey_tasks
+from pacing import track_tasks
+
+
+def all_match(field, state_key):
+    """Check that every item's field equals a value extracted earlier"""
+    def check(items, state):
+        if any(item.get(field) != state[state_key] for item in items):
+            return f"Items with wrong {field} (expected {state[state_key]})"
+        return None
+    return check
+
+
+JOURNEYS = [
+    # Reader: browse posts, open one, read its comments, look at the author
+    Journey("read_post", weight=3, steps=[
+        Step("GET", "/posts", "GET /posts", required_keys=["id", "title"],
+             extract={"post_id": lambda posts: random.choice(posts)["id"]}),
+        Step("GET", "/posts/{post_id}", "GET /posts/1", required_keys=["id", "title", "body", "userId"],
+             extract={"user_id": lambda post: post["userId"]}),
+        Step("GET", "/comments?postId={post_id}", "GET /comments",
+             required_keys=["id", "postId", "name", "email", "body"],
+             check=all_match("postId", "post_id")),
+        Step("GET", "/users/{user_id}", "GET /users/1", required_keys=["id", "name", "email", "address", "company"]),
+    ]),
+
+    # Author: find a user, list their posts, edit one of them
+    Journey("edit_post", weight=1, steps=[
+        Step("GET", "/users", "GET /users", required_keys=["id", "email"],
+             extract={"user_id": lambda users: random.choice(users)["id"]}),
+        Step("GET", "/posts?userId={user_id}", "GET /posts?userId=1", required_keys=["id", "userId", "title"],
+             check=all_match("userId", "user_id"),
+             extract={"post_id": lambda posts: random.choice(posts)["id"]}),
+        Step("PUT", "/posts/{post_id}", "PUT /posts/1", required_keys=["id"],
+             body=lambda state: {
+                 "id": state["post_id"],
+                 "title": "Updated Performance Test Post",
+                 "body": "This post was updated during a journey",
+                 "userId": state["user_id"]
+             }),
+    ]),
+]
+
+
+@track_tasks
+class JourneyUser(locustfile.JSONPlaceholderBaseUser):
+    """
+    Runs JOURNEYS instead of independent requests.
+
+    Inherits validation, connection policy and pacing (think time applies
+    between journeys; steps within a journey run back to back), but none of
+    JSONPlaceholderUser's single-request tasks.
+    """
+    tasks = journey_tasks(JOURNEYS)
@@ -0,0 +1,138 @@
+"""
+Think-Time and Pacing Models
+Builds Locust wait_time functions from the pacing specs in config.py
+(config.PACING and SCENARIOS[...]["pacing"])
+"""
+import functools
+import os
+import random
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Models whose interval is measured start-to-start, so task run time is absorbed
+PACED_MODELS = ("constant_pacing", "poisson")
+MODELS = ("between", "constant", "recorded") + PACED_MODELS
+
+_recorded_cache = {}
+
+
+def load_recorded(path):
+    """
+    Think times (seconds) recorded from real sessions, one per line.
+
+    The first column of each line is used, so CSV exports work; headers,
+    blank lines and '#' comments are skipped. Cached per path.
+    """
+    path = os.path.join(ROOT_DIR, path)
+    if path not in _recorded_cache:
+        samples = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                value = line.split("#", 1)[0].split(",", 1)[0].strip()
+                try:
+                    samples.append(float(value))
+                except ValueError:
+                    continue
+        if not samples:
+            raise ValueError(f"No think-time samples in {path}")
+        _recorded_cache[path] = samples
+    return _recorded_cache[path]
+
+
+def sampler(spec):
+    """Zero-argument callable drawing one interval/think time in seconds"""
+    model = spec["model"]
+    if model == "between":
+        low, high = spec["min"], spec["max"]
+        return lambda: random.uniform(low, high)
+    if model == "constant":
+        seconds = spec["seconds"]
+        return lambda: seconds
+    if model == "constant_pacing":
+        interval = spec["interval"]
+        return lambda: interval
+    if model == "poisson":
+        rate = spec["rate"]
+        return lambda: random.expovariate(rate)
+    if model == "recorded":
+        samples = spec.get("samples") or load_recorded(spec["file"])
+        return lambda: random.choice(samples)
+    raise ValueError(f"Unknown pacing model '{model}' (expected one of {MODELS})")
+
+
+def _delay(spec):
+    sample = sampler(spec)
+    if spec["model"] not in PACED_MODELS:
+        return lambda user: sample()
+
+    def paced(user):
+        # Next task starts one interval after the previous one started
+        now = time.monotonic()
+        run_time = max(0.0, now - getattr(user, "_pacing_resumed", now))
+        wait = max(0.0, sample() - run_time)
+        user._pacing_resumed = now + wait
+        return wait
+
+    return paced
+
+
+def make_wait_time(spec):
+    """
+    Locust wait_time function for a pacing spec.
+
+    Per-task overrides in spec["tasks"] apply after that task ran
+    (user.last_task, set by track_tasks).
+    """
+    default = _delay(spec)
+    per_task = {name: _delay(task_spec) for name, task_spec in spec.get("tasks", {}).items()}
+
+    if not per_task:
+        return default
+
+    def wait_time(user):
+        return per_task.get(getattr(user, "last_task", None), default)(user)
+
+    return wait_time
+
+
+def track_tasks(user_class):
+    """Class decorator: record each task's name on the user before it runs"""
+    wrapped = {}
+
+    def wrap(func):
+        if func not in wrapped:
+            @functools.wraps(func)
+            def tracked(user, *args, **kwargs):
+                user.last_task = func.__name__
+                return func(user, *args, **kwargs)
+            wrapped[func] = tracked
+        return wrapped[func]
+
+    user_class.tasks = [wrap(task) if callable(task) and not isinstance(task, type) else task
+                        for task in user_class.tasks]
+    return user_class
+
+
+def task_rate(spec, task_time=0.0):
+    """Upper bound on tasks/s per user, given an average task duration in seconds"""
+    model = spec["model"]
+    if model == "poisson":
+        return spec["rate"]
+    if model == "constant_pacing":
+        interval = max(spec["interval"], task_time)
+        return 1 / interval if interval else 0.0
+    if model == "between":
+        mean = (spec["min"] + spec["max"]) / 2
+    elif model == "constant":
+        mean = spec["seconds"]
+    else:
+        samples = spec.get("samples") or load_recorded(spec["file"])
+        mean = sum(samples) / len(samples)
+    return 1 / (mean + task_time) if mean + task_time else 0.0
+
+
+def describe(spec):
+    """Short description for logs, e.g. 'poisson (0.5 tasks/s per user)'"""
+    overrides = f", {len(spec['tasks'])} per-task override(s)" if spec.get("tasks") else ""
+    return f"{spec['model']} (<= {task_rate(spec):.2f} tasks/s per user{overrides})"
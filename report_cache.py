@@ -0,0 +1,140 @@
+"""
+Report Build Cache
+Manifest of input file digests -> derived artifacts (parsed CSVs, report
+sections, whole reports), so analyze_results and generate_charts only
+re-parse changed runs and only rebuild affected sections
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+
+CACHE_VERSION = 1
+
+
+class BuildCache:
+    """
+    Incremental build state kept in the reports directory, per tool.
+
+    - <reports>/.build_cache/<name>.json: manifest (file digests, artifact keys)
+    - <reports>/.build_cache/<name>/: pickled parse results and section text,
+      named by the digest of their inputs
+
+    sources are the tool's own modules: editing any of them invalidates
+    everything it built.
+    """
+
+    def __init__(self, name, reports_dir="reports", enabled=True, sources=()):
+        self.enabled = enabled
+        self.manifest_path = os.path.join(reports_dir, ".build_cache", f"{name}.json")
+        self.store_dir = os.path.join(reports_dir, ".build_cache", name)
+        self.manifest = {"version": CACHE_VERSION, "files": {}, "artifacts": {}}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+
+        if enabled and os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+                if manifest.get("version") == CACHE_VERSION:
+                    self.manifest = manifest
+            except (OSError, ValueError):
+                pass  # Corrupt manifest: start over
+
+        self.code = self.key(*(self.digest(os.path.abspath(path)) for path in sources))[:12]
+
+    def digest(self, path):
+        """
+        Content digest of a file.
+
+        Size and mtime are checked first, so unchanged files are not re-read.
+        """
+        stat = os.stat(path)
+        entry = self.manifest["files"].get(path)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["digest"]
+
+        hasher = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
+        self.manifest["files"][path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+        return digest
+
+    @staticmethod
+    def key(*parts):
+        """Stable key for a derived artifact from its input digests/settings"""
+        return hashlib.blake2b("\0".join(str(p) for p in parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cached(self, name, build):
+        name = f"{self.code}-{name}"
+        path = os.path.join(self.store_dir, name)
+        self.used.add(name)
+        if self.enabled and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+                self.hits += 1
+                return value
+            except Exception:
+                # Truncated, corrupt or written by other code (unpickling can raise
+                # almost anything): discard the entry and rebuild it
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+        self.misses += 1
+        value = build()
+        if self.enabled:
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return value
+
+    def load(self, path, parse, kind):
+        """parse(path), reused while the file content is unchanged"""
+        return self._cached(f"{kind}-{self.digest(path)}.pickle", lambda: parse(path))
+
+    def section(self, name, key, build):
+        """Report section text (or any derived value), rebuilt only when key changes"""
+        return self._cached(f"section-{name}-{key}.pickle", build)
+
+    def is_current(self, artifact, key):
+        """True if artifact exists and was last built from the same key"""
+        return (self.enabled and os.path.exists(artifact)
+                and self.manifest["artifacts"].get(artifact) == self.key(key, self.code))
+
+    def record(self, artifact, key):
+        self.manifest["artifacts"][artifact] = self.key(key, self.code)
+
+    def save(self, prune=True):
+        """Write the manifest; with prune, drop stored entries this build did not use"""
+        if not self.enabled:
+            return
+        os.makedirs(self.store_dir, exist_ok=True)
+        if prune:
+            for name in os.listdir(self.store_dir):
+                if name not in self.used:
+                    os.remove(os.path.join(self.store_dir, name))
+        self.manifest["files"] = {p: e for p, e in self.manifest["files"].items() if os.path.exists(p)}
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=1)
+
+
+def watch(build, interval=2.0):
+    """
+    Re-run an incremental build every interval seconds until interrupted.
+
+    build() is expected to return quickly when nothing changed.
+    """
+    print(f"👀 Watching for new results every {interval:g}s (Ctrl+C to stop)\n")
+    try:
+        while True:
+            build()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
@@ -0,0 +1,130 @@
+"""
+Percentile SLA Evaluation
+Windowed percentile and error-budget checks for config.SLA_SPECS, shared by
+the live request listener and the offline analyzer
+"""
+from config import SLA_SPECS, SLA_WINDOW, SLA_ERROR_BUDGET
+from histograms import Histogram
+
+
+def spec_for(request_type, name):
+    """
+    SLA spec for a request name like 'GET /posts', with defaults filled in.
+
+    Returns:
+        dict: {'percentiles': {fraction: ms}, 'window': s, 'error_budget': ratio}, or None
+    """
+    spec = SLA_SPECS.get(request_type, {}).get(name.split(" ", 1)[-1])
+    if spec is None:
+        return None
+    return {
+        'percentiles': spec['percentiles'],
+        'window': spec.get('window', SLA_WINDOW),
+        'error_budget': spec.get('error_budget', SLA_ERROR_BUDGET)
+    }
+
+
+def percentile_label(fraction):
+    """0.95 -> 'p95', 0.999 -> 'p99.9'"""
+    return f"p{fraction * 100:g}"
+
+
+def describe_spec(spec):
+    """One-line summary, e.g. 'p95<500ms, p99<1000ms, errors<1.0% per 60s'"""
+    limits = ", ".join(f"{percentile_label(f)}<{ms}ms" for f, ms in sorted(spec['percentiles'].items()))
+    return f"{limits}, errors<{spec['error_budget']:.1%} per {spec['window']}s"
+
+
+def check_window(spec, percentiles, requests, failures):
+    """
+    Evaluate one window against a spec.
+
+    Args:
+        spec: Spec from spec_for()
+        percentiles: {fraction: observed ms}
+        requests: Requests in the window
+        failures: Failed requests in the window
+
+    Returns:
+        list: Violation messages (empty if the window passed)
+    """
+    violations = []
+    for fraction, limit in sorted(spec['percentiles'].items()):
+        observed = percentiles.get(fraction)
+        if observed is not None and observed > limit:
+            violations.append(f"{percentile_label(fraction)} {observed:.0f}ms > {limit}ms")
+
+    error_rate = failures / requests if requests else 0.0
+    if error_rate > spec['error_budget']:
+        violations.append(f"errors {error_rate:.1%} > {spec['error_budget']:.1%}")
+    return violations
+
+
+class WindowedSLA:
+    """
+    Streaming evaluation of one endpoint's spec over tumbling windows.
+
+    Only the current window's histogram is kept; closed windows are reduced
+    to their percentiles and violations.
+    """
+    __slots__ = ("spec", "origin", "start", "latency", "requests", "failures", "windows")
+
+    def __init__(self, spec, now):
+        self.spec = spec
+        self.origin = now
+        self.windows = []
+        self._open(now)
+
+    def _open(self, start):
+        self.start = start
+        self.latency = Histogram()
+        self.requests = 0
+        self.failures = 0
+
+    def record(self, now, response_time, failed):
+        """
+        Add one request; closes the current window first if it has elapsed.
+
+        Returns:
+            dict: The window closed by this call, or None
+        """
+        closed = None
+        if now - self.start >= self.spec['window']:
+            closed = self.close(now)
+            # Skip idle windows so the next one stays aligned to the grid
+            elapsed = (now - self.origin) // self.spec['window']
+            self._open(self.origin + elapsed * self.spec['window'])
+
+        self.latency.record(response_time)
+        self.requests += 1
+        if failed:
+            self.failures += 1
+        return closed
+
+    def close(self, now=None):
+        """
+        Evaluate the current window and reset it; returns it, or None if it had no requests.
+
+        The window is complete only if now has reached its end. A window cut
+        short (e.g. at test stop) is kept but never counted as passed or failed.
+        """
+        if not self.requests:
+            return None
+        percentiles = {f: self.latency.percentile(f) for f in self.spec['percentiles']}
+        window = {
+            'start': self.start - self.origin,
+            'requests': self.requests,
+            'failures': self.failures,
+            'percentiles': percentiles,
+            'violations': check_window(self.spec, percentiles, self.requests, self.failures),
+            'complete': now is not None and now - self.start >= self.spec['window']
+        }
+        self.windows.append(window)
+        self._open(self.start)
+        return window
+
+    def complete_windows(self):
+        return [w for w in self.windows if w['complete']]
+
+    def failed_windows(self):
+        return [w for w in self.complete_windows() if w['violations']]
@@ -0,0 +1,306 @@
+"""
+Local JSONPlaceholder Stub Server
+Deterministic offline target for load generator tests and benchmarks
+
+Usage:
+    python stub_server.py                      # HTTP/1.1 on 127.0.0.1:8080
+    python stub_server.py --protocol h2        # HTTP/2 cleartext (prior knowledge)
+    python stub_server.py --latency-ms 50      # Add fixed server think time
+"""
+import argparse
+import asyncio
+import json
+import random
+from urllib.parse import urlsplit, parse_qs
+
+
+def build_dataset(seed=42):
+    """Build JSONPlaceholder-shaped fixtures (same sizes as the real API)"""
+    rng = random.Random(seed)
+    words = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit",
+             "sed", "do", "eiusmod", "tempor", "incididunt", "ut", "labore", "magna"]
+
+    def sentence(count):
+        return " ".join(rng.choice(words) for _ in range(count))
+
+    users = [
+        {
+            "id": i,
+            "name": f"User {i}",
+            "username": f"user{i}",
+            "email": f"user{i}@example.com",
+            "address": {
+                "street": sentence(2), "suite": f"Apt. {i}", "city": sentence(1),
+                "zipcode": f"{10000 + i}", "geo": {"lat": "0.0", "lng": "0.0"}
+            },
+            "phone": f"555-010{i}",
+            "website": f"user{i}.example.com",
+            "company": {"name": sentence(2), "catchPhrase": sentence(4), "bs": sentence(3)}
+        }
+        for i in range(1, 11)
+    ]
+    posts = [
+        {"userId": (i - 1) // 10 + 1, "id": i, "title": sentence(6), "body": sentence(30)}
+        for i in range(1, 101)
+    ]
+    comments = [
+        {
+            "postId": (i - 1) // 5 + 1, "id": i, "name": sentence(5),
+            "email": f"commenter{i}@example.com", "body": sentence(25)
+        }
+        for i in range(1, 501)
+    ]
+    albums = [
+        {"userId": (i - 1) // 10 + 1, "id": i, "title": sentence(5)}
+        for i in range(1, 101)
+    ]
+
+    return {"posts": posts, "comments": comments, "users": users, "albums": albums}
+
+
+class StubAPI:
+    """Route table for the JSONPlaceholder endpoints used by the locustfile"""
+
+    def __init__(self, dataset=None):
+        self.data = dataset or build_dataset()
+        self._cache = {}
+
+    def handle(self, method, target, body=b""):
+        """Return (status, json_bytes) for a request"""
+        parts = urlsplit(target)
+        segments = [s for s in parts.path.split("/") if s]
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+        if not segments or segments[0] not in self.data:
+            return 404, b"{}"
+
+        collection = self.data[segments[0]]
+
+        if method == "GET":
+            if len(segments) == 1:
+                return 200, self._list(segments[0], collection, query)
+            item = self._find(collection, segments[1])
+            return (200, json.dumps(item).encode()) if item else (404, b"{}")
+
+        if method == "POST" and len(segments) == 1:
+            payload = self._load(body)
+            payload["id"] = len(collection) + 1
+            return 201, json.dumps(payload).encode()
+
+        if method in ("PUT", "PATCH") and len(segments) == 2:
+            item = self._find(collection, segments[1])
+            if not item:
+                return 404, b"{}"
+            payload = self._load(body)
+            payload["id"] = item["id"]
+            return 200, json.dumps(payload).encode()
+
+        if method == "DELETE" and len(segments) == 2:
+            return 200, b"{}"
+
+        return 405, b"{}"
+
+    def _list(self, name, collection, query):
+        key = (name, tuple(sorted(query.items())))
+        if key not in self._cache:
+            items = [
+                item for item in collection
+                if all(str(item.get(field)) == value for field, value in query.items())
+            ]
+            self._cache[key] = json.dumps(items).encode()
+        return self._cache[key]
+
+    @staticmethod
+    def _find(collection, raw_id):
+        try:
+            index = int(raw_id) - 1
+        except ValueError:
+            return None
+        return collection[index] if 0 <= index < len(collection) else None
+
+    @staticmethod
+    def _load(body):
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+
+STATUS_TEXT = {200: "OK", 201: "Created", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+async def serve_http1(api, host, port, latency_ms=0):
+    """Serve HTTP/1.1 with keep-alive"""
+
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                if latency_ms:
+                    await asyncio.sleep(latency_ms / 1000)
+
+                status, payload = api.handle(method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                )
+                writer.write(payload)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+class H2StubProtocol(asyncio.Protocol):
+    """HTTP/2 cleartext (prior knowledge) server with flow-control aware sends"""
+
+    def __init__(self, api, latency_ms=0, max_concurrent_streams=100):
+        import h2.config
+        import h2.connection
+
+        self.api = api
+        self.latency_ms = latency_ms
+        self.max_concurrent_streams = max_concurrent_streams
+        self.conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self.streams = {}
+        self.pending = {}
+        self.transport = None
+
+    def connection_made(self, transport):
+        from h2.settings import SettingCodes
+
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.conn.update_settings({SettingCodes.MAX_CONCURRENT_STREAMS: self.max_concurrent_streams})
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data):
+        import h2.events
+        import h2.exceptions
+
+        try:
+            events = self.conn.receive_data(data)
+        except h2.exceptions.ProtocolError:
+            self.transport.write(self.conn.data_to_send())
+            self.transport.close()
+            return
+
+        for event in events:
+            if isinstance(event, h2.events.RequestReceived):
+                self.streams[event.stream_id] = (dict(event.headers), bytearray())
+            elif isinstance(event, h2.events.DataReceived):
+                if event.stream_id in self.streams:
+                    self.streams[event.stream_id][1].extend(event.data)
+                self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                if event.stream_id in self.streams:
+                    asyncio.ensure_future(self._respond(event.stream_id))
+            elif isinstance(event, h2.events.StreamReset):
+                self.streams.pop(event.stream_id, None)
+                self.pending.pop(event.stream_id, None)
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._flush()
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+
+        self.transport.write(self.conn.data_to_send())
+
+    async def _respond(self, stream_id):
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        headers, body = self.streams.pop(stream_id, (None, None))
+        if headers is None or self.transport.is_closing():
+            return
+
+        status, payload = self.api.handle(headers[":method"], headers[":path"], bytes(body))
+        self.conn.send_headers(stream_id, [
+            (":status", str(status)),
+            ("content-type", "application/json; charset=utf-8"),
+            ("content-length", str(len(payload))),
+        ])
+        self.pending[stream_id] = memoryview(payload)
+        self._flush()
+
+    def _flush(self):
+        for stream_id in list(self.pending):
+            data = self.pending[stream_id]
+            while data:
+                window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                if window <= 0:
+                    break
+                self.conn.send_data(stream_id, data[:window].tobytes())
+                data = data[window:]
+            if data:
+                self.pending[stream_id] = data
+            else:
+                self.conn.end_stream(stream_id)
+                del self.pending[stream_id]
+        self.transport.write(self.conn.data_to_send())
+
+
+async def serve_http2(api, host, port, latency_ms=0, max_concurrent_streams=100):
+    """Serve HTTP/2 cleartext with prior knowledge"""
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(
+        lambda: H2StubProtocol(api, latency_ms, max_concurrent_streams), host, port
+    )
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local JSONPlaceholder stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--protocol", choices=["h1", "h2"], default="h1")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fixed server think time per request")
+    parser.add_argument("--max-concurrent-streams", type=int, default=100, help="HTTP/2 SETTINGS value")
+    args = parser.parse_args()
+
+    api = StubAPI()
+    scheme = "h2c" if args.protocol == "h2" else "http"
+    print(f"Stub server listening on {scheme}://{args.host}:{args.port}")
+
+    if args.protocol == "h2":
+        server = serve_http2(api, args.host, args.port, args.latency_ms, args.max_concurrent_streams)
+    else:
+        server = serve_http1(api, args.host, args.port, args.latency_ms)
+
+    try:
+        asyncio.run(server)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
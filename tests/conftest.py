@@ -0,0 +1,53 @@
+"""
+Shared pytest setup: the modules under test live in the repository root and
+benchmarks/; the stub server runs as a subprocess on a free port
+"""
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+try:
+    # Like any Locust process: let gevent patch the stdlib before requests/ssl are imported
+    import locust  # noqa: F401
+except ImportError:
+    pass
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "benchmarks"))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def stub_server():
+    """Start stub_server.py with the given protocol ("h1" or "h2"); returns its base URL"""
+    started = []
+
+    def start(protocol="h1"):
+        port = free_port()
+        started.append(subprocess.Popen(
+            [sys.executable, "stub_server.py", "--port", str(port), "--protocol", protocol],
+            cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ))
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                return f"http://127.0.0.1:{port}"
+            except OSError:
+                assert time.monotonic() < deadline, "stub server did not start"
+                time.sleep(0.1)
+
+    yield start
+    for stub in started:
+        stub.terminate()
+        stub.wait()
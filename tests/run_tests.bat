@@ -9,5 +9,5 @@ if exist "venv\Scripts\python.exe" (
     set "PYTHON_CMD=venv\Scripts\python.exe"
 )
 
-%PYTHON_CMD% tests\run_tests.py
+%PYTHON_CMD% tests\run_tests.py %*
 pause
\ No newline at end of file
@@ -1,75 +1,306 @@
 import sys
 import os
+import re
+import csv
+import argparse
+import socket
 import subprocess
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 try:
-    from config import SCENARIOS
+    from config import SCENARIOS, API_BASE_URL, FAULT_SCHEDULES, FAULT_PROXY_PORT
 except ImportError as e:
     print(f"Error importing config: {e}")
     sys.exit(1)
 
-def run_tests():
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    locust_file = os.path.join(root_dir, "locustfile.py")
-    results_dir = os.path.join(root_dir, "reports")
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Incremental report builders (see report_cache.py)
+REPORT_SCRIPTS = ["analyze_results.py", "generate_charts.py"]
+
+
+def find_locust_command():
+    """Determine locust command based on venv in root"""
+    venv_locust = os.path.join(ROOT_DIR, "venv", "Scripts", "locust.exe") if os.name == 'nt' else os.path.join(ROOT_DIR, "venv", "bin", "locust")
+    return venv_locust if os.path.exists(venv_locust) else "locust"
+
+
+def target_slug(target):
+    """Filesystem-safe name for a target URL (used as its report directory)"""
+    return re.sub(r"[^A-Za-z0-9]+", "_", re.sub(r"^https?://", "", target)).strip("_")
+
+
+def build_jobs(scenario_names, targets, timestamp, faults=None):
+    """
+    One job per (scenario, target) with an isolated report prefix.
+
+    With a fault schedule, each job gets its own fault proxy port and Locust
+    targets the proxy instead.
+    """
+    results_dir = os.path.join(ROOT_DIR, "reports")
+    jobs = []
+
+    for target in targets:
+        # Multiple targets get their own report directory so analyzers don't mix them
+        target_dir = results_dir if len(targets) == 1 else os.path.join(results_dir, target_slug(target))
+        os.makedirs(target_dir, exist_ok=True)
+
+        for scenario_name in scenario_names:
+            params = SCENARIOS[scenario_name]
+            users = params["users"]
+            csv_prefix = os.path.join(target_dir, f"results_{users}users_{timestamp}")
+            proxy_port = FAULT_PROXY_PORT + len(jobs)
+            jobs.append({
+                "scenario": scenario_name,
+                "target": target,
+                "host": f"http://127.0.0.1:{proxy_port}" if faults else target,
+                "faults": faults,
+                "proxy_port": proxy_port,
+                "fault_log": f"{csv_prefix}_faults.json",
+                "users": users,
+                "spawn_rate": params["spawn_rate"],
+                "duration": params["duration"],
+                "warmup": params.get("warmup", "0s"),
+                "csv_prefix": csv_prefix,
+                "html_report": os.path.join(target_dir, f"report_{users}users_{timestamp}.html"),
+                "log_file": os.path.join(target_dir, f"locust_{users}users_{timestamp}.log"),
+            })
+
+    return jobs
+
+
+def build_command(job, locust_file, processes=None):
+    command = [
+        find_locust_command(),
+        "-f", locust_file,
+        "--headless",
+        "--host", job["host"],
+        "-u", str(job["users"]),
+        "-r", str(job["spawn_rate"]),
+        "--run-time", job["duration"],
+        "--warmup", job["warmup"],
+        "--scenario", job["scenario"],
+        "--csv", job["csv_prefix"],
+        "--csv-full-history",
+        "--html", job["html_report"],
+        "--loglevel", "INFO"
+    ]
+    if processes:
+        # Workers are forked after the locustfile and config are loaded once
+        command += ["--processes", str(processes)]
+    return command
+
+
+@contextmanager
+def fault_proxy(job):
+    """Run the job's fault injection proxy (fault_proxy.py) around the block, if it has a schedule"""
+    if not job["faults"]:
+        yield
+        return
+
+    proxy = subprocess.Popen([
+        sys.executable, "fault_proxy.py",
+        "--upstream", job["target"],
+        "--port", str(job["proxy_port"]),
+        "--schedule", job["faults"],
+        "--log", job["fault_log"],
+    ], cwd=ROOT_DIR)
+    try:
+        # Wait until it accepts connections so no request misses the proxy
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", job["proxy_port"]), timeout=1).close()
+                break
+            except OSError:
+                if proxy.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"Fault proxy did not start on port {job['proxy_port']}")
+                time.sleep(0.1)
+        yield
+    finally:
+        proxy.terminate()
+        proxy.wait()
+
+
+def run_serial(jobs, locust_file, processes=None):
+    """Run jobs one after another, streaming Locust output to the terminal"""
+    for job in jobs:
+        users = job["users"]
+        print(f"[{job['scenario'].upper()} TEST] ({users} users)")
+        print("========================================")
+        print(f"Expected: Load test with {users} users, rate {job['spawn_rate']}")
+        print(f"Target: {job['target']}")
+        if job["faults"]:
+            print(f"Faults: {job['faults']} (via {job['host']})")
+        print("----------------------------------------")
+
+        try:
+            with fault_proxy(job):
+                subprocess.run(build_command(job, locust_file, processes), check=True, cwd=ROOT_DIR)
+            job["status"] = "passed"
+            print()
+        except (subprocess.CalledProcessError, RuntimeError) as e:
+            job["status"] = "failed"
+            print(f"[{job['scenario']}] Test failed with error: {e}\n")
+
+
+def run_job_captured(job, locust_file, processes=None):
+    """Run one job with its output captured to a per-job log file"""
+    with open(job["log_file"], "w", encoding="utf-8") as log:
+        try:
+            with fault_proxy(job):
+                result = subprocess.run(build_command(job, locust_file, processes), cwd=ROOT_DIR,
+                                        stdout=log, stderr=subprocess.STDOUT)
+            job["status"] = "passed" if result.returncode == 0 else "failed"
+        except RuntimeError as e:
+            log.write(f"{e}\n")
+            job["status"] = "failed"
+    return job
+
+
+def run_parallel(jobs, locust_file, max_workers, processes=None):
+    """Run jobs concurrently, one Locust process (one core) per slot"""
+    # Longest-processing-time first: start the heaviest scenarios early
+    ordered = sorted(jobs, key=lambda job: job["users"], reverse=True)
+    print(f"Running {len(jobs)} jobs on {max_workers} parallel slots\n")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(run_job_captured, job, locust_file, processes): job for job in ordered}
+        for future in as_completed(futures):
+            job = future.result()
+            icon = "✅" if job["status"] == "passed" else "❌"
+            print(f"{icon} [{job['scenario'].upper()}] {job['target']} ({job['users']} users) - log: {job['log_file']}")
+
+
+def read_aggregated_row(csv_prefix):
+    """Aggregated row of a Locust stats CSV, or None if missing"""
+    try:
+        with open(f"{csv_prefix}_stats.csv", "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                if row["Name"] == "Aggregated":
+                    return row
+    except (OSError, KeyError):
+        pass
+    return None
+
+
+def write_merged_summary(jobs, timestamp):
+    """Summary table across every scenario and target"""
+    lines = [
+        "# Parallel Run Summary\n\n",
+        f"**Run:** {timestamp}\n\n",
+        "| Target | Scenario | Users | Status | Requests | Failures | Avg Time | p95 | RPS |\n",
+        "|--------|----------|-------|--------|----------|----------|----------|-----|-----|\n",
+    ]
+
+    for job in sorted(jobs, key=lambda j: (j["target"], j["users"])):
+        row = read_aggregated_row(job["csv_prefix"])
+        if row:
+            lines.append(
+                f"| {job['target']} | {job['scenario']} | {job['users']} | {job['status']} | "
+                f"{int(row['Request Count']):,} | {row['Failure Count']} | "
+                f"{float(row['Average Response Time']):.0f}ms | {row['95%']}ms | {float(row['Requests/s']):.2f} |\n"
+            )
+        else:
+            lines.append(f"| {job['target']} | {job['scenario']} | {job['users']} | {job['status']} | - | - | - | - | - |\n")
+
+    summary = "".join(lines)
+    output_file = os.path.join(ROOT_DIR, "reports", f"PARALLEL_SUMMARY_{timestamp}.md")
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write(summary)
+
+    print()
+    print(summary)
+    print(f"Summary: {output_file}")
+
 
-    if not os.path.exists(results_dir):
-        os.makedirs(results_dir)
+def start_live_reports(timestamp):
+    """Start the report builders in watch mode; they update reports as CSVs are written"""
+    log_file = os.path.join(ROOT_DIR, "reports", f"live_reports_{timestamp}.log")
+    log = open(log_file, "w", encoding="utf-8")
+    watchers = [
+        subprocess.Popen([sys.executable, "-u", script, "--watch"], cwd=ROOT_DIR,
+                         stdout=log, stderr=subprocess.STDOUT)
+        for script in REPORT_SCRIPTS
+    ]
+    print(f"Live reports: COMPARISON.md and dashboard.html update during the run (log: {log_file})\n")
+    return watchers, log
 
+
+def stop_live_reports(watchers, log):
+    """Stop the watchers, then bring every report up to date with the final CSVs"""
+    for watcher in watchers:
+        watcher.terminate()
+    for watcher in watchers:
+        watcher.wait()
+    log.close()
+    for script in REPORT_SCRIPTS:
+        subprocess.run([sys.executable, script], cwd=ROOT_DIR)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the configured Locust load scenarios")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help="Scenarios to run (default: all in config.SCENARIOS)")
+    parser.add_argument("--targets", nargs="+", default=[API_BASE_URL],
+                        help="One or more base URLs (e.g. staging shards); default: API_BASE_URL")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run independent scenario/target jobs concurrently")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1,
+                        help="Concurrent Locust processes in parallel mode (default: CPU cores)")
+    parser.add_argument("--locustfile", default="locustfile.py",
+                        help="Locustfile relative to the project root")
+    parser.add_argument("--processes", type=int,
+                        help="Locust worker processes per run (-1 = one per core), forked after a "
+                             "single import of the locustfile (Linux/macOS only)")
+    parser.add_argument("--live-reports", action="store_true",
+                        help="Keep COMPARISON.md and dashboard.html updated while tests run")
+    parser.add_argument("--faults", choices=list(FAULT_SCHEDULES),
+                        help="Run each scenario through fault_proxy.py with this config.FAULT_SCHEDULES "
+                             "schedule (fault log: <csv prefix>_faults.json)")
+    return parser.parse_args()
+
+
+def run_tests():
+    args = parse_args()
+    locust_file = os.path.join(ROOT_DIR, args.locustfile)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    jobs = build_jobs(args.scenarios, args.targets, timestamp, args.faults)
+    
+    # .env was parsed when config was imported above; Locust processes inherit it
+    os.environ["PERF_CONFIG_PRELOADED"] = "1"
 
     print("========================================")
     print("  LOCUST PERFORMANCE TEST SUITE")
     print("  JSONPlaceholder API - Advanced Metrics")
     print("========================================\n")
 
-    for scenario_name, params in SCENARIOS.items():
-        users = params["users"]
-        spawn_rate = params["spawn_rate"]
-        duration = params["duration"]
-        
-        print(f"[{scenario_name.upper()} TEST] ({users} users)")
-        print("========================================")
-        print(f"Expected: Load test with {users} users, rate {spawn_rate}")
-        print("----------------------------------------")
-        
-        csv_prefix = os.path.join(results_dir, f"results_{users}users_{timestamp}")
-        html_report = os.path.join(results_dir, f"report_{users}users_{timestamp}.html")
-
-        # Determine python/locust commands based on venv in root
-        venv_locust = os.path.join(root_dir, "venv", "Scripts", "locust.exe") if os.name == 'nt' else os.path.join(root_dir, "venv", "bin", "locust")
-        
-        if os.path.exists(venv_locust):
-            locust_cmd = venv_locust
+    if args.live_reports:
+        live_reports = start_live_reports(timestamp)
+
+    try:
+        if args.parallel and len(jobs) > 1:
+            run_parallel(jobs, locust_file, max(1, min(args.max_workers, len(jobs))), args.processes)
         else:
-            locust_cmd = "locust"
-
-        cmd = [
-            locust_cmd,
-            "-f", locust_file,
-            "--headless",
-            "-u", str(users),
-            "-r", str(spawn_rate),
-            "--run-time", duration,
-            "--csv", csv_prefix,
-            "--html", html_report,
-            "--loglevel", "INFO"
-        ]
-        
-        try:
-            subprocess.run(cmd, check=True, cwd=root_dir)
-            print()
-        except subprocess.CalledProcessError as e:
-            print(f"[{scenario_name}] Test failed with error: {e}\n")
+            run_serial(jobs, locust_file, args.processes)
+    finally:
+        if args.live_reports:
+            stop_live_reports(*live_reports)
 
     print("========================================")
     print("  ALL TESTS COMPLETED")
     print("========================================")
-    print(f"\nReports: {results_dir}\n")
+
+    if args.parallel or len(args.targets) > 1:
+        write_merged_summary(jobs, timestamp)
+
+    print(f"\nReports: {os.path.join(ROOT_DIR, 'reports')}\n")
 
 if __name__ == "__main__":
     run_tests()
@@ -9,4 +9,4 @@ if [ -f "venv/bin/python" ]; then
     PYTHON_CMD="venv/bin/python"
 fi
 
-$PYTHON_CMD tests/run_tests.py
\ No newline at end of file
+$PYTHON_CMD tests/run_tests.py "$@"
\ No newline at end of file
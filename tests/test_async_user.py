@@ -0,0 +1,39 @@
+"""
+Asyncio user (locustfile_async.py) against the local stub server
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("locust")
+pytest.importorskip("httpx")
+
+from config import ASYNC_SHUTDOWN_TIMEOUT  # noqa: E402
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STARTUP_ALLOWANCE = 10  # Seconds for Locust to import and start
+
+
+# Several users share the process's event loop
+@pytest.mark.parametrize("users", [1, 2])
+def test_run_time_limit_stops_logical_users(stub_server, users):
+    run_time = 4
+    env = dict(os.environ, ASYNC_LOGICAL_USERS="300")
+    start = time.monotonic()
+    result = subprocess.run(
+        [sys.executable, "-m", "locust", "-f", "locustfile_async.py", "--host", stub_server(),
+         "--headless", "-u", str(users), "-r", str(users), "-t", f"{run_time}s", "--only-summary"],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True,
+        timeout=run_time + ASYNC_SHUTDOWN_TIMEOUT + STARTUP_ALLOWANCE + 20
+    )
+    elapsed = time.monotonic() - start
+    output = result.stdout + result.stderr
+
+    assert result.returncode == 0, output[-2000:]
+    assert "--run-time limit reached" in output
+    assert "Aggregated" in output
+    assert "Traceback" not in output
+    assert elapsed < run_time + ASYNC_SHUTDOWN_TIMEOUT + STARTUP_ALLOWANCE
@@ -0,0 +1,66 @@
+"""
+Memory benchmark helpers (benchmarks/bench_memory.py)
+"""
+import tracemalloc
+
+from bench_memory import COMPONENTS, component_breakdown, deep_size, generate_report, growth_per_minute
+
+
+def level(users, rss_per_user):
+    names = [name for name, _ in COMPONENTS] + ["other"]
+    return {
+        "users": users, "rss_bytes": 64 * 1024 * 1024, "rss_per_user": rss_per_user,
+        "per_user": {name: 0 for name in names}, "custom_metrics_bytes": 0,
+    }
+
+
+def test_deep_size_counts_shared_objects_once():
+    shared = bytearray(1000)
+
+    assert deep_size({"a": [shared]}) > 1000
+    assert deep_size([shared, shared]) < deep_size([shared, bytearray(1000)])
+
+
+def test_component_breakdown_attributes_growth():
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        blocks = [bytearray(10000) for _ in range(10)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    totals = component_breakdown(before, after)
+
+    assert set(totals) == {name for name, _ in COMPONENTS} | {"other"}
+    assert totals["other"] >= sum(len(block) for block in blocks)
+
+
+def test_report_compares_against_baseline():
+    report = {"generated": "now", "levels": [level(100, 2048)], "soak": None}
+    baseline = {"generated": "before", "levels": [level(100, 1024)]}
+
+    markdown = generate_report(report, baseline)
+
+    assert "## Comparison with before" in markdown
+    assert "| 100 | 1.0 KB | 2.0 KB | +100.0% |" in markdown
+
+
+def test_growth_per_minute():
+    samples = [{"elapsed": 0, "rss_bytes": 1000}, {"elapsed": 30, "rss_bytes": 1500}, {"elapsed": 120, "rss_bytes": 3000}]
+
+    assert growth_per_minute(samples, ["rss_bytes"]) == {"rss_bytes": 1000}
+    assert growth_per_minute(samples[:1], ["rss_bytes"]) == {"rss_bytes": 0}
+
+
+def test_untraced_soak_omits_traced_growth():
+    soak = {
+        "users": 10, "duration": 60, "traced": False,
+        "samples": [{"elapsed": 60, "rss_bytes": 0, "custom_metrics_bytes": 0, "slow_requests": 0, "requests": 1}],
+        "growth_per_minute": {"rss_bytes": 0, "custom_metrics_bytes": 0},
+    }
+
+    markdown = generate_report({"generated": "now", "levels": [], "soak": soak})
+
+    assert "| RSS |" in markdown
+    assert "Traced allocations" not in markdown
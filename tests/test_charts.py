@@ -0,0 +1,28 @@
+"""
+LTTB downsampling of dashboard timelines (generate_charts.lttb)
+"""
+from generate_charts import lttb
+
+
+def test_short_series_unchanged():
+    points = [(x, x * 2) for x in range(10)]
+    assert lttb(points, 10) == points
+    assert lttb(points, 50) == points
+    assert lttb(points, 2) == points
+
+
+def test_keeps_threshold_points_with_endpoints():
+    points = [(x, (x * 37) % 11) for x in range(1000)]
+    sampled = lttb(points, 100)
+
+    assert len(sampled) == 100
+    assert sampled[0] == points[0]
+    assert sampled[-1] == points[-1]
+    assert [p[0] for p in sampled] == sorted(p[0] for p in sampled)
+
+
+def test_spike_survives():
+    points = [(x, 1.0) for x in range(1000)]
+    points[500] = (500, 250.0)
+
+    assert (500, 250.0) in lttb(points, 50)
@@ -0,0 +1,52 @@
+"""
+.env loading in config.py (project .env only, skipped when preloaded)
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DEFAULT_URL = "https://jsonplaceholder.typicode.com"
+ENV_FILE = "API_BASE_URL=http://from-env-file\n"
+
+
+def import_config(project_dir, preloaded=False):
+    """Import a copy of config.py in a fresh interpreter: (API_BASE_URL, dotenv imported)"""
+    shutil.copy(os.path.join(ROOT_DIR, "config.py"), project_dir)
+    env = {k: v for k, v in os.environ.items() if k not in ("API_BASE_URL", "PERF_CONFIG_PRELOADED")}
+    if preloaded:
+        env["PERF_CONFIG_PRELOADED"] = "1"
+
+    code = "import sys, config; print(config.API_BASE_URL, 'dotenv' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=project_dir, env=env,
+                            capture_output=True, text=True, check=True)
+    url, dotenv_imported = result.stdout.split()
+    return url, dotenv_imported == "True"
+
+
+def test_project_env_file_is_loaded(tmp_path):
+    pytest.importorskip("dotenv")
+    (tmp_path / ".env").write_text(ENV_FILE)
+
+    assert import_config(tmp_path) == ("http://from-env-file", True)
+
+
+def test_without_env_file_dotenv_is_not_imported(tmp_path):
+    assert import_config(tmp_path) == (DEFAULT_URL, False)
+
+
+def test_preloaded_environment_skips_the_parse(tmp_path):
+    (tmp_path / ".env").write_text(ENV_FILE)
+
+    assert import_config(tmp_path, preloaded=True) == (DEFAULT_URL, False)
+
+
+def test_parent_directory_env_file_is_ignored(tmp_path):
+    (tmp_path / ".env").write_text(ENV_FILE)
+    project = tmp_path / "project"
+    project.mkdir()
+
+    assert import_config(project) == (DEFAULT_URL, False)
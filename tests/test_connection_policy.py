@@ -0,0 +1,153 @@
+"""
+Connection reuse strategies (connection_policy.ConnectionPolicyAdapter)
+"""
+import gzip
+import http.server
+import json
+import threading
+
+import pytest
+import requests
+
+from connection_policy import PHASES, ConnectionPolicyAdapter, apply_connection_policy
+
+REQUESTS = 6
+POSTS = [{"id": i, "title": "lorem ipsum dolor sit amet"} for i in range(1, 101)]
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive JSON endpoint that counts the connections it accepts"""
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def do_GET(self, send_body=True):
+        body = json.dumps(POSTS if self.path == "/posts" else {"id": 1}).encode()
+        encoding = self.path[len("/coded/"):] if self.path.startswith("/coded/") else None
+        if self.path == "/empty":
+            # No content, but the header says gzip
+            self.send_response(204)
+            self.send_header("Content-Encoding", "gzip")
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)  # Body left as-is
+        elif "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET(send_body=False)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def send_requests(url, strategy, close_after=100):
+    """New connections opened per request, as reported on the responses"""
+    Handler.connections = 0
+    with requests.Session() as session:
+        apply_connection_policy(session, strategy, close_after, pool_size=1)
+        responses = [session.get(f"{url}/posts/1") for _ in range(REQUESTS)]
+
+    assert all(response.json() == {"id": 1} for response in responses)
+    return [response.new_connections for response in responses]
+
+
+def test_persistent_reuses_one_connection(server):
+    assert send_requests(server, "persistent") == [1, 0, 0, 0, 0, 0]
+    assert Handler.connections == 1
+
+
+def test_close_after_n_reconnects_every_n_requests(server):
+    assert send_requests(server, "close_after_n", close_after=2) == [1, 0, 1, 0, 1, 0]
+    assert Handler.connections == 3
+
+
+def test_new_per_request_never_reuses(server):
+    assert send_requests(server, "new_per_request") == [1] * REQUESTS
+    assert Handler.connections == REQUESTS
+
+
+def test_setup_time_only_on_new_connections(server):
+    with requests.Session() as session:
+        apply_connection_policy(session, "persistent", 100, pool_size=1)
+        first = session.get(f"{server}/posts/1")
+        second = session.get(f"{server}/posts/1")
+
+    assert first.connection_setup_time > 0
+    assert second.connection_setup_time == 0
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        ConnectionPolicyAdapter("sometimes")
+
+
+def test_phase_timings(server):
+    with requests.Session() as session:
+        apply_connection_policy(session, "persistent", 100, pool_size=1, phase_timing=True)
+        first = session.get(f"{server}/posts/1")
+        second = session.get(f"{server}/posts/1")
+
+    assert set(first.phase_timings) == set(PHASES)
+    assert first.phase_timings["connect"] > 0
+    assert first.phase_timings["tls"] == 0  # Plain http
+    assert second.phase_timings["connect"] == 0
+    assert second.phase_timings["ttfb"] > 0
+
+
+def test_compressed_body_is_decoded_and_wire_size_measured(server):
+    with requests.Session() as session:
+        apply_connection_policy(session, "persistent", 100, pool_size=1, accept_encoding="gzip")
+        response = session.get(f"{server}/posts")
+
+    assert response.request.headers["Accept-Encoding"] == "gzip"
+    assert response.json() == POSTS
+    assert response.wire_length < len(response.content)
+    assert response.decompress_time >= 0
+
+
+def compressed_session():
+    session = requests.Session()
+    apply_connection_policy(session, "persistent", 100, pool_size=1, accept_encoding="gzip")
+    return session
+
+
+def test_empty_body_with_content_encoding(server):
+    with compressed_session() as session:
+        no_content = session.get(f"{server}/empty")
+        head = session.head(f"{server}/posts")
+
+    assert no_content.status_code == 204
+    assert no_content.content == b""
+    assert no_content.wire_length == 0
+    assert head.headers["Content-Encoding"] == "gzip"
+    assert head.content == b""
+
+
+def test_wire_size_unknown_for_codings_we_do_not_decode(server):
+    with compressed_session() as session:
+        response = session.get(f"{server}/coded/x-custom")
+
+    assert response.json() == {"id": 1}
+    assert not hasattr(response, "wire_length")
@@ -0,0 +1,36 @@
+"""
+Fault schedules and route matching (faults)
+"""
+from faults import Fault, endpoint_affected, route_matches
+
+
+def test_route_matches_on_segment_boundaries():
+    assert route_matches("*", "/anything")
+    assert route_matches("/posts", "/posts")
+    assert route_matches("/posts", "/posts/1")
+    assert route_matches("/posts/", "/posts/1")
+    assert not route_matches("/posts", "/postsX")
+    assert not route_matches("/posts", "/comments")
+    assert not route_matches("/posts/1", "/posts")
+
+
+def test_fault_applies_during_its_window_to_its_methods():
+    fault = Fault({"type": "error", "route": "/posts", "methods": ["post"], "start": 10, "duration": 5}, 1000)
+
+    assert fault.applies("POST", "/posts", 1010)
+    assert fault.applies("POST", "/posts/1", 1014.9)
+    assert not fault.applies("POST", "/posts", 1009.9)
+    assert not fault.applies("POST", "/posts", 1015)
+    assert not fault.applies("GET", "/posts", 1012)
+    assert not fault.applies("POST", "/users", 1012)
+
+
+def test_endpoint_affected():
+    fault = Fault({"type": "latency", "route": "/posts", "methods": ["GET"], "start": 0, "duration": 5,
+                   "ms": 100}, 0).to_dict()
+
+    assert endpoint_affected(fault, "GET /posts?userId=1")
+    assert endpoint_affected(fault, "GET /posts/1")
+    assert not endpoint_affected(fault, "PUT /posts/1")
+    assert not endpoint_affected(fault, "GET /comments")
+    assert endpoint_affected(fault, "JOURNEY read_post")
@@ -0,0 +1,61 @@
+"""
+Bucketed latency histograms (histograms.Histogram)
+"""
+import random
+
+from histograms import Histogram
+
+
+def test_buckets_get_coarser_with_magnitude():
+    assert Histogram.bucket(3.14) == 3.1
+    assert Histogram.bucket(42.4) == 42
+    assert Histogram.bucket(456) == 460
+    assert Histogram.bucket(4567) == 4600
+    assert Histogram.bucket(45678) == 46000
+
+
+def test_percentiles_and_mean():
+    hist = Histogram()
+    for value in range(1, 101):
+        hist.record(value)
+
+    assert hist.count == 100
+    assert hist.mean() == 50.5
+    assert hist.percentile(0.5) == 50
+    assert hist.percentile(0.95) == 95
+    assert hist.percentile(1.0) == 100
+    assert hist.max == 100
+
+
+def test_empty_histogram():
+    hist = Histogram()
+
+    assert hist.mean() == 0.0
+    assert hist.percentile(0.95) == 0.0
+
+
+def test_merge_matches_recording_everything():
+    values = [random.uniform(0, 5000) for _ in range(2000)]
+    combined, first, second = Histogram(), Histogram(), Histogram()
+    for value in values:
+        combined.record(value)
+    for value in values[:700]:
+        first.record(value)
+    for value in values[700:]:
+        second.record(value)
+
+    first.merge(second)
+
+    assert first.buckets == combined.buckets
+    assert first.count == combined.count
+    assert first.max == combined.max
+    assert first.percentile(0.99) == combined.percentile(0.99)
+
+
+def test_memory_is_bounded_by_buckets():
+    hist = Histogram()
+    for _ in range(100000):
+        hist.record(random.uniform(0, 10000))
+
+    # At most 100 + 90 + 90 + 90 (+1) distinct keys up to 10 s
+    assert len(hist.buckets) <= 371
@@ -0,0 +1,33 @@
+"""
+Hot-path micro-benchmarks (benchmarks/bench_hot_path.py)
+"""
+import pytest
+
+pytest.importorskip("locust")
+
+import bench_hot_path  # noqa: E402
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = {"results": {"a": {"ops_per_sec": 1000}, "b": {"ops_per_sec": 1000}}}
+    results = {"a": {"ops_per_sec": 850}, "b": {"ops_per_sec": 950}, "c": {"ops_per_sec": 10}}
+
+    assert bench_hot_path.compare(results, baseline, threshold=10) == ["a"]
+
+
+def test_every_benchmark_runs():
+    results = bench_hot_path.run_benchmarks(min_time=0.001, repeats=1)
+
+    assert set(results) == set(bench_hot_path.build_benchmarks())
+    assert any(name.startswith("task ") for name in results)
+    assert all(result["ops_per_sec"] > 0 for result in results.values())
+
+
+def test_sla_violation_benchmark_violates(monkeypatch):
+    monkeypatch.setattr(bench_hot_path.locustfile, "ENABLE_ASSERTIONS", True)
+    bench_hot_path.reset_metrics()
+
+    bench_hot_path.build_benchmarks()["on_request (SLA violation)"]()
+
+    assert bench_hot_path.locustfile.custom_metrics["sla_violations"] == 1
+    bench_hot_path.reset_metrics()
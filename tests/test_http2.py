@@ -0,0 +1,116 @@
+"""
+HTTP/2 user mode (locustfile_http2): catch_response semantics and the shared session
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("locust")
+pytest.importorskip("h2")
+
+from locust.exception import CatchResponseError, ResponseError  # noqa: E402
+
+from locustfile_http2 import HTTP2ResponseContextManager, HTTP2Session  # noqa: E402
+
+
+class Recorder:
+    """Stand-in for events.request that keeps every fired request"""
+
+    def __init__(self):
+        self.calls = []
+
+    def fire(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+def response_manager(status=200, exception=None):
+    event = Recorder()
+    meta = {
+        "request_type": "GET", "name": "GET /posts/1", "response_time": 1.0, "response_length": 2,
+        "response": None, "context": {}, "exception": exception,
+    }
+    response = SimpleNamespace(status_code=status, content=b"{}")
+    return HTTP2ResponseContextManager(response, event, meta), event.calls
+
+
+def test_reported_once_when_the_block_exits():
+    manager, calls = response_manager()
+    with manager as response:
+        assert response.status_code == 200
+        assert calls == []
+
+    assert len(calls) == 1
+    assert calls[0]["exception"] is None
+
+
+def test_success_overrides_http_error():
+    manager, calls = response_manager(404, CatchResponseError("HTTP 404"))
+    with manager as response:
+        response.success()
+
+    assert [call["exception"] for call in calls] == [None]
+
+
+def test_failure_reports_message():
+    manager, calls = response_manager()
+    with manager as response:
+        response.failure("Missing key 'title'")
+
+    assert len(calls) == 1
+    assert isinstance(calls[0]["exception"], CatchResponseError)
+    assert str(calls[0]["exception"]) == "Missing key 'title'"
+
+
+def test_last_call_wins():
+    manager, calls = response_manager()
+    with manager as response:
+        response.failure("first check failed")
+        response.success()
+
+    manager, more_calls = response_manager()
+    with manager as response:
+        response.success()
+        response.failure("second check failed")
+
+    assert [call["exception"] for call in calls] == [None]
+    assert [str(call["exception"]) for call in more_calls] == ["second check failed"]
+
+
+def test_exception_inside_block():
+    # Other exceptions propagate unreported (Locust logs them as task errors)
+    manager, calls = response_manager()
+    with pytest.raises(KeyError):
+        with manager:
+            raise KeyError("title")
+    assert calls == []
+
+    # ResponseError marks the request failed and is swallowed
+    manager, calls = response_manager()
+    with manager:
+        raise ResponseError("bad payload")
+    assert [str(call["exception"]) for call in calls] == ["bad payload"]
+
+    # A recorded result is still reported, and the exception still propagates
+    manager, calls = response_manager()
+    with pytest.raises(KeyError):
+        with manager as response:
+            response.success()
+            raise KeyError("title")
+    assert [call["exception"] for call in calls] == [None]
+
+
+def test_session_speaks_h2_to_the_stub(stub_server):
+    event = Recorder()
+    session = HTTP2Session(stub_server("h2"), event)
+    try:
+        response = session.request("GET", "/posts/1", name="GET /posts/1")
+        with session.request("GET", "/missing/1", name="GET /missing", catch_response=True):
+            pass
+    finally:
+        session.client.close()
+
+    assert response.http_version == "HTTP/2"
+    assert response.json()["id"] == 1
+    assert [call["name"] for call in event.calls] == ["GET /posts/1", "GET /missing"]
+    assert event.calls[0]["exception"] is None
+    assert str(event.calls[1]["exception"]) == "HTTP 404"
@@ -0,0 +1,164 @@
+"""
+User journeys (journeys.run_journey, locustfile_journeys.JOURNEYS) and how
+JOURNEY entries are kept out of request totals
+"""
+import json
+
+import pytest
+
+pytest.importorskip("locust")
+
+from locust.env import Environment  # noqa: E402
+
+import locustfile  # noqa: E402
+from analyze_results import generate_summary_table  # noqa: E402
+from journeys import Journey, Step, run_journey  # noqa: E402
+from locustfile_journeys import JOURNEYS, JourneyUser  # noqa: E402
+from stub_server import StubAPI  # noqa: E402
+
+API = StubAPI()
+
+
+class FakeResponse:
+    """catch_response stand-in that keeps the recorded outcome"""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+        self.failed = None
+
+    def json(self):
+        return json.loads(self.content)
+
+    def success(self):
+        self.failed = None
+
+    def failure(self, message):
+        self.failed = message
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeClient:
+    """Serves requests from the stub route table, logs them like Locust's client and records what was sent"""
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.sent = []
+
+    def request(self, method, url, name=None, catch_response=False, **kwargs):
+        self.sent.append((method, url))
+        self.stats.log_request(method, name, 10, 100)
+        body = json.dumps(kwargs["json"]).encode() if "json" in kwargs else b""
+        return FakeResponse(*API.handle(method, url, body))
+
+
+@pytest.fixture
+def user():
+    """JourneyUser wired to the fake client, with its own Environment"""
+    user = object.__new__(JourneyUser)
+    user.environment = Environment()
+    user.client = FakeClient(user.environment.stats)
+    return user
+
+
+def journey(name):
+    return next(j for j in JOURNEYS if j.name == name)
+
+
+def reported(user, name):
+    """The JOURNEY stats entry of a journey"""
+    return user.environment.stats.entries[(f"JOURNEY {name}", "JOURNEY")]
+
+
+def journey_errors(user):
+    return [error.error for error in user.environment.stats.errors.values() if error.method == "JOURNEY"]
+
+
+def test_journey_user_runs_only_journeys():
+    names = {task.__name__ for task in JourneyUser.tasks}
+
+    assert names == {f"journey_{journey.name}" for journey in JOURNEYS}
+
+
+def test_read_post_follows_extracted_ids(user):
+    run_journey(user, journey("read_post"))
+
+    urls = [url for _, url in user.client.sent]
+    post_id = int(urls[1].rsplit("/", 1)[1])
+    author_id = API.data["posts"][post_id - 1]["userId"]
+    assert urls == ["/posts", f"/posts/{post_id}", f"/comments?postId={post_id}", f"/users/{author_id}"]
+
+    report = reported(user, "read_post")
+    assert (report.num_requests, report.num_failures) == (1, 0)
+    assert report.total_content_length > 0
+
+
+def test_journeys_stay_out_of_the_request_totals(user):
+    run_journey(user, journey("read_post"))
+
+    total = user.environment.stats.total
+    assert total.num_requests == len(user.client.sent) == 4
+    assert reported(user, "read_post").num_requests == 1
+
+
+def test_edit_post_updates_one_of_the_users_posts(user):
+    run_journey(user, journey("edit_post"))
+
+    (_, _), (_, user_posts), (method, edited) = user.client.sent
+    user_id = int(user_posts.split("=")[1])
+    post_id = int(edited.rsplit("/", 1)[1])
+    assert method == "PUT"
+    assert API.data["posts"][post_id - 1]["userId"] == user_id
+    assert reported(user, "edit_post").num_failures == 0
+
+
+def test_failed_step_stops_the_journey(user):
+    broken = Journey("broken", [
+        Step("GET", "/posts/1", "GET /posts/1", required_keys=["missing"]),
+        Step("GET", "/users/1", "GET /users/1"),
+    ])
+
+    run_journey(user, broken)
+
+    assert user.client.sent == [("GET", "/posts/1")]
+    assert reported(user, "broken").num_failures == 1
+    assert user.environment.stats.total.num_failures == 0
+    [error] = journey_errors(user)
+    assert str(error).startswith("GET /posts/1: ")
+
+
+def test_extraction_error_fails_the_step(user):
+    broken = Journey("broken", [
+        Step("GET", "/posts/1", "GET /posts/1", extract={"post_id": lambda post: post["missing"]}),
+    ])
+
+    run_journey(user, broken)
+
+    [error] = journey_errors(user)
+    assert "could not extract 'post_id'" in str(error)
+
+
+def test_journeys_feed_their_sla_windows(user, monkeypatch):
+    monkeypatch.setattr(locustfile, "ENABLE_ASSERTIONS", True)
+    monkeypatch.setitem(locustfile.custom_metrics, "sla_windows", {})
+    monkeypatch.setitem(locustfile.warmup, "until", 0.0)
+
+    run_journey(user, journey("read_post"))
+
+    tracker = locustfile.custom_metrics["sla_windows"]["JOURNEY read_post"]
+    assert tracker.requests == 1
+
+
+def test_summary_totals_leave_out_journeys():
+    stat = {"type": "GET", "name": "GET /posts", "requests": 100, "failures": 1, "avg_time": 50.0,
+            "rps": 10.0, "avg_size": 1000.0}
+    journey_stat = dict(stat, type="JOURNEY", name="JOURNEY read_post", requests=25, avg_time=400.0, rps=2.5)
+
+    table = generate_summary_table({"10": [stat, journey_stat]})
+
+    assert "| 10 users | 100 | 1 | 10.00 | 50ms |" in table
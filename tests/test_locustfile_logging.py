@@ -0,0 +1,33 @@
+"""
+Logging setup in locustfile.py (deferred to Locust's init event)
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("locust")
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def root_handlers_after(code):
+    """Run code after importing locustfile in a fresh interpreter; returns the root handler count"""
+    script = f"import logging, locustfile\n{code}\nprint(len(logging.getLogger().handlers))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT_DIR,
+                            capture_output=True, text=True, check=True)
+    return int(result.stdout.split()[-1])
+
+
+def test_import_leaves_logging_alone():
+    assert root_handlers_after("") == 0
+
+
+def test_init_configures_logging_when_nothing_else_did():
+    assert root_handlers_after("locustfile.events.init.fire(environment=None)") == 1
+
+
+def test_init_keeps_existing_handlers():
+    code = "logging.getLogger().addHandler(logging.NullHandler())\nlocustfile.events.init.fire(environment=None)"
+    assert root_handlers_after(code) == 1
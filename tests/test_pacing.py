@@ -0,0 +1,60 @@
+"""
+Think-time and pacing models (pacing.make_wait_time, pacing.task_rate)
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import pacing
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock for the paced models, advanced by the test"""
+    now = [0.0]
+    monkeypatch.setattr(pacing, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def test_think_time_models():
+    user = SimpleNamespace()
+
+    assert pacing.make_wait_time({"model": "constant", "seconds": 2})(user) == 2
+    assert 1 <= pacing.make_wait_time({"model": "between", "min": 1, "max": 3})(user) <= 3
+    assert pacing.make_wait_time({"model": "recorded", "samples": [0.5]})(user) == 0.5
+    assert pacing.make_wait_time({"model": "poisson", "rate": 2})(user) >= 0
+
+
+def test_constant_pacing_absorbs_task_time(clock):
+    wait_time = pacing.make_wait_time({"model": "constant_pacing", "interval": 2})
+    user = SimpleNamespace()
+
+    assert wait_time(user) == 2
+    clock[0] = 2.5  # Task took 0.5 s
+    assert wait_time(user) == 1.5
+    clock[0] = 7.0  # Task took 3 s, longer than the interval
+    assert wait_time(user) == 0
+
+
+def test_per_task_override():
+    spec = {"model": "constant", "seconds": 1, "tasks": {"create_post": {"model": "constant", "seconds": 5}}}
+    wait_time = pacing.make_wait_time(spec)
+
+    assert wait_time(SimpleNamespace(last_task="create_post")) == 5
+    assert wait_time(SimpleNamespace(last_task="get_all_posts")) == 1
+    assert wait_time(SimpleNamespace()) == 1
+
+
+def test_unknown_model():
+    with pytest.raises(ValueError):
+        pacing.make_wait_time({"model": "burst"})
+
+
+def test_task_rate():
+    assert pacing.task_rate({"model": "constant", "seconds": 2}, task_time=0.5) == 0.4
+    assert pacing.task_rate({"model": "between", "min": 1, "max": 3}) == 0.5
+    assert pacing.task_rate({"model": "recorded", "samples": [1, 3]}) == 0.5
+    assert pacing.task_rate({"model": "poisson", "rate": 0.5}, task_time=10) == 0.5
+    assert pacing.task_rate({"model": "constant_pacing", "interval": 2}) == 0.5
+    assert pacing.task_rate({"model": "constant_pacing", "interval": 2}, task_time=4) == 0.25
+    assert pacing.task_rate({"model": "constant", "seconds": 0}) == 0.0
@@ -0,0 +1,32 @@
+"""
+Payload size budgets in the comparison report (analyze_results)
+"""
+from analyze_results import format_bytes, generate_payload_section
+
+
+def stat(request_type, name, avg_size, rps=2.0):
+    return {'type': request_type, 'name': name, 'avg_size': avg_size, 'rps': rps}
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512B"
+    assert format_bytes(1500) == "1.5KB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0MB"
+
+
+def test_payload_section_checks_budgets():
+    all_stats = {'10': [
+        stat('GET', 'GET /posts/1', 1500),
+        stat('GET', 'GET /users', 5000, rps=1.0),
+        stat('DELETE', 'DELETE /posts/1', 10),
+    ]}
+
+    section = generate_payload_section(all_stats)
+
+    assert "| GET /posts/1 | 10 users | 1.5KB | 1,000B | 2.9KB/s | 🔴 Over budget |" in section
+    assert "| GET /users | 10 users | 4.9KB | 7.8KB | 4.9KB/s | ✅ |" in section
+    assert "DELETE" not in section
+
+
+def test_no_budgeted_endpoints_no_section():
+    assert generate_payload_section({'10': [stat('DELETE', 'DELETE /posts/1', 10)]}) == ""
@@ -0,0 +1,111 @@
+"""
+Report build cache invalidation (report_cache.BuildCache)
+"""
+import pytest
+
+from report_cache import BuildCache
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Stand-in for a report generator module"""
+    path = tmp_path / "generator.py"
+    path.write_text("VERSION = 1\n")
+    return path
+
+
+def cache_for(tmp_path, source, enabled=True):
+    return BuildCache("test", str(tmp_path / "reports"), enabled=enabled, sources=[str(source)])
+
+
+def build_section(cache, key, builds):
+    return cache.section("summary", key, lambda: builds.append(key) or f"section {key}")
+
+
+def test_key_is_stable_and_order_sensitive():
+    assert BuildCache.key("a", 1) == BuildCache.key("a", 1)
+    assert BuildCache.key("a", 1) != BuildCache.key(1, "a")
+
+
+def test_section_reused_until_key_changes(tmp_path, source):
+    builds = []
+    cache = cache_for(tmp_path, source)
+    build_section(cache, "k1", builds)
+    cache.save()
+
+    cache = cache_for(tmp_path, source)
+    assert build_section(cache, "k1", builds) == "section k1"
+    assert (cache.hits, cache.misses) == (1, 0)
+
+    build_section(cache, "k2", builds)
+    assert builds == ["k1", "k2"]
+
+
+def test_source_change_invalidates_everything(tmp_path, source):
+    builds = []
+    report = tmp_path / "COMPARISON.md"
+    report.write_text("report")
+    cache = cache_for(tmp_path, source)
+    build_section(cache, "k1", builds)
+    cache.record(str(report), "k1")
+    cache.save()
+    assert cache_for(tmp_path, source).is_current(str(report), "k1")
+
+    source.write_text("VERSION = 22\n")
+    cache = cache_for(tmp_path, source)
+
+    assert not cache.is_current(str(report), "k1")
+    build_section(cache, "k1", builds)
+    assert builds == ["k1", "k1"]
+
+
+def test_input_change_reparses(tmp_path, source):
+    data = tmp_path / "results_stats.csv"
+    data.write_text("a\n")
+    parsed = []
+
+    def parse(path):
+        parsed.append(path)
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    cache = cache_for(tmp_path, source)
+    cache.load(str(data), parse, "stats")
+    cache.save()
+
+    cache = cache_for(tmp_path, source)
+    assert cache.load(str(data), parse, "stats") == "a\n"
+    data.write_text("a\nb\n")
+    assert cache.load(str(data), parse, "stats") == "a\nb\n"
+    assert len(parsed) == 2
+
+
+def test_disabled_cache_always_builds(tmp_path, source):
+    builds = []
+    for _ in range(2):
+        cache = cache_for(tmp_path, source, enabled=False)
+        build_section(cache, "k1", builds)
+        cache.save()
+
+    assert builds == ["k1", "k1"]
+    assert not (tmp_path / "reports" / ".build_cache").exists()
+
+
+@pytest.mark.parametrize("content", [
+    b"",                                    # Truncated (EOFError)
+    b"not a pickle",                        # UnpicklingError
+    b"cno_such_module\nthing\n.",           # ModuleNotFoundError while unpickling
+])
+def test_unreadable_entry_is_rebuilt(tmp_path, source, content):
+    builds = []
+    cache = cache_for(tmp_path, source)
+    build_section(cache, "k1", builds)
+    cache.save()
+    for entry in (tmp_path / "reports" / ".build_cache" / "test").iterdir():
+        entry.write_bytes(content)
+
+    cache = cache_for(tmp_path, source)
+
+    assert build_section(cache, "k1", builds) == "section k1"
+    assert builds == ["k1", "k1"]
+    assert (cache.hits, cache.misses) == (0, 1)
@@ -0,0 +1,40 @@
+"""
+Custom metrics recorded by the request listener (locustfile.on_request)
+"""
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("locust")
+
+import locustfile  # noqa: E402
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Empty custom_metrics for the duration of a test"""
+    fresh = {name: type(value)() for name, value in locustfile.custom_metrics.items()}
+    monkeypatch.setattr(locustfile, "custom_metrics", fresh)
+    return fresh
+
+
+def test_metrics_are_keyed_by_stats_name(metrics):
+    response = SimpleNamespace(connection_setup_time=1.5, new_connections=1, wire_length=90, decompress_time=0.1)
+
+    locustfile.on_request("GET", "GET /posts", 120.0, 27000, None, response=response)
+    locustfile.on_request("GET", "/posts/1", 50.0, 250, None, response=response)
+
+    keys = {"GET /posts", "GET /posts/1"}
+    assert set(metrics["connections"]) == keys
+    assert set(metrics["payloads"]) == keys
+    assert set(metrics["sla_windows"]) == keys
+    assert metrics["payloads"]["GET /posts"]["wire_bytes"] == 90
+
+
+def test_wire_size_only_counted_when_measured(metrics):
+    locustfile.on_request("GET", "GET /posts", 120.0, 27000, None, response=SimpleNamespace())
+
+    payload = metrics["payloads"]["GET /posts"]
+    assert payload["bytes"] == 27000
+    assert payload["measured"] == 0
+    assert payload["wire_bytes"] == 0
@@ -0,0 +1,60 @@
+"""
+Parallel scenario runner (tests/run_tests.py): job layout and merged summary
+"""
+import csv
+import os
+
+import pytest
+
+import run_tests
+
+TIMESTAMP = "20260101_120000"
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    """Write reports under tmp_path instead of the repository"""
+    monkeypatch.setattr(run_tests, "ROOT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def write_stats(csv_prefix, requests, failures, average, p95, rps):
+    with open(f"{csv_prefix}_stats.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Type", "Name", "Request Count", "Failure Count", "Average Response Time", "95%",
+                         "Requests/s"])
+        writer.writerow(["GET", "GET /posts", requests, failures, average, p95, rps])
+        writer.writerow(["", "Aggregated", requests, failures, average, p95, rps])
+
+
+def test_target_slug():
+    assert run_tests.target_slug("https://staging-1.example.com:8443/api") == "staging_1_example_com_8443_api"
+
+
+def test_single_target_keeps_the_reports_directory(root):
+    jobs = run_tests.build_jobs(["baseline", "stress"], ["http://a.test"], TIMESTAMP)
+
+    assert [job["users"] for job in jobs] == [10, 100]
+    assert {os.path.dirname(job["csv_prefix"]) for job in jobs} == {str(root / "reports")}
+
+
+def test_each_target_gets_its_own_directory(root):
+    jobs = run_tests.build_jobs(["baseline"], ["http://a.test", "http://b.test"], TIMESTAMP)
+
+    assert [os.path.dirname(job["csv_prefix"]) for job in jobs] == [
+        str(root / "reports" / "a_test"), str(root / "reports" / "b_test")
+    ]
+    assert len({job["log_file"] for job in jobs}) == 2
+
+
+def test_merged_summary(root):
+    jobs = run_tests.build_jobs(["baseline"], ["http://a.test", "http://b.test"], TIMESTAMP)
+    jobs[0]["status"] = "passed"
+    jobs[1]["status"] = "failed"
+    write_stats(jobs[0]["csv_prefix"], 1234, 5, 41.6, 90, 12.5)
+
+    run_tests.write_merged_summary(jobs, TIMESTAMP)
+
+    summary = (root / "reports" / f"PARALLEL_SUMMARY_{TIMESTAMP}.md").read_text(encoding="utf-8")
+    assert "| http://a.test | baseline | 10 | passed | 1,234 | 5 | 42ms | 90ms | 12.50 |" in summary
+    assert "| http://b.test | baseline | 10 | failed | - | - | - | - | - |" in summary
@@ -0,0 +1,89 @@
+"""
+Windowed percentile SLA evaluation (sla.check_window, sla.WindowedSLA,
+analyze_results.evaluate_sla_windows)
+"""
+from analyze_results import evaluate_sla_windows
+from sla import WindowedSLA, check_window
+
+SPEC = {'percentiles': {0.95: 100, 0.99: 200}, 'window': 60, 'error_budget': 0.05}
+
+
+def test_check_window():
+    assert check_window(SPEC, {0.95: 80, 0.99: 150}, 100, 5) == []
+    assert check_window(SPEC, {0.95: 120, 0.99: 150}, 100, 0) == ["p95 120ms > 100ms"]
+    assert check_window(SPEC, {0.95: 80, 0.99: 150}, 100, 6) == ["errors 6.0% > 5.0%"]
+
+
+def test_window_closes_when_the_next_request_arrives_after_it():
+    tracker = WindowedSLA(SPEC, now=1000)
+    for second in range(60):
+        assert tracker.record(1000 + second, 50, failed=False) is None
+
+    closed = tracker.record(1060, 50, failed=False)
+
+    assert closed['start'] == 0
+    assert closed['requests'] == 60
+    assert closed['violations'] == []
+    assert closed['complete']
+    assert tracker.requests == 1
+
+
+def test_failed_window_and_idle_gap():
+    tracker = WindowedSLA(SPEC, now=0)
+    tracker.record(5, 50, failed=False)
+    for second in range(60, 80):
+        tracker.record(second, 500, failed=second % 2 == 0)
+
+    # Nothing between 120 and 200: the next window is aligned to the 60 s grid
+    closed = tracker.record(200, 50, failed=False)
+    assert closed['start'] == 60
+    assert closed['failures'] == 10
+    assert closed['violations'] == ["p95 500ms > 100ms", "p99 500ms > 200ms", "errors 50.0% > 5.0%"]
+    assert tracker.start == 180
+
+    last = tracker.close(now=200)
+    assert last['start'] == 180
+    assert last['violations'] == []
+    assert not last['complete']
+    assert tracker.close() is None
+    assert tracker.failed_windows() == [closed]
+
+
+def test_partial_window_is_never_judged():
+    tracker = WindowedSLA(SPEC, now=0)
+    for second in range(30):
+        tracker.record(second, 500, failed=True)
+
+    partial = tracker.close(now=59)
+
+    assert partial['violations']
+    assert tracker.complete_windows() == []
+    assert tracker.failed_windows() == []
+
+
+def test_close_resets_the_window():
+    tracker = WindowedSLA(SPEC, now=0)
+    tracker.record(1, 500, failed=True)
+    tracker.close(now=60)
+
+    tracker.record(61, 50, failed=False)
+    window = tracker.close(now=120)
+
+    assert (window['requests'], window['failures']) == (1, 0)
+    assert window['percentiles'][0.95] < 100
+    assert window['violations'] == []
+
+
+def history_row(timestamp, requests, failures=0, p95=50):
+    return {'timestamp': timestamp, 'total_requests': requests, 'total_failures': failures,
+            'percentiles': {0.95: p95, 0.99: p95}}
+
+
+def test_offline_windows_mark_the_trailing_one_incomplete():
+    rows = [history_row(t, t * 10) for t in range(0, 151, 10)]
+
+    windows = evaluate_sla_windows(rows, SPEC, 0, 150)
+
+    assert [w['start'] for w in windows] == [10, 70, 130]
+    assert [w['complete'] for w in windows] == [True, True, False]
+    assert all(w['requests'] > 0 for w in windows)
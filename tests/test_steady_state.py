@@ -0,0 +1,48 @@
+"""
+Steady-state window detection and plateau stats (analyze_results)
+"""
+from analyze_results import STEADY_STATE_SAMPLES, steady_state_stats, steady_state_window
+
+
+def history(users, rps):
+    """stats_history rows, one per second"""
+    return [{'timestamp': 1000 + i, 'users': u, 'rps': r} for i, (u, r) in enumerate(zip(users, rps))]
+
+
+def test_window_starts_after_ramp_and_warmup():
+    # 5 s ramp to 10 users, 4 s settling at low RPS, then a 100 RPS plateau
+    rows = history([2, 4, 6, 8, 10] + [10] * 24, [10, 20, 30, 40, 50] + [40] * 4 + [100] * 20)
+
+    start, end = steady_state_window(rows)
+
+    assert rows[5]['timestamp'] < start <= rows[9]['timestamp']
+    assert end == rows[-1]['timestamp']
+
+
+def test_unsettled_run_falls_back_to_post_ramp():
+    rows = history([5] + [10] * 19, [10] + [20, 180] * 9 + [100])
+
+    assert steady_state_window(rows) == (rows[1]['timestamp'], rows[-1]['timestamp'])
+
+
+def test_no_window_without_enough_data_or_traffic():
+    assert steady_state_window(history([10] * 3, [100] * 3)) is None
+    assert steady_state_window(history([10] * STEADY_STATE_SAMPLES * 2, [0] * STEADY_STATE_SAMPLES * 2)) is None
+
+
+def test_stats_cover_the_window_only():
+    # Cumulative totals: 100 requests at 50 ms before the window, 300 more at 10 ms within it
+    rows = [
+        {'timestamp': 0, 'total_requests': 0, 'total_failures': 0, 'total_avg_time': 0},
+        {'timestamp': 10, 'total_requests': 100, 'total_failures': 5, 'total_avg_time': 50},
+        {'timestamp': 20, 'total_requests': 250, 'total_failures': 6, 'total_avg_time': 26},
+        {'timestamp': 30, 'total_requests': 400, 'total_failures': 8, 'total_avg_time': 20},
+    ]
+
+    stats = steady_state_stats(rows, 10, 30)
+
+    assert stats['requests'] == 300
+    assert stats['failures'] == 3
+    assert stats['avg_time'] == (400 * 20 - 100 * 50) / 300
+    assert stats['rps'] == 15
+    assert steady_state_stats(rows, 30, 30) is None